@@ -3,7 +3,7 @@ import os
 #from twilio.rest import Client 
 #from vocode import getenv, setenv 
 
-from slingshot_graphs.llm_generator import chat_completion 
+from slingshot_graphs.llm_generator import chat_completion, end_conversation
 from supabase.client import create_async_client, create_client
 
 #from dotenv import load_dotenv
@@ -27,6 +27,7 @@ class AgentConfig(metaclass=Singleton):
         self.base_url = os.getenv("BASE_URL")
 
         self.chat_completion = self.init_chat_completion()
+        self.end_conversation = end_conversation
         self.supabase = self.init_supabase()
         self.supabase_async = None
 
@@ -46,7 +47,8 @@ class AgentConfig(metaclass=Singleton):
         if self.supabase_async:
             return self.supabase_async 
 
-        return await create_async_client(
+        self.supabase_async = await create_async_client(
             "https://ocdajakxsnguxbmkkxhb.supabase.co",
             os.getenv("SUPABASE_AI_AGENT_KEY")
-        )
\ No newline at end of file
+        )
+        return self.supabase_async
\ No newline at end of file
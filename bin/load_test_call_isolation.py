@@ -0,0 +1,113 @@
+"""Runs many concurrent calls through the shared LangGraph graph in one process and checks that
+no call sees another call's language, messages or thread.
+
+The LLM is replaced by a local model that answers "<language of the system prompt> <last human
+message>", so no API keys or network access are needed:
+
+    python bin/load_test_call_isolation.py --calls 50 --turns 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "load-test")
+os.environ.setdefault("SUPABASE_AI_AGENT_KEY", "load-test")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+import slingshot_graphs.default_graph as default_graph
+from call_config import CallConfig, CallState
+
+
+class EchoChatModel(BaseChatModel):
+    """Answers with the system prompt's language and the last human message, word by word."""
+
+    @property
+    def _llm_type(self):
+        return "echo"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _respond(self, messages):
+        language = "kr" if messages[0].content.startswith("슬링샷") else "en"
+        return f"{language} {messages[-1].content}."
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=self._respond(messages)))]
+        )
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for word in self._respond(messages).split(" "):
+            # yield to the other calls between tokens
+            await asyncio.sleep(random.uniform(0, 0.005))
+            yield ChatGenerationChunk(message=AIMessageChunk(content=f"{word} "))
+
+
+async def run_call(call_index, language, turns):
+    """Plays one call the way ChatGPTAgent does and returns a list of problems."""
+    from agent_config import AgentConfig
+
+    call_id = f"call-{call_index}"
+    call_state = CallState(thread_id=str(uuid.uuid4()), language=language)
+    CallConfig().set_call_state(call_state)
+    problems = []
+
+    for turn in range(turns):
+        human_input = f"{call_id} turn-{turn}"
+        first_sentence, stream, _ = await AgentConfig().chat_completion(
+            human_input, call_state.call_metadata
+        )
+        response = " ".join([first_sentence] + [sentence async for sentence in stream])
+        if response != f"{language} {human_input}.":
+            problems.append(
+                f"{call_id}: expected {language!r} reply to {human_input!r}, got {response!r}"
+            )
+        await asyncio.sleep(random.uniform(0, 0.01))
+
+    if CallConfig().language != language:
+        problems.append(f"{call_id}: language changed to {CallConfig().language!r}")
+    messages = call_state.call_metadata.get("current_messages", [])
+    if len(messages) != 2 * turns:
+        problems.append(f"{call_id}: expected {2 * turns} messages, got {len(messages)}")
+    foreign_messages = [
+        message["content"] for message in messages if call_id not in message["content"]
+    ]
+    if foreign_messages:
+        problems.append(f"{call_id}: saw other calls' messages {foreign_messages}")
+    return problems
+
+
+async def main(num_calls, turns):
+    default_graph.get_openai_llm_for_agent = lambda agent_name: EchoChatModel()
+
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *(run_call(i, random.choice(["en", "kr"]), turns) for i in range(num_calls))
+    )
+    elapsed = time.monotonic() - start
+
+    problems = [problem for call_problems in results for problem in call_problems]
+    for problem in problems:
+        print(problem)
+    print(
+        f"{num_calls} concurrent calls x {turns} turns in {elapsed:.2f}s: {len(problems)} problems"
+    )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.calls, args.turns)))
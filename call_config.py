@@ -1,7 +1,11 @@
 import os 
 import uuid 
+from contextvars import ContextVar
+from typing import Optional
 from datetime import datetime, timedelta 
-from vocode.streaming.models.synthesizer import AZURE_SYNTHESIZER_DEFAULT_VOICE_NAME
+from vocode.streaming.models.synthesizer import AZURE_SYNTHESIZER_DEFAULT_VOICE_NAME, AzureSynthesizerConfig
+from vocode.streaming.synthesizer.phrase_bank import PhraseBankConfig
+from vocode.streaming.telephony.constants import DEFAULT_AUDIO_ENCODING, DEFAULT_SAMPLING_RATE
 
 LANGUAGE_CONFIG = {
     "en-in": {
@@ -34,6 +38,39 @@ LANGUAGE_CONFIG = {
     },
 }
 
+SUPPORTED_LANGUAGES = ['en', 'kr']
+
+# spoken when the call is handed off to a live agent
+GOODBYE_MESSAGES = {
+    "en": "A live agent will call you back. Thank you, and goodbye.",
+    "kr": "라이브 상담원이 다시 전화드릴 예정입니다. 이용해 주셔서 감사합니다. 안녕히 계세요.",
+}
+
+# spoken instead of a sentence that leaks a function call
+FALLBACK_MESSAGES = [
+    "Let me check that for you",
+    "I'll need a moment to review this",
+    "Please bear with me while I look into that",
+]
+
+def get_phrase_bank_configs(direction='in'):
+    """Phrases every call is likely to say, per language, to pre-render at server startup."""
+    phrase_bank_configs = []
+    for language, goodbye_message in GOODBYE_MESSAGES.items():
+        language_config = LANGUAGE_CONFIG[f'{language}-{direction}']
+        phrase_bank_configs.append(
+            PhraseBankConfig(
+                synthesizer_config=AzureSynthesizerConfig(
+                    language_code=language_config["synthesizer_language_code"],
+                    voice_name=language_config["synthesizer_voice_name"],
+                    sampling_rate=DEFAULT_SAMPLING_RATE,
+                    audio_encoding=DEFAULT_AUDIO_ENCODING,
+                ),
+                phrases=[language_config["initial_message"], goodbye_message, *FALLBACK_MESSAGES],
+            )
+        )
+    return phrase_bank_configs
+
 class Singleton(type):
     _instances = {}
     
@@ -47,28 +84,67 @@ class Singleton(type):
         cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
     
+class CallState:
+    """Everything that belongs to a single call. Each call's agent sets its own CallState via
+    `CallConfig().set_call_state`, so that concurrent calls in one process don't share state."""
+
+    def __init__(self, thread_id=None, language=None, direction='in'):
+        self.call_metadata = {'thread_id': thread_id or str(uuid.uuid4())}
+        self.test_metadata = {}
+        self.language = language if language in SUPPORTED_LANGUAGES else os.getenv("LANGUAGE", "en")
+        self.language_config = LANGUAGE_CONFIG[f'{self.language}-{direction}']
+
+current_call_state: ContextVar[Optional[CallState]] = ContextVar("current_call_state", default=None)
+
+def get_language_config(direction='in', custom_language=None):
+    """Returns the language config for `custom_language`, or for the default LANGUAGE, without
+    touching any call's state. Also returns the language it resolved to."""
+    language = custom_language.strip() if custom_language else None
+    if language not in SUPPORTED_LANGUAGES:
+        language = os.getenv("LANGUAGE", "en")
+    return LANGUAGE_CONFIG[f'{language}-{direction}'], language
+
 class CallConfig(metaclass=Singleton):
     def __init__(self):
         self.client_name = os.getenv("CLIENT_NAME") or "default"
         self.base_url = os.getenv("BASE_URL")
 
-        self.call_metadata = {'thread_id': str(uuid.uuid4())} 
-        
-        self.test_metadata = {}
-        self.language = os.getenv("LANGUAGE", "en")
-        self.language_config = LANGUAGE_CONFIG[f'{self.language}-in']
-    
+        # used outside of a call, e.g. at startup or by the gradio chat
+        self.default_call_state = CallState()
+
+    @property
+    def call_state(self):
+        return current_call_state.get() or self.default_call_state
+
+    def set_call_state(self, call_state):
+        """Makes `call_state` the current call's state for this task and the tasks it starts."""
+        return current_call_state.set(call_state)
+
+    @property
+    def call_metadata(self):
+        return self.call_state.call_metadata
+
+    @property
+    def test_metadata(self):
+        return self.call_state.test_metadata
+
+    @property
+    def language(self):
+        return self.call_state.language
+
+    @property
+    def language_config(self):
+        return self.call_state.language_config
+
     def set_call_metadata(self, value):
-        self.call_metadata = value 
+        self.call_state.call_metadata = value 
         
     def get_call_metadata(self):
         return self.call_metadata 
     
     def get_language_config(self, direction='in', custom_language=None):
         print(f"get langauge config: direction {direction} and custom lang {custom_language}") 
-        if custom_language and custom_language.strip() in ['en', 'kr']:
-            self.language_config = LANGUAGE_CONFIG[f'{custom_language}-{direction}']
-            self.language = custom_language
+        if custom_language and custom_language.strip() in SUPPORTED_LANGUAGES:
+            self.call_state.language_config, self.call_state.language = get_language_config(direction, custom_language)
 
         return self.language_config
-        
\ No newline at end of file
@@ -1,38 +1,67 @@
+import os
+import socket
 from agent_config import AgentConfig
-from datetime import datetime 
+from datetime import datetime, timedelta
 
-def get_next_customer_from_dialer():
-    supabase = AgentConfig().supabase
+# Leads are leased before they are dialed so that several dialer pods can share one phonebook
+# without calling the same number twice. This needs two extra columns on the table:
+#
+#   alter table phonebook add column leased_by text, add column leased_until timestamp;
+#   create index on phonebook (id) where has_been_called = false;
+#
+# A lease that is never marked as called (e.g. the pod died mid-call) expires after
+# `lease_seconds` and the lead becomes available again.
+DIALER_ID = os.getenv("DIALER_ID") or f"{socket.gethostname()}:{os.getpid()}"
 
-    # TODO: need to use a cache to avoid frequent DB poll
-    try: 
-        next_contact = (
+def _lease_available_filter(now):
+    return f"leased_until.is.null,leased_until.lt.{now}"
+
+async def lease_customers_from_dialer(limit, lease_seconds=600):
+    """Atomically claims up to `limit` uncalled leads for this pod and returns them as
+    (contact_id, phone_number, language) tuples, in phonebook order."""
+    supabase = await AgentConfig().get_or_create_supabase_async()
+    now = datetime.utcnow()
+
+    try:
+        candidates = await (
+            supabase.table("phonebook")
+            .select("id")
+            .eq("has_been_called", False)
+            .or_(_lease_available_filter(now.isoformat()))
+            .order("id")
+            .limit(limit)
+            .execute()
+        )
+        if not candidates.data:
+            return []
+
+        # The update re-checks the lease, so if another pod claimed some of these rows in the
+        # meantime, they are simply not returned here.
+        claimed = await (
             supabase.table("phonebook")
-            .select("id, phone_number, language")
-            .filter("has_been_called", "eq", False)
-            .order("id") 
+            .update({
+                "leased_by": DIALER_ID,
+                "leased_until": (now + timedelta(seconds=lease_seconds)).isoformat(),
+            })
+            .in_("id", [row["id"] for row in candidates.data])
+            .eq("has_been_called", False)
+            .or_(_lease_available_filter(now.isoformat()))
             .execute()
         )
-        print(f"Next contact: {str(next_contact)}")
     except Exception as e:
         print(f"supabase error {e}")
-        return None, None, None
-
-    if next_contact.data:
-        phone_number = next_contact.data[0]['phone_number']
-        language = next_contact.data[0]['language']
-        contact_id = next_contact.data[0]['id']
-        print(f"Next phone number to call: {phone_number} with {language}")
-        return contact_id, phone_number, language
-    else:
-        return None, None, None
-
-def mark_called_customer_from_dialer(contact_id, phone_number):
+        return []
+
+    leads = sorted(claimed.data, key=lambda row: row["id"])
+    print(f"Leased {len(leads)} of {len(candidates.data)} contacts")
+    return [(row["id"], row["phone_number"], row["language"]) for row in leads]
+
+async def mark_called_customer_from_dialer(contact_id, phone_number):
     if not contact_id:
-        return 
-    
-    supabase = AgentConfig().supabase 
+        return
+
+    supabase = await AgentConfig().get_or_create_supabase_async()
     current_datetime = datetime.utcnow().isoformat()
-    
-    supabase.table("phonebook").update({"has_been_called": True, "last_called": current_datetime}).eq("id", contact_id).execute()
-    print(f"Phone number ({phone_number}) with ID ({contact_id}) has been marked as called at {current_datetime}")
\ No newline at end of file
+
+    await supabase.table("phonebook").update({"has_been_called": True, "last_called": current_datetime}).eq("id", contact_id).execute()
+    print(f"Phone number ({phone_number}) with ID ({contact_id}) has been marked as called at {current_datetime}")
@@ -4,6 +4,7 @@ import requests
 import urllib3
 import os
 import asyncio
+from collections import deque
 
 from vocode.streaming.models.agent import ChatGPTAgentConfig
 from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
@@ -21,7 +22,7 @@ from vocode.streaming.telephony.constants import (
 )
 from vocode.streaming.telephony.conversation.outbound_call import OutboundCall
 from vocode.streaming.models.message import BaseMessage
-from call_config import CallConfig
+from call_config import get_language_config
 
 from vocode.streaming.models.synthesizer import (
     AzureSynthesizerConfig,
@@ -32,13 +33,17 @@ from vocode.streaming.models.synthesizer import (
 
 from common import config_manager 
 from customer_dialers.dialers import (
-    get_next_customer_from_dialer,
+    lease_customers_from_dialer,
     mark_called_customer_from_dialer
 )
+from vocode.streaming.utils.metrics import counter, gauge
 
 logger = logging.getLogger(__name__)
 print = logger.info
 
+calls_in_flight = gauge("dialer.calls_in_flight")
+calls_failed = counter("dialer.calls_failed")
+
 
 async def handle_outbound_call(outbound_call, dnis, phone_number, max_call_duration=300):
 
@@ -53,97 +58,142 @@ async def handle_outbound_call(outbound_call, dnis, phone_number, max_call_durat
         print(f"Call started for phone number: {phone_number}")
 
         # Wait for the call to end with a timeout
-        elapsed_time = 0
-        polling_interval = 2 # interval in seconds to check the call status
-        
-        while True:
-            call_status = await outbound_call.config_manager.get_config(conversation_id)
-            if not call_status:
-                try:
-                    print(f"Call ended for phone number: {phone_number}")
-                except Exception as e:
-                    print(f"error in call status {str(e)}")
-                break
-            
-            print(f"Call in progress for phone number: {phone_number}") #, status {str(call_status)}, telephony_id {str(telephony_id)}")
-            await asyncio.sleep(polling_interval)
-            elapsed_time += polling_interval
-            
-            # Check for timeout
-            if elapsed_time >= max_call_duration:
-                print(f"Call exceeded maximum duration for phone number: {phone_number}")
-                break
-        
-        print(f"Call ended for phone number {phone_number}")
+        if await outbound_call.wait_for_end(timeout=max_call_duration):
+            print(f"Call ended for phone number: {phone_number}")
+        else:
+            print(f"Call exceeded maximum duration for phone number: {phone_number}")
 
         # Post-call processing
         if conversation_id:
             await config_manager.delete_config(conversation_id)
-        await asyncio.sleep(2)
 
     except Exception as e:
         print(f"Error handling outbound call: {e}")
         raise e
 
+DEFAULT_MAX_CONCURRENT_CALLS = 4
+DEFAULT_CALLS_PER_SECOND = 1.0
+DEFAULT_LEASE_SECONDS = 600
+
+class CallPacer:
+    """Spaces out call starts so that at most `calls_per_second` calls start per second."""
+
+    def __init__(self, calls_per_second):
+        self.interval = 1 / calls_per_second if calls_per_second > 0 else 0
+        self.next_slot = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+class ThroughputMeter:
+    """Tracks calls started by this pod over a sliding window, reported as calls per minute."""
+
+    def __init__(self, window_seconds=60):
+        self.window_seconds = window_seconds
+        self.call_starts = deque()
+        self.calls_started = counter("dialer.calls_started")
+        self.calls_per_minute_gauge = gauge("dialer.calls_per_minute")
+
+    def record_call_start(self):
+        self.call_starts.append(time.monotonic())
+        self.calls_started.inc()
+        self.calls_per_minute()
+
+    def calls_per_minute(self):
+        window_start = time.monotonic() - self.window_seconds
+        while self.call_starts and self.call_starts[0] < window_start:
+            self.call_starts.popleft()
+        calls_per_minute = len(self.call_starts) * 60 / self.window_seconds
+        self.calls_per_minute_gauge.set(calls_per_minute)
+        return calls_per_minute
+
+def create_outbound_call(base_url, dnis, phone_number, custom_language):
+    language_config, language = get_language_config(direction="out", custom_language=custom_language)
+    print(f"Language config {str(language_config)}")
+    return OutboundCall(
+        base_url=base_url,
+        to_phone=phone_number,
+        from_phone=dnis,
+        transcriber_config=DeepgramTranscriberConfig(
+            language=language_config["transcriber_language"],
+            model='nova-2',
+            sampling_rate=DEFAULT_SAMPLING_RATE,
+            audio_encoding=DEFAULT_AUDIO_ENCODING,
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            endpointing_config=PunctuationEndpointingConfig(),
+        ),
+        synthesizer_config=AzureSynthesizerConfig(
+            language_code=language_config["synthesizer_language_code"], 
+            voice_name=language_config["synthesizer_voice_name"], 
+            sampling_rate=DEFAULT_SAMPLING_RATE,
+            audio_encoding=DEFAULT_AUDIO_ENCODING,
+        ),
+        config_manager=config_manager,
+        agent_config=ChatGPTAgentConfig(
+            initial_message=BaseMessage(text=language_config["initial_message"]), 
+            prompt_preamble=language_config["prompt_preamble"], 
+            language=language,
+            generate_responses=True,
+            interrupt_sensitivity="high",
+            initial_message_delay=2,
+        ),
+        telephony_config=TwilioConfig(
+            account_sid=os.environ["TWILIO_ACCOUNT_SID"],
+            auth_token=os.environ["TWILIO_AUTH_TOKEN"],
+        ),
+    )
+
+async def dial_customer(base_url, dnis, contact_id, phone_number, custom_language, throughput_meter):
+    print(f"next customer to call {phone_number} with language {custom_language}")
+    outbound_call = create_outbound_call(base_url, dnis, phone_number, custom_language)
+    throughput_meter.record_call_start()
+    try:
+        await handle_outbound_call(outbound_call, dnis, phone_number)
+        print(f"Call to {phone_number} finished.")
+    except Exception as e:
+        # the lead stays leased, so it is retried once the lease expires
+        calls_failed.inc()
+        print(f"Error during call to {phone_number}: {e}")
+        return
+    await mark_called_customer_from_dialer(contact_id, phone_number)
+
 async def dials(base_url=None, call_type=None, client_name=None, language=None, campaign_id=None):
+    """Keeps up to DIALER_MAX_CONCURRENT_CALLS calls in flight, starting at most
+    DIALER_CALLS_PER_SECOND new calls per second. Leads are leased in batches sized to the free
+    call slots, so a pod never holds more leads than it can dial."""
     dnis = "+16508440652"
-    count = 0
+    max_concurrent_calls = int(os.getenv("DIALER_MAX_CONCURRENT_CALLS", DEFAULT_MAX_CONCURRENT_CALLS))
+    lease_seconds = int(os.getenv("DIALER_LEASE_SECONDS", DEFAULT_LEASE_SECONDS))
+    pacer = CallPacer(float(os.getenv("DIALER_CALLS_PER_SECOND", DEFAULT_CALLS_PER_SECOND)))
+    throughput_meter = ThroughputMeter()
+    in_flight = set()
 
-    while True:
-
-        # Get customer phone number from Dial Controller
-        contact_id, phone_number, custom_language = get_next_customer_from_dialer()
-        print(f"next customer to call {phone_number} with language {custom_language}")
-        if phone_number is None:
-            await asyncio.sleep(5)
-            continue
-        
-        language_config = CallConfig().get_language_config(direction="out", custom_language=custom_language)
-        print(f"Language config {str(language_config)}")
-        # make a call
-        outbound_call = OutboundCall(
-            base_url=base_url,
-            to_phone=phone_number,
-            from_phone=dnis,
-            transcriber_config=DeepgramTranscriberConfig(
-                language=language_config["transcriber_language"],
-                model='nova-2',
-                sampling_rate=DEFAULT_SAMPLING_RATE,
-                audio_encoding=DEFAULT_AUDIO_ENCODING,
-                chunk_size=DEFAULT_CHUNK_SIZE,
-                endpointing_config=PunctuationEndpointingConfig(),
-            ),
-            synthesizer_config=AzureSynthesizerConfig(
-                language_code=language_config["synthesizer_language_code"], 
-                voice_name=language_config["synthesizer_voice_name"], 
-                sampling_rate=DEFAULT_SAMPLING_RATE,
-                audio_encoding=DEFAULT_AUDIO_ENCODING,
-            ),
-            config_manager=config_manager,
-            agent_config=ChatGPTAgentConfig(
-                initial_message=BaseMessage(text=language_config["initial_message"]), 
-                prompt_preamble=language_config["prompt_preamble"], 
-                generate_responses=True,
-                interrupt_sensitivity="high",
-                initial_message_delay=2,
-            ),
-            telephony_config=TwilioConfig(
-                account_sid=os.environ["TWILIO_ACCOUNT_SID"],
-                auth_token=os.environ["TWILIO_AUTH_TOKEN"],
-            ),
-        )
-
-        try:
-            # Wait until the current call is fully handled
-            await handle_outbound_call(outbound_call, dnis, phone_number)
-            print(f"Call #{count} to {phone_number} finished.")
-        except Exception as e:
-            print(f"Error during call #{count}: {e}")
-            break
-        
-        # Optionally, delay before the next call
-        mark_called_customer_from_dialer(contact_id, phone_number)
-        await asyncio.sleep(5)
-        #break # for now. 
-
-    print("Dialer finished!")
\ No newline at end of file
+    try:
+        while True:
+            calls_in_flight.set(len(in_flight))
+            free_slots = max_concurrent_calls - len(in_flight)
+            if free_slots == 0:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            leads = await lease_customers_from_dialer(limit=free_slots, lease_seconds=lease_seconds)
+            print(f"{len(in_flight)} calls in flight, {throughput_meter.calls_per_minute():.1f} calls/minute")
+            if not leads:
+                await asyncio.sleep(5)
+                continue
+
+            for contact_id, phone_number, custom_language in leads:
+                await pacer.wait()
+                task = asyncio.create_task(
+                    dial_customer(base_url, dnis, contact_id, phone_number, custom_language, throughput_meter)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+    finally:
+        # let the calls that are already up finish
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        calls_in_flight.set(0)
+        print("Dialer finished!")
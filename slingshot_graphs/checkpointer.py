@@ -0,0 +1,340 @@
+import os
+from collections import OrderedDict, defaultdict
+
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from vocode.streaming.utils.metrics import counter, gauge
+from vocode.streaming.utils.redis import initialize_redis_bytes
+
+# the graph only ever resumes from the latest checkpoint, older ones are just history
+DEFAULT_MAX_CHECKPOINTS_PER_THREAD = 4
+# threads that are never ended (e.g. the pod missed a call's termination) are evicted LRU
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_REDIS_TTL_SECONDS = 60 * 60 * 24
+
+checkpoints_trimmed = counter("graph_checkpointer.checkpoints_trimmed")
+threads_deleted = counter("graph_checkpointer.threads_deleted")
+
+
+def create_checkpointer():
+    """GRAPH_CHECKPOINTER=redis keeps graph state in Redis so it survives pod restarts,
+    anything else keeps it in process memory."""
+    if os.getenv("GRAPH_CHECKPOINTER", "memory") == "redis":
+        return RedisSaver()
+    return BoundedMemorySaver()
+
+
+class BoundedMemorySaver(MemorySaver):
+    """MemorySaver that keeps at most `max_checkpoints_per_thread` checkpoints per thread and
+    namespace, at most `max_threads` threads, and frees a thread's state when it is deleted."""
+
+    def __init__(self, max_checkpoints_per_thread=None, max_threads=None):
+        super().__init__()
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread or int(
+            os.getenv("GRAPH_MAX_CHECKPOINTS_PER_THREAD", DEFAULT_MAX_CHECKPOINTS_PER_THREAD)
+        )
+        self.max_threads = max_threads or int(os.getenv("GRAPH_MAX_THREADS", DEFAULT_MAX_THREADS))
+        # (thread ID, checkpoint NS, checkpoint ID) -> channel versions the checkpoint points to
+        self.checkpoint_versions = {}
+        # thread ID -> keys of self.blobs, so a thread can be freed without scanning every blob
+        self.thread_blob_keys = defaultdict(set)
+        self.recent_threads = OrderedDict()
+        self.threads_gauge = gauge("graph_checkpointer.threads")
+        self.checkpoints_gauge = gauge("graph_checkpointer.checkpoints")
+        self.bytes_gauge = gauge("graph_checkpointer.bytes")
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        self.checkpoint_versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+            checkpoint["channel_versions"]
+        )
+        for channel, version in new_versions.items():
+            self.thread_blob_keys[thread_id].add((thread_id, checkpoint_ns, channel, version))
+        self._compact(thread_id, checkpoint_ns)
+
+        self.recent_threads[thread_id] = None
+        self.recent_threads.move_to_end(thread_id)
+        while len(self.recent_threads) > self.max_threads:
+            self.delete_thread(next(iter(self.recent_threads)))
+        return next_config
+
+    def _compact(self, thread_id, checkpoint_ns):
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.max_checkpoints_per_thread:
+            return
+        for checkpoint_id in sorted(checkpoints)[: -self.max_checkpoints_per_thread]:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            self.checkpoint_versions.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            checkpoints_trimmed.inc()
+
+        # drop channel values that none of the remaining checkpoints point to
+        referenced_blob_keys = {
+            (thread_id, checkpoint_ns, channel, version)
+            for checkpoint_id in checkpoints
+            for channel, version in self.checkpoint_versions.get(
+                (thread_id, checkpoint_ns, checkpoint_id), {}
+            ).items()
+        }
+        blob_keys = self.thread_blob_keys[thread_id]
+        for blob_key in [
+            key for key in blob_keys if key[1] == checkpoint_ns and key not in referenced_blob_keys
+        ]:
+            self.blobs.pop(blob_key, None)
+            blob_keys.discard(blob_key)
+
+    def delete_thread(self, thread_id):
+        for checkpoint_ns, checkpoints in self.storage.pop(thread_id, {}).items():
+            for checkpoint_id in checkpoints:
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                self.checkpoint_versions.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+        for blob_key in self.thread_blob_keys.pop(thread_id, ()):
+            self.blobs.pop(blob_key, None)
+        if self.recent_threads.pop(thread_id, False) is None:
+            threads_deleted.inc()
+
+    async def adelete_thread(self, thread_id):
+        self.delete_thread(thread_id)
+
+    def memory_stats(self):
+        """Counts and serialized sizes of everything held, also reported as gauges."""
+        num_checkpoints = 0
+        checkpoint_bytes = 0
+        for namespaces in self.storage.values():
+            for checkpoints in namespaces.values():
+                num_checkpoints += len(checkpoints)
+                for checkpoint, metadata, _ in checkpoints.values():
+                    checkpoint_bytes += len(checkpoint[1]) + len(metadata[1])
+        blob_bytes = sum(len(blob[1]) for blob in self.blobs.values())
+        write_bytes = sum(
+            len(write[2][1]) for writes in self.writes.values() for write in writes.values()
+        )
+        stats = {
+            "threads": len(self.recent_threads),
+            "checkpoints": num_checkpoints,
+            "blobs": len(self.blobs),
+            "bytes": checkpoint_bytes + blob_bytes + write_bytes,
+        }
+        self.threads_gauge.set(stats["threads"])
+        self.checkpoints_gauge.set(stats["checkpoints"])
+        self.bytes_gauge.set(stats["bytes"])
+        return stats
+
+
+class RedisSaver(BaseCheckpointSaver):
+    """Async checkpointer that keeps graph state in Redis. It is async-only: run the graph with
+    `ainvoke`/`astream`, the sync APIs raise NotImplementedError.
+
+    Each checkpoint is stored whole, with its channel values, in one hash per thread and
+    namespace; pending writes go in one hash per checkpoint. Only the latest
+    `max_checkpoints_per_thread` checkpoints are kept, and every key expires `ttl_seconds` after
+    the thread was last written to.
+    """
+
+    def __init__(self, max_checkpoints_per_thread=None, ttl_seconds=None):
+        super().__init__()
+        self.redis = initialize_redis_bytes()
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread or int(
+            os.getenv("GRAPH_MAX_CHECKPOINTS_PER_THREAD", DEFAULT_MAX_CHECKPOINTS_PER_THREAD)
+        )
+        self.ttl_seconds = ttl_seconds or int(
+            os.getenv("GRAPH_CHECKPOINT_TTL_SECONDS", DEFAULT_REDIS_TTL_SECONDS)
+        )
+        self.bytes_written = counter("graph_checkpointer.redis.bytes_written")
+
+    @staticmethod
+    def _checkpoints_key(thread_id, checkpoint_ns):
+        return f"graph_checkpoints:{thread_id}:{checkpoint_ns}"
+
+    @staticmethod
+    def _writes_key(thread_id, checkpoint_ns, checkpoint_id):
+        return f"graph_writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    @staticmethod
+    def _namespaces_key(thread_id):
+        return f"graph_checkpoint_namespaces:{thread_id}"
+
+    def _dumps(self, obj):
+        type_, data = self.serde.dumps_typed(obj)
+        return type_.encode() + b"\0" + data
+
+    def _loads(self, raw):
+        type_, data = raw.split(b"\0", 1)
+        return self.serde.loads_typed((type_.decode(), data))
+
+    def _to_checkpoint_tuple(self, thread_id, checkpoint_ns, checkpoint_id, raw_record, raw_writes):
+        checkpoint, metadata, parent_checkpoint_id = self._loads(raw_record)
+        pending_writes = [
+            (task_id, channel, value)
+            for task_id, channel, value, _ in (
+                self._loads(raw_write) for _, raw_write in sorted(raw_writes.items())
+            )
+        ]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=metadata,
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=pending_writes,
+        )
+
+    async def aget_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoints_key = self._checkpoints_key(thread_id, checkpoint_ns)
+        checkpoint_id = get_checkpoint_id(config)
+        if not checkpoint_id:
+            checkpoint_ids = await self.redis.hkeys(checkpoints_key)
+            if not checkpoint_ids:
+                return None
+            checkpoint_id = max(checkpoint_ids).decode()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hget(checkpoints_key, checkpoint_id)
+            pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+            raw_record, raw_writes = await pipe.execute()
+        if raw_record is None:
+            return None
+        return self._to_checkpoint_tuple(
+            thread_id, checkpoint_ns, checkpoint_id, raw_record, raw_writes
+        )
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        if config is None:
+            raise ValueError("RedisSaver can only list the checkpoints of a given thread")
+        thread_id = config["configurable"]["thread_id"]
+        config_checkpoint_ns = config["configurable"].get("checkpoint_ns")
+        config_checkpoint_id = get_checkpoint_id(config)
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        if config_checkpoint_ns is not None:
+            checkpoint_namespaces = [config_checkpoint_ns]
+        else:
+            checkpoint_namespaces = [
+                checkpoint_ns.decode()
+                for checkpoint_ns in await self.redis.smembers(self._namespaces_key(thread_id))
+            ]
+
+        for checkpoint_ns in checkpoint_namespaces:
+            raw_records = await self.redis.hgetall(self._checkpoints_key(thread_id, checkpoint_ns))
+            for raw_checkpoint_id, raw_record in sorted(raw_records.items(), reverse=True):
+                checkpoint_id = raw_checkpoint_id.decode()
+                if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
+                    continue
+                if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
+                    continue
+                raw_writes = await self.redis.hgetall(
+                    self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+                )
+                checkpoint_tuple = self._to_checkpoint_tuple(
+                    thread_id, checkpoint_ns, checkpoint_id, raw_record, raw_writes
+                )
+                if filter and not all(
+                    checkpoint_tuple.metadata.get(key) == value for key, value in filter.items()
+                ):
+                    continue
+                if limit is not None:
+                    if limit <= 0:
+                        return
+                    limit -= 1
+                yield checkpoint_tuple
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoints_key = self._checkpoints_key(thread_id, checkpoint_ns)
+        namespaces_key = self._namespaces_key(thread_id)
+        record = self._dumps(
+            (
+                checkpoint,
+                get_checkpoint_metadata(config, metadata),
+                config["configurable"].get("checkpoint_id"),
+            )
+        )
+        self.bytes_written.inc(len(record))
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(checkpoints_key, checkpoint["id"], record)
+            pipe.expire(checkpoints_key, self.ttl_seconds)
+            pipe.sadd(namespaces_key, checkpoint_ns)
+            pipe.expire(namespaces_key, self.ttl_seconds)
+            pipe.hkeys(checkpoints_key)
+            *_, checkpoint_ids = await pipe.execute()
+
+        if len(checkpoint_ids) > self.max_checkpoints_per_thread:
+            old_checkpoint_ids = sorted(checkpoint_ids)[: -self.max_checkpoints_per_thread]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hdel(checkpoints_key, *old_checkpoint_ids)
+                pipe.delete(
+                    *(
+                        self._writes_key(thread_id, checkpoint_ns, checkpoint_id.decode())
+                        for checkpoint_id in old_checkpoint_ids
+                    )
+                )
+                await pipe.execute()
+            checkpoints_trimmed.inc(len(old_checkpoint_ids))
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        writes_key = self._writes_key(
+            thread_id, checkpoint_ns, config["configurable"]["checkpoint_id"]
+        )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                field = f"{task_id}:{write_idx}"
+                raw_write = self._dumps((task_id, channel, value, task_path))
+                # like MemorySaver, special writes overwrite and regular ones are kept once
+                if write_idx < 0:
+                    pipe.hset(writes_key, field, raw_write)
+                else:
+                    pipe.hsetnx(writes_key, field, raw_write)
+            pipe.expire(writes_key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def adelete_thread(self, thread_id):
+        namespaces_key = self._namespaces_key(thread_id)
+        keys = [namespaces_key]
+        for raw_checkpoint_ns in await self.redis.smembers(namespaces_key):
+            checkpoint_ns = raw_checkpoint_ns.decode()
+            checkpoints_key = self._checkpoints_key(thread_id, checkpoint_ns)
+            keys.append(checkpoints_key)
+            keys.extend(
+                self._writes_key(thread_id, checkpoint_ns, checkpoint_id.decode())
+                for checkpoint_id in await self.redis.hkeys(checkpoints_key)
+            )
+        await self.redis.delete(*keys)
+        threads_deleted.inc()
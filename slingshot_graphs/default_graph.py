@@ -27,6 +27,7 @@ from langgraph.prebuilt import ToolNode, tools_condition
 from call_config import CallConfig
 from langchain.pydantic_v1 import BaseModel, Field
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
 from langchain_core.messages import AIMessage
 
 # Route models
@@ -161,29 +162,41 @@ def get_make_payment_tools():
 
 
 # prompts
+def get_prompt_for_call_language(default_prompt, kr_prompt):
+    """The graph is shared by every call in the process, so the prompt is picked per invocation
+    from the current call's language rather than when the graph is built."""
+    prompts = {
+        language: ChatPromptTemplate.from_messages(
+            [
+                ("system", prompt),
+                MessagesPlaceholder(variable_name="messages")
+            ]
+        )
+        for language, prompt in (("en", default_prompt), ("kr", kr_prompt))
+    }
+
+    def get_prompt():
+        return prompts['en'] if CallConfig().language == 'en' else prompts['kr']
+
+    def get_prompt_value(state, config, **kwargs):
+        return get_prompt().invoke(state, config)
+
+    async def aget_prompt_value(state, config, **kwargs):
+        return await get_prompt().ainvoke(state, config)
+
+    return RunnableLambda(get_prompt_value, afunc=aget_prompt_value)
+
 def get_primary_assistant_prompt():
     default_prompt = "You are Slingshot, a virtual assistant for Slingshot Financial.  You MUST use the provided tools to route the customers to the appropriate specialist to make payments."
     kr_prompt = """슬링샷 금융을 위한 가상 비서 슬링샷입니다. 고객이 적절한 전문가에게 연결될 수 있도록 제공된 도구를 반드시 사용해야 합니다. 고객이 돈을 내겠다는 요구를 하면, ToMakePaymentAssistant 를 사용하십시오. 실제 에이전트와 통화를 하고 싶다고 한다면, transfert_to_live_agent 를 사용하십시오"""
 
-    primary_assistant_prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", default_prompt if CallConfig().language == 'en' else kr_prompt),
-            MessagesPlaceholder(variable_name="messages")
-        ]
-    )
-    return primary_assistant_prompt
+    return get_prompt_for_call_language(default_prompt, kr_prompt)
 
 def get_make_payment_prompt():
     default_prompt = f"""You are Slingshot, a virtual assistant for Slingshot Financial.  You MUST use the provided tools to route the customers to the appropriate specialist to make payments. Your main task is to help customers make payments or note promises to pay. Always maintain a professional tone and stay focussed on the task at hand. Do not discuss any issues outside of the customer's loan with Slingshot Financial. If the customer has not specified a particular date or circumstance [e.g. I need a late payment, schedule a payment, or I need some more time], offer to pay the total due amount first: \"Would you like to pay the total of $300 today?\". If they have mentioned a particular condition, work with the customer to set a payment date and amount. You MUST call validate_payment_amount_date tool once you have a payment date and amount. Schedule only one payment at a time. Use CompleteOrEscalate if the customer wants to do anything else other than make a one-time payment. Be empathetic and patient throughout"""
     kr_prompt = f"""슬링샷 금융을 위한 가상 비서 슬링샷입니다. 고객이 적절한 전문가에게 연결될 수 있도록 제공된 도구를 반드시 사용해야 합니다. 주요 업무는 고객이 결제를 진행하거나 결제 약속을 기록하도록 돕는 것입니다. 항상 전문적인 어조를 유지하며, 주어진 업무에 집중해야 합니다. 슬링샷 금융과 관련된 대출 이외의 문제에 대해 논의하지 마십시오. 고객이 특정 날짜나 상황을 명시하지 않은 경우 [예: 연체 결제 요청, 결제 일정 예약, 시간이 더 필요함], 우선 총 납부 금액 결제를 제안하십시오. 예: "오늘 총 10만원을 결제하시겠습니까?" 고객이 특정 조건을 언급한 경우, 고객과 협력하여 결제 날짜와 금액을 설정하십시오.  결제 날짜와 금액을 확인한 후 반드시 validate_payment_amount_date 도구를 호출해야 합니다. 한 번에 하나의 결제만 예약하십시오. 고객이 일회성 결제 이외의 다른 요청을 하는 경우, CompleteOrEscalate를 사용하십시오. 항상 공감하고 인내심을 갖고 대응하십시오."""
 
-    make_payment_prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", default_prompt if CallConfig().language == 'en' else kr_prompt),
-            MessagesPlaceholder(variable_name="messages")
-        ]
-    )
-    return make_payment_prompt
+    return get_prompt_for_call_language(default_prompt, kr_prompt)
 
 # runnables
 def get_primary_assistant_runnable(model=None, prompt=None):
@@ -11,8 +11,8 @@ from langchain_core.messages import (
 )
 
 from call_config import CallConfig
-from langgraph.checkpoint.memory import MemorySaver
 
+from slingshot_graphs.checkpointer import BoundedMemorySaver, create_checkpointer
 from slingshot_graphs.default_graph import DefaultGraph
 
 class GraphManager:
@@ -28,7 +28,7 @@ class GraphManager:
     
     def _initialize_graph(self):
         if self._memory is None:
-            self._memory = MemorySaver()
+            self._memory = create_checkpointer()
 
         graph_config = {
             "default": DefaultGraph
@@ -49,4 +49,10 @@ class GraphManager:
         if clear_memory:
             self._memory = None 
         self._initialize_graph()
-        print("Graph has been reinitialized")
\ No newline at end of file
+        print("Graph has been reinitialized")
+
+    async def end_thread(self, thread_id):
+        """Frees a finished conversation's checkpoints."""
+        await self._memory.adelete_thread(thread_id)
+        if isinstance(self._memory, BoundedMemorySaver):
+            print(f"Graph checkpointer after ending thread {thread_id}: {self._memory.memory_stats()}")
@@ -1,7 +1,7 @@
 import asyncio 
 import os 
 from typing import Annotated, Optional, TypedDict, Callable
-from call_config import CallConfig
+from call_config import CallConfig, GOODBYE_MESSAGES
 from langgraph.graph.message import add_messages
 from langchain_core.messages.utils import convert_to_openai_messages
 from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
@@ -18,6 +18,7 @@ from langchain_core.messages.tool import ToolCall, tool_call
 from langgraph.prebuilt import ToolNode, tools_condition
 import uuid
 from langchain_openai import ChatOpenAI
+from vocode.streaming.utils.llm_clients import OPENAI_DEFAULT_BASE_URL, LLMClientRegistry
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
@@ -197,6 +198,8 @@ def get_openai_llm_for_agent(agent_name):
             temperature=0,
             streaming=True,
             max_retries=5,
+            # share the process-wide connection pool instead of one per agent
+            http_async_client=LLMClientRegistry().get_http_client(OPENAI_DEFAULT_BASE_URL),
         )
     print(f"Using model={model_name} for agent={agent_name}")
 
@@ -253,4 +256,4 @@ async def route_sensitive_tools(
     return get_last_dialog_state(state)
 
 def get_live_agent_string():
-    return """A live agent will call you back. Thank you, and goodbye.""" if CallConfig().language == 'en' else """라이브 상담원이 다시 전화드릴 예정입니다. 이용해 주셔서 감사합니다. 안녕히 계세요."""
\ No newline at end of file
+    return GOODBYE_MESSAGES['en'] if CallConfig().language == 'en' else GOODBYE_MESSAGES['kr']
\ No newline at end of file
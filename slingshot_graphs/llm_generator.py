@@ -1,12 +1,9 @@
 from slingshot_graphs.graph_factory import GraphManager
-from call_config import CallConfig
+from call_config import CallConfig, FALLBACK_MESSAGES
 from langchain_core.messages import HumanMessage
-import re
+from vocode.streaming.utils.sentence_segmenter import SentenceSegmenter
 import random
 
-# global variables
-pattern = re.compile(r"(?<!\d)([.!?])\s*(?=[A-Z]|$)")
-
 def remove_functions_from_output(response, replace_list):
     if "functions." in response or "escalate_to_human" in response:
         response = random.choice(replace_list)
@@ -27,12 +24,8 @@ async def chat_completion(user_response, call_metadata):
     config = {"configurable": {"thread_id": thread_id}}
 
     async def async_generator():
-        buffer = ""
-        list_of_words = [
-            "Let me check that for you",
-            "I'll need a moment to review this",
-            "Please bear with me while I look into that",
-        ]
+        segmenter = SentenceSegmenter()
+        list_of_words = list(FALLBACK_MESSAGES)
         try:
             async for event in graph_manager.graph.astream_events({"messages": inputs}, config, version="v1"):
                 kind = event["event"]
@@ -60,24 +53,13 @@ async def chat_completion(user_response, call_metadata):
                             if content[0].get("type") != "text":
                                 continue 
                             content = content[0]["text"]
-                        buffer += content 
-                        
-                        while True: 
-                            match = re.search(pattern, buffer)
-                            if not match or "$" in buffer:
-                                break
-
-                            buffer, list_of_words = remove_functions_from_output(buffer, list_of_words)
-                            
-                            end_idx = match.end()
-                            sentence = buffer[:end_idx]
-                            buffer = buffer[end_idx:]
-                            
-                            buffer = buffer.replace("DETERMINISTIC", "").strip()
-
-                            print(f"About to yield buffer: {sentence}")
+                        # only the new text is scanned, so each token costs O(len(token))
+                        for sentence in segmenter.feed(content):
+                            sentence, list_of_words = remove_functions_from_output(sentence, list_of_words)
                             sentence = sentence.replace("DETERMINISTIC", "").strip()
-                            yield sentence
+                            if sentence:
+                                print(f"About to yield buffer: {sentence}")
+                                yield sentence
 
                 elif kind == "on_tool_end":
                     content = event.get("data", {}).get("output", [])
@@ -91,13 +73,14 @@ async def chat_completion(user_response, call_metadata):
                         if "sensitive_action" in item:
                             yield item["sensitive_action"]["messages"].content.replace("DETERMINISTIC", "")
                             return
-            if buffer.strip():
+            buffer = segmenter.flush()
+            if buffer:
                 print(f"About to yield buffer 2: {buffer}")
                 buffer, list_of_words = remove_functions_from_output(
                     buffer, list_of_words
                 )
                 # TODO: remove tools..
-                yield buffer.strip() 
+                yield buffer.replace("DETERMINISTIC", "").strip()
                 
         except Exception as e:
             pass
@@ -106,4 +89,9 @@ async def chat_completion(user_response, call_metadata):
     
     first_sentence = await anext(iterator)
     
-    return first_sentence, iterator, ""
\ No newline at end of file
+    return first_sentence, iterator, ""
+
+async def end_conversation(call_metadata):
+    thread_id = call_metadata.get("thread_id")
+    if thread_id:
+        await GraphManager().end_thread(thread_id)
@@ -35,7 +35,7 @@ from vocode.streaming.models.synthesizer import (
     AZURE_SYNTHESIZER_DEFAULT_RATE, 
 )
 from common import get_secret
-from call_config import CallConfig
+from call_config import CallConfig, get_phrase_bank_configs
 
 # if running from python, this will load the local .env
 # docker-compose will load the .env file by itself
@@ -78,6 +78,7 @@ telephony_server = TelephonyServer(
             agent_config=ChatGPTAgentConfig(
                 initial_message=BaseMessage(text=language_config["initial_message"]), 
                 prompt_preamble=language_config["prompt_preamble"], 
+                language=CallConfig().language,
                 generate_responses=True,
                 interrupt_sensitivity="high",
                 initial_message_delay=2,
@@ -110,6 +111,7 @@ telephony_server = TelephonyServer(
         )
     ],
     agent_factory=SpellerAgentFactory(),
+    phrase_bank_configs=get_phrase_bank_configs(direction='in'),
 )
 
 app.include_router(telephony_server.get_router())
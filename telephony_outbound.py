@@ -24,6 +24,7 @@ from vocode.streaming.models.transcriber import DeepgramTranscriberConfig
 from vocode.streaming.models.events import Event
 from vocode.streaming.utils import events_manager
 from common import config_manager, get_secret
+from call_config import get_phrase_bank_configs
 
 # customer dial client
 from customer_dialers.make_call import dials as make_dials
@@ -77,6 +78,7 @@ telephony_server = TelephonyServer(
     config_manager=config_manager,
     #logger=logger,
     events_manager=events_manager_instance,
+    phrase_bank_configs=get_phrase_bank_configs(direction='out'),
 )
 
 app.include_router(telephony_server.get_router())
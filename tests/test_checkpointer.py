@@ -0,0 +1,138 @@
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from langgraph.graph import END, START, StateGraph
+from pytest_mock import MockerFixture
+
+from slingshot_graphs.checkpointer import BoundedMemorySaver, RedisSaver
+
+
+class CounterState(TypedDict):
+    turns: Annotated[list, operator.add]
+
+
+def build_graph(checkpointer):
+    graph_builder = StateGraph(CounterState)
+    graph_builder.add_node("respond", lambda state: {"turns": [len(state["turns"])]})
+    graph_builder.add_edge(START, "respond")
+    graph_builder.add_edge("respond", END)
+    return graph_builder.compile(checkpointer=checkpointer)
+
+
+def thread_config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_graph_resumes_after_checkpoints_are_trimmed():
+    checkpointer = BoundedMemorySaver(max_checkpoints_per_thread=2)
+    graph = build_graph(checkpointer)
+    for _ in range(5):
+        state = graph.invoke({"turns": []}, thread_config("thread"))
+
+    assert state["turns"] == [0, 1, 2, 3, 4]
+    assert graph.get_state(thread_config("thread")).values["turns"] == [0, 1, 2, 3, 4]
+    assert len(checkpointer.storage["thread"][""]) == 2
+    assert len(list(checkpointer.list(thread_config("thread")))) == 2
+
+
+def test_blobs_of_trimmed_checkpoints_are_freed():
+    checkpointer = BoundedMemorySaver(max_checkpoints_per_thread=2)
+    graph = build_graph(checkpointer)
+    graph.invoke({"turns": []}, thread_config("thread"))
+    first_turn_bytes = checkpointer.memory_stats()["bytes"]
+    for _ in range(20):
+        graph.invoke({"turns": []}, thread_config("thread"))
+
+    referenced_blob_keys = {
+        ("thread", "", channel, version)
+        for checkpoint_id in checkpointer.storage["thread"][""]
+        for channel, version in checkpointer.checkpoint_versions[
+            ("thread", "", checkpoint_id)
+        ].items()
+    }
+    assert set(checkpointer.blobs) == referenced_blob_keys
+    assert checkpointer.thread_blob_keys["thread"] == referenced_blob_keys
+    assert len(checkpointer.checkpoint_versions) == 2
+    assert all(key[2] in checkpointer.storage["thread"][""] for key in checkpointer.writes)
+    # the state grows by one turn per invocation, the dropped history doesn't add up
+    assert checkpointer.memory_stats()["bytes"] < 10 * first_turn_bytes
+
+
+def test_threads_are_evicted_lru():
+    checkpointer = BoundedMemorySaver(max_threads=2)
+    graph = build_graph(checkpointer)
+    graph.invoke({"turns": []}, thread_config("first"))
+    graph.invoke({"turns": []}, thread_config("second"))
+    graph.invoke({"turns": []}, thread_config("first"))  # first is now the most recently used
+    graph.invoke({"turns": []}, thread_config("third"))
+
+    assert list(checkpointer.recent_threads) == ["first", "third"]
+    assert set(checkpointer.storage) == {"first", "third"}
+    assert {key[0] for key in checkpointer.blobs} == {"first", "third"}
+    assert checkpointer.memory_stats()["threads"] == 2
+    assert graph.get_state(thread_config("second")).values == {}
+    assert graph.get_state(thread_config("first")).values["turns"] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_memory_adelete_thread_frees_everything():
+    checkpointer = BoundedMemorySaver()
+    graph = build_graph(checkpointer)
+    for _ in range(3):
+        await graph.ainvoke({"turns": []}, thread_config("thread"))
+
+    await checkpointer.adelete_thread("thread")
+
+    assert not checkpointer.storage.get("thread")
+    assert not checkpointer.writes
+    assert not checkpointer.blobs
+    assert not checkpointer.checkpoint_versions
+    assert not checkpointer.thread_blob_keys
+    assert not checkpointer.recent_threads
+    assert checkpointer.memory_stats() == {"threads": 0, "checkpoints": 0, "blobs": 0, "bytes": 0}
+
+
+@pytest.fixture
+def fake_redis(mocker: MockerFixture):
+    fake_redis = FakeAsyncRedis()
+    mocker.patch("slingshot_graphs.checkpointer.initialize_redis_bytes", return_value=fake_redis)
+    return fake_redis
+
+
+@pytest.mark.asyncio
+async def test_redis_aput_trims_checkpoints(fake_redis: FakeAsyncRedis):
+    checkpointer = RedisSaver(max_checkpoints_per_thread=2)
+    graph = build_graph(checkpointer)
+    for _ in range(5):
+        state = await graph.ainvoke({"turns": []}, thread_config("thread"))
+
+    assert state["turns"] == [0, 1, 2, 3, 4]
+    assert (await graph.aget_state(thread_config("thread"))).values["turns"] == [0, 1, 2, 3, 4]
+    checkpoints_key = RedisSaver._checkpoints_key("thread", "")
+    checkpoint_ids = {
+        checkpoint_id.decode() for checkpoint_id in await fake_redis.hkeys(checkpoints_key)
+    }
+    assert len(checkpoint_ids) == 2
+    assert await fake_redis.ttl(checkpoints_key) == checkpointer.ttl_seconds
+    # pending writes are only kept for the remaining checkpoints
+    for writes_key in await fake_redis.keys("graph_writes:*"):
+        assert writes_key.decode().rsplit(":", 1)[1] in checkpoint_ids
+
+
+@pytest.mark.asyncio
+async def test_redis_adelete_thread_removes_every_key(fake_redis: FakeAsyncRedis):
+    checkpointer = RedisSaver()
+    graph = build_graph(checkpointer)
+    for _ in range(3):
+        await graph.ainvoke({"turns": []}, thread_config("thread"))
+    await graph.ainvoke({"turns": []}, thread_config("other thread"))
+
+    await checkpointer.adelete_thread("thread")
+
+    remaining_keys = [key.decode() for key in await fake_redis.keys("*")]
+    assert remaining_keys
+    assert all("other thread" in key for key in remaining_keys)
+    assert await checkpointer.aget_tuple(thread_config("thread")) is None
+    assert (await graph.aget_state(thread_config("other thread"))).values["turns"] == [0]
@@ -0,0 +1,93 @@
+"""Measures audio conversion throughput of vocode.streaming.utils.dsp against audioop.
+
+Converts chunks of a 16-bit test signal (20ms by default, like the pipeline sees them) and reports
+how many seconds of audio each operation processes per second of CPU on one core. audioop is only
+measured if it can still be imported (it was removed in Python 3.13).
+
+Usage:
+    python playground/streaming/benchmark_dsp.py --seconds 1 --chunk-ms 20
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from vocode.streaming.utils import dsp
+
+try:
+    import audioop
+except ImportError:
+    audioop = None  # type: ignore
+
+SAMPLING_RATES = [8000, 16000, 24000, 44100]
+# length of the test signal
+AUDIO_SECONDS = 1.0
+
+
+def create_chunks(sampling_rate: int, chunk_seconds: float) -> List[bytes]:
+    t = np.arange(int(sampling_rate * AUDIO_SECONDS)) / sampling_rate
+    signal = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    chunk_samples = int(sampling_rate * chunk_seconds)
+    return [signal[i : i + chunk_samples].tobytes() for i in range(0, len(signal), chunk_samples)]
+
+
+def audio_seconds_per_second(
+    function: Callable[[bytes], object], chunks: List[bytes], seconds: float
+) -> float:
+    processed = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for chunk in chunks:
+            function(chunk)
+        processed += 1
+    return processed * AUDIO_SECONDS / (time.perf_counter() - start)
+
+
+def benchmark(
+    sampling_rate: int, chunk_seconds: float, seconds: float
+) -> Dict[str, Dict[str, Optional[float]]]:
+    chunks = create_chunks(sampling_rate, chunk_seconds)
+    ulaw_chunks = [dsp.lin2ulaw(chunk) for chunk in chunks]
+    results: Dict[str, Dict[str, Optional[float]]] = {}
+
+    def compare(name, dsp_function, audioop_function, inputs=chunks):
+        results[name] = {
+            "dsp": audio_seconds_per_second(dsp_function, inputs, seconds),
+            "audioop": (
+                audio_seconds_per_second(audioop_function, inputs, seconds) if audioop else None
+            ),
+        }
+
+    compare("lin2ulaw", dsp.lin2ulaw, lambda chunk: audioop.lin2ulaw(chunk, 2))
+    compare("ulaw2lin", dsp.ulaw2lin, lambda chunk: audioop.ulaw2lin(chunk, 2), inputs=ulaw_chunks)
+    if sampling_rate != 8000:
+        resampler = dsp.Resampler(sampling_rate, 8000)
+        state = [None]
+
+        def audioop_resample(chunk):
+            resampled, state[0] = audioop.ratecv(chunk, 2, 1, sampling_rate, 8000, state[0])
+            return resampled
+
+        compare("resample to 8000", resampler.process, audioop_resample)
+    return results
+
+
+def main(seconds: float, chunk_ms: float):
+    for sampling_rate in SAMPLING_RATES:
+        for name, rates in benchmark(sampling_rate, chunk_ms / 1000, seconds).items():
+            audioop_rate = rates["audioop"]
+            audioop_text = f"{audioop_rate:10,.0f}x" if audioop_rate is not None else "n/a"
+            print(
+                f"{sampling_rate:>6} Hz {name:>17}: dsp {rates['dsp']:10,.0f}x, "
+                f"audioop {audioop_text} realtime"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--chunk-ms", type=float, default=20)
+    args = parser.parse_args()
+    main(args.seconds, args.chunk_ms)
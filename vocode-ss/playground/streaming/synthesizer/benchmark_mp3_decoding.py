@@ -0,0 +1,117 @@
+"""Measures per-chunk mp3 decode time over a long utterance.
+
+Compares the streaming decoder used by MiniaudioWorker against re-decoding the whole mp3 buffer on
+every chunk (the previous behavior). The streaming decoder's per-chunk time should stay flat no
+matter how far into the utterance we are, while the full re-decode grows linearly.
+
+Usage:
+    python playground/streaming/synthesizer/benchmark_mp3_decoding.py path/to/speech.mp3
+"""
+
+import argparse
+import time
+from typing import Iterator, List, Optional
+
+import miniaudio
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.utils import convert_wav
+from vocode.streaming.utils.mp3_helper import StreamingMP3Source, decode_mp3, stream_decode_mp3
+
+
+def build_utterance(mp3_bytes: bytes, min_seconds: float) -> bytes:
+    # mp3 frames can be concatenated, so loop the sample until it's long enough
+    seconds = miniaudio.mp3_get_info(mp3_bytes).duration
+    repeats = max(int(min_seconds / seconds) + 1, 1)
+    return mp3_bytes * repeats
+
+
+def network_chunks(mp3_bytes: bytes, network_chunk_size: int) -> Iterator[bytes]:
+    for i in range(0, len(mp3_bytes), network_chunk_size):
+        yield mp3_bytes[i : i + network_chunk_size]
+
+
+def benchmark_streaming(
+    mp3_bytes: bytes,
+    network_chunk_size: int,
+    output_sample_rate: int,
+) -> List[float]:
+    chunks = network_chunks(mp3_bytes, network_chunk_size)
+    timings: List[float] = []
+    last_fetch_time: Optional[float] = None
+
+    def fetch_chunk() -> Optional[bytes]:
+        # the time between two fetches is the time spent decoding the previous chunk
+        nonlocal last_fetch_time
+        now = time.perf_counter()
+        if last_fetch_time is not None:
+            timings.append(now - last_fetch_time)
+        last_fetch_time = time.perf_counter()
+        return next(chunks, None)
+
+    for _ in stream_decode_mp3(
+        StreamingMP3Source(fetch_chunk),
+        output_sample_rate=output_sample_rate,
+        frames_per_read=output_sample_rate // 50,
+    ):
+        pass
+    return timings
+
+
+def benchmark_full_redecode(
+    mp3_bytes: bytes,
+    network_chunk_size: int,
+    output_sample_rate: int,
+) -> List[float]:
+    timings: List[float] = []
+    mp3_buffer = bytearray()
+    for chunk in network_chunks(mp3_bytes, network_chunk_size):
+        start = time.perf_counter()
+        mp3_buffer.extend(chunk)
+        try:
+            convert_wav(
+                decode_mp3(bytes(mp3_buffer)),
+                output_sample_rate=output_sample_rate,
+                output_encoding=AudioEncoding.LINEAR16,
+            )
+        except miniaudio.DecodeError:
+            pass
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(name: str, timings: List[float], buckets: int):
+    print(f"{name} ({len(timings)} chunks, {sum(timings):.3f}s total)")
+    bucket_size = max(len(timings) // buckets, 1)
+    for i in range(0, len(timings), bucket_size):
+        bucket = timings[i : i + bucket_size]
+        print(
+            f"  chunks {i:>5}-{i + len(bucket) - 1:<5} "
+            f"mean {1000 * sum(bucket) / len(bucket):8.3f}ms  max {1000 * max(bucket):8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mp3_path")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--network-chunk-size", type=int, default=4096)
+    parser.add_argument("--sampling-rate", type=int, default=8000)
+    parser.add_argument("--buckets", type=int, default=6)
+    parser.add_argument("--skip-full-redecode", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.mp3_path, "rb") as f:
+        utterance = build_utterance(f.read(), args.seconds)
+
+    summarize(
+        "streaming decode",
+        benchmark_streaming(utterance, args.network_chunk_size, args.sampling_rate),
+        args.buckets,
+    )
+    if not args.skip_full_redecode:
+        summarize(
+            "full re-decode",
+            benchmark_full_redecode(utterance, args.network_chunk_size, args.sampling_rate),
+            args.buckets,
+        )
@@ -0,0 +1,116 @@
+"""Measures config manager save/get latency and bytes stored per call.
+
+Compares the compact encoding in call_config_codec, with and without the in-process read cache,
+against storing `.json()` and re-parsing it with `BaseCallConfig.parse_raw` on every lookup,
+which is what RedisConfigManager used to do. Runs against fakeredis unless --redis is given, so
+the latencies exclude the network round trip.
+
+Usage:
+    python playground/streaming/telephony/benchmark_call_config_codec.py --calls 1000
+    REDISHOST=localhost python playground/streaming/telephony/benchmark_call_config_codec.py --redis
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, List
+
+from fakeredis import FakeAsyncRedis
+
+from vocode.streaming.models.agent import ChatGPTAgentConfig
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+from vocode.streaming.models.telephony import BaseCallConfig, TwilioCallConfig, TwilioConfig
+from vocode.streaming.telephony.config_manager.call_config_codec import (
+    decode_call_config,
+    encode_call_config,
+)
+from vocode.streaming.telephony.config_manager.redis_config_manager import RedisConfigManager
+from vocode.streaming.utils.redis import initialize_redis_bytes
+
+# roughly the size of a production system prompt
+PROMPT = "You are a friendly assistant calling on behalf of a clinic to confirm appointments. " * 60
+# lookups per call: connecting the call, ending it, and a few status checks
+GETS_PER_CALL = 5
+
+
+def create_call_config() -> TwilioCallConfig:
+    return TwilioCallConfig(
+        transcriber_config=TwilioCallConfig.default_transcriber_config(),
+        agent_config=ChatGPTAgentConfig(
+            prompt_preamble=PROMPT, initial_message=BaseMessage(text="Hello!")
+        ),
+        synthesizer_config=ElevenLabsSynthesizerConfig.from_telephone_output_device(
+            api_key="api_key", voice_id="voice_id"
+        ),
+        twilio_config=TwilioConfig(account_sid="account_sid", auth_token="auth_token"),
+        twilio_sid="twilio_sid",
+        from_phone="+15555550100",
+        to_phone="+15555550101",
+        direction="outbound",
+    )
+
+
+async def time_per_call(
+    conversation_ids: List[str], function: Callable[[str], Awaitable[object]]
+) -> float:
+    start = time.perf_counter()
+    for conversation_id in conversation_ids:
+        await function(conversation_id)
+    return (time.perf_counter() - start) / len(conversation_ids)
+
+
+async def main(calls: int, use_redis: bool):
+    redis = initialize_redis_bytes() if use_redis else FakeAsyncRedis()
+    config_manager = RedisConfigManager()
+    config_manager.redis = redis
+    call_config = create_call_config()
+    conversation_ids = [str(uuid.uuid4()) for _ in range(calls)]
+
+    async def json_save(conversation_id: str):
+        await redis.set(conversation_id, call_config.json(), ex=60)
+
+    async def json_get(conversation_id: str):
+        for _ in range(GETS_PER_CALL):
+            BaseCallConfig.parse_raw(await redis.get(conversation_id))
+
+    async def compact_get_uncached(conversation_id: str):
+        for _ in range(GETS_PER_CALL):
+            decode_call_config(await redis.get(conversation_id))
+
+    async def compact_get(conversation_id: str):
+        for _ in range(GETS_PER_CALL):
+            await config_manager.get_config(conversation_id)
+
+    json_save_seconds = await time_per_call(conversation_ids, json_save)
+    json_get_seconds = await time_per_call(conversation_ids, json_get)
+    json_bytes = await redis.memory_usage(conversation_ids[0]) if use_redis else None
+    compact_save_seconds = await time_per_call(
+        conversation_ids, lambda id: config_manager.save_config(id, call_config)
+    )
+    compact_get_uncached_seconds = await time_per_call(conversation_ids, compact_get_uncached)
+    compact_get_seconds = await time_per_call(conversation_ids, compact_get)
+
+    print(f"value bytes per call: json {len(call_config.json()):,}, ", end="")
+    print(f"compact {len(encode_call_config(call_config)):,}")
+    if json_bytes is not None:
+        compact_bytes = await redis.memory_usage(conversation_ids[0])
+        print(f"redis memory per call: json {json_bytes:,}, compact {compact_bytes:,}")
+    print(f"{'save, json':>30}: {json_save_seconds * 1e6:8.0f} us/call")
+    print(f"{'save, compact':>30}: {compact_save_seconds * 1e6:8.0f} us/call")
+    print(f"{f'{GETS_PER_CALL} gets, json':>30}: {json_get_seconds * 1e6:8.0f} us/call")
+    print(
+        f"{f'{GETS_PER_CALL} gets, compact uncached':>30}: "
+        f"{compact_get_uncached_seconds * 1e6:8.0f} us/call"
+    )
+    print(f"{f'{GETS_PER_CALL} gets, compact':>30}: {compact_get_seconds * 1e6:8.0f} us/call")
+    await redis.delete(*conversation_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--redis", action="store_true", help="use the Redis at REDISHOST")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.redis))
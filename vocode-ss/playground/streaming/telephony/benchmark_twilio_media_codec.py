@@ -0,0 +1,96 @@
+"""Measures Twilio media stream messages encoded and decoded per second on one core.
+
+Compares TwilioMediaEncoder / decode_twilio_message against building dicts and running
+json.dumps + base64 (outbound) or json.loads + base64 (inbound) for every frame, which is what
+TwilioOutputDevice and TwilioPhoneConversation used to do.
+
+Usage:
+    python playground/streaming/telephony/benchmark_twilio_media_codec.py --seconds 2
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+import uuid
+from typing import Callable
+
+from vocode.streaming.telephony.twilio_media_codec import TwilioMediaEncoder, decode_twilio_message
+
+STREAM_SID = "MZ18ad3ab5a668481ce02b83e7395059f0"
+# Twilio sends 20ms of 8kHz mulaw per inbound frame, the output device sends whole synthesized chunks
+INBOUND_FRAME_SIZE = 160
+OUTBOUND_CHUNK_SIZE = 20 * 160
+
+
+def json_encode_media_and_mark(chunk: bytes, chunk_id: str):
+    media_message = {
+        "event": "media",
+        "streamSid": STREAM_SID,
+        "media": {"payload": base64.b64encode(chunk).decode("utf-8")},
+    }
+    mark_message = {"event": "mark", "streamSid": STREAM_SID, "mark": {"name": chunk_id}}
+    return json.dumps(media_message), json.dumps(mark_message)
+
+
+def json_decode_media(message: str):
+    data = json.loads(message)
+    if data["event"] == "media":
+        return base64.b64decode(data["media"]["payload"])
+    return None
+
+
+def messages_per_second(function: Callable[[], object], seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            function()
+        count += 1000
+    return count / (time.perf_counter() - start)
+
+
+def main(seconds: float):
+    outbound_chunk = os.urandom(OUTBOUND_CHUNK_SIZE)
+    chunk_id = str(uuid.uuid4())
+    encoder = TwilioMediaEncoder(STREAM_SID)
+    inbound_message = json.dumps(
+        {
+            "event": "media",
+            "sequenceNumber": "42",
+            "media": {
+                "track": "inbound",
+                "chunk": "41",
+                "timestamp": "820",
+                "payload": base64.b64encode(os.urandom(INBOUND_FRAME_SIZE)).decode("utf-8"),
+            },
+            "streamSid": STREAM_SID,
+        },
+        separators=(",", ":"),
+    )
+
+    results = {
+        "outbound media+mark, json": messages_per_second(
+            lambda: json_encode_media_and_mark(outbound_chunk, chunk_id), seconds
+        ),
+        "outbound media+mark, codec": messages_per_second(
+            lambda: (encoder.encode_media(outbound_chunk), encoder.encode_mark(chunk_id)), seconds
+        ),
+        "inbound media, json": messages_per_second(
+            lambda: json_decode_media(inbound_message), seconds
+        ),
+        "inbound media, codec": messages_per_second(
+            lambda: decode_twilio_message(inbound_message), seconds
+        ),
+    }
+    for name, rate in results.items():
+        print(f"{name:>28}: {rate:12,.0f} messages/sec/core")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    main(args.seconds)
@@ -0,0 +1,65 @@
+"""Measures the CPU cost per inbound frame of the local VAD, and how much audio the gate holds back.
+
+Runs EnergyVAD and SilenceGate over a synthetic call of 20ms 8kHz mulaw frames (Twilio's inbound
+frame size), alternating speech-level and line-noise-level audio, and reports microseconds per
+frame and the share of the audio that would still be sent to the transcriber.
+
+Usage:
+    python playground/streaming/transcriber/benchmark_vad.py --seconds 60
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.models.transcriber import VADConfig
+from vocode.streaming.utils import dsp
+from vocode.streaming.utils.vad import EnergyVAD, SilenceGate
+
+SAMPLING_RATE = 8000
+FRAME_SIZE = 160
+
+
+def synthetic_call(seconds: float) -> List[bytes]:
+    """Alternates 2s of speech-level and 3s of noise-level audio."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for index in range(int(seconds * SAMPLING_RATE / FRAME_SIZE)):
+        amplitude = 3000 if (index * FRAME_SIZE / SAMPLING_RATE) % 5 < 2 else 30
+        samples = np.clip(rng.normal(0, amplitude, FRAME_SIZE), -32768, 32767)
+        frames.append(dsp.lin2ulaw(samples.astype(np.int16).tobytes()))
+    return frames
+
+
+def microseconds_per_frame(frames: List[bytes], process) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        process(frame)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main(seconds: float):
+    frames = synthetic_call(seconds)
+    vad = EnergyVAD(AudioEncoding.MULAW, SAMPLING_RATE, VADConfig())
+    gate = SilenceGate(EnergyVAD(AudioEncoding.MULAW, SAMPLING_RATE, VADConfig(gate_silence=True)))
+    forwarded_bytes = 0
+
+    def gate_frame(frame: bytes):
+        nonlocal forwarded_bytes
+        forwarded_bytes += sum(len(chunk) for chunk in gate.filter(frame))
+
+    print(f"{len(frames):,} frames ({seconds:.0f}s of audio)")
+    print(f"  EnergyVAD.process:  {microseconds_per_frame(frames, vad.process):6.2f} us/frame")
+    print(f"  SilenceGate.filter: {microseconds_per_frame(frames, gate_frame):6.2f} us/frame")
+    total_bytes = sum(len(frame) for frame in frames)
+    print(f"  sent to transcriber: {forwarded_bytes / total_bytes:.0%} of the audio")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    args = parser.parse_args()
+    main(args.seconds)
@@ -13,11 +13,12 @@ from vocode.streaming.agent.base_agent import (
     TranscriptionAgentInput,
 )
 from vocode.streaming.agent.chat_gpt_agent import ChatGPTAgent
+from vocode.streaming.agent.speculation import Speculation
 from vocode.streaming.models.actions import EndOfTurn
 from vocode.streaming.models.agent import ChatGPTAgentConfig
 from vocode.streaming.models.message import BaseMessage
 from vocode.streaming.models.transcriber import Transcription
-from vocode.streaming.models.transcript import Transcript
+from vocode.streaming.models.transcript import Message, Transcript
 from vocode.streaming.utils.state_manager import ConversationStateManager
 from vocode.streaming.utils.worker import (
     InterruptibleAgentResponseEvent,
@@ -147,6 +148,51 @@ async def test_generate_responses(mocker: MockerFixture):
     assert messages == [BaseMessage(text="Hi, how are you doing today?"), EndOfTurn()]
 
 
+@pytest.mark.asyncio
+async def test_generate_speculative_responses(mocker: MockerFixture):
+    agent_config = ChatGPTAgentConfig(
+        prompt_preamble="Have a pleasant conversation about life",
+        generate_responses=True,
+    )
+    transcript = Transcript()
+    agent = _create_agent(mocker, agent_config, transcript=transcript)
+    _mock_generate_response(
+        mocker,
+        agent,
+        [GeneratedResponse(message=BaseMessage(text="Sure, for when?"), is_interruptible=True)],
+    )
+    speculation = Speculation(
+        Transcription(message="I'd like to book a table", confidence=1.0, is_final=False)
+    )
+    agent.consume_nonblocking(
+        InterruptibleEvent(
+            payload=TranscriptionAgentInput(
+                conversation_id="conversation_id",
+                transcription=speculation.transcription,
+                speculation=speculation,
+            ),
+        )
+    )
+    agent_consumer = QueueConsumer()
+    agent.agent_responses_consumer = agent_consumer
+    agent.start()
+    agent_responses = await _consume_until_end_of_turn(agent_consumer)
+
+    assert [response.message for response in agent_responses] == [
+        BaseMessage(text="Sure, for when?"),
+        EndOfTurn(),
+    ]
+    assert all(response.speculation is speculation for response in agent_responses)
+    assert transcript.event_logs == [speculation.human_message]
+
+    speculation.commit(
+        Transcription(message="I'd like to book a table.", confidence=1.0, is_final=True)
+    )
+    assert isinstance(transcript.event_logs[0], Message)
+    assert transcript.event_logs[0].text == "I'd like to book a table."
+    await agent.terminate()
+
+
 @pytest.mark.asyncio
 async def test_function_call(mocker: MockerFixture):
     # TODO: assert that when we return a function call with a user message, it sends out a message alongside
@@ -1,4 +1,8 @@
+from pytest_mock import MockerFixture
+
+from vocode.streaming.agent import token_utils
 from vocode.streaming.agent.openai_utils import format_openai_chat_messages_from_transcript
+from vocode.streaming.agent.token_utils import TokenLedger
 from vocode.streaming.models.actions import (
     ACTION_FINISHED_FORMAT_STRING,
     ActionConfig,
@@ -301,3 +305,32 @@ def test_format_openai_chat_messages_from_transcript_context_limit():
 
     for params, expected_output in test_cases:
         assert format_openai_chat_messages_from_transcript(*params) == expected_output
+
+
+def test_format_openai_chat_messages_from_transcript_reuses_token_counts(mocker: MockerFixture):
+    transcript = Transcript(
+        event_logs=[
+            Message(sender=Sender.BOT, text="Hello!", is_final=True),
+            Message(sender=Sender.HUMAN, text="I'm doing well, thanks!"),
+            Message(sender=Sender.BOT, text="aaaa " * 1862, is_final=True),
+            Message(sender=Sender.HUMAN, text="What? What did you just say???"),
+        ]
+    )
+    token_ledger = TokenLedger()
+    params = (transcript, "gpt-3.5-turbo-0613", None, "prompt preamble")
+    expected_output = [
+        {"role": "system", "content": "prompt preamble"},
+        {"role": "user", "content": "What? What did you just say???"},
+    ]
+    assert (
+        format_openai_chat_messages_from_transcript(*params, token_ledger=token_ledger)
+        == expected_output
+    )
+
+    tokens_from_dict = mocker.spy(token_utils, "tokens_from_dict")
+    transcript.event_logs.append(Message(sender=Sender.BOT, text="Sorry!", is_final=True))
+    assert format_openai_chat_messages_from_transcript(
+        *params, token_ledger=token_ledger
+    ) == expected_output + [{"role": "assistant", "content": "Sorry!"}]
+    # only the new message is tokenized
+    assert tokens_from_dict.call_count == 1
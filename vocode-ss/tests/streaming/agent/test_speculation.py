@@ -0,0 +1,38 @@
+import pytest
+
+from vocode.streaming.agent.speculation import Speculation, transcription_similarity
+from vocode.streaming.models.events import Sender
+from vocode.streaming.models.transcriber import Transcription
+from vocode.streaming.models.transcript import Message, Transcript
+from vocode.streaming.utils.metrics import get_metrics_snapshot
+
+
+def test_transcription_similarity():
+    assert transcription_similarity("I'd like to book a table", "i'd like to book a table.") == 1
+    assert transcription_similarity("", "") == 1
+    assert transcription_similarity("book a table", "") == 0
+    assert transcription_similarity(
+        "I'd like to book a table", "I'd like to book a table for two"
+    ) == pytest.approx(12 / 14)
+
+
+@pytest.mark.asyncio
+async def test_discarded_speculation_removes_human_message():
+    transcript = Transcript()
+    transcript.add_human_message(text="hello", conversation_id="test")
+    transcript.add_bot_message(text="Hi, how can I help?", conversation_id="test", is_final=True)
+    wasted = get_metrics_snapshot()["agent.speculation.wasted"]
+
+    speculation = Speculation(Transcription(message="hello", confidence=1.0, is_final=False))
+    speculation.add_human_message(transcript, "test")
+    assert transcript.event_logs[-1] == Message(
+        text="hello", sender=Sender.HUMAN, timestamp=transcript.event_logs[-1].timestamp
+    )
+    speculation.discard()
+
+    assert not await speculation.wait()
+    assert [event_log.text for event_log in transcript.event_logs] == [
+        "hello",
+        "Hi, how can I help?",
+    ]
+    assert get_metrics_snapshot()["agent.speculation.wasted"] == wasted + 1
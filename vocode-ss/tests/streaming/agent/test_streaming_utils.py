@@ -5,7 +5,11 @@ from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from pydantic.v1 import BaseModel
 
 from vocode.streaming.agent.openai_utils import openai_get_tokens
-from vocode.streaming.agent.streaming_utils import collate_response_async
+from vocode.streaming.agent.streaming_utils import (
+    SentenceSegmenter,
+    collate_response_async,
+    segment_response_async,
+)
 from vocode.streaming.models.actions import FunctionCall
 
 
@@ -373,3 +377,55 @@ async def test_collate_response_async(mocker):
         ):
             actual_sentences.append(sentence)
         assert actual_sentences == test_case.expected_sentences
+
+
+def segment(tokens: List[str]) -> List[List[str]]:
+    segmenter = SentenceSegmenter()
+    return [segmenter.feed(token) for token in tokens] + [[segmenter.flush()]]
+
+
+def test_sentence_segmenter_yields_sentences_as_they_end():
+    assert segment(["Hello", "!", " How are", " you?", " I", "'m fine"]) == [
+        [],
+        ["Hello!"],
+        [],
+        ["How are you?"],
+        [],
+        [],
+        ["I'm fine"],
+    ]
+    assert segment(["Yes. Hi. Ok", ". what", " is it"]) == [
+        ["Yes.", "Hi."],
+        [],
+        [],
+        ["Ok. what is it"],
+    ]
+
+
+def test_sentence_segmenter_does_not_split_numbers():
+    assert segment(["It is 3", ".5 miles", " away. ", "Bye"]) == [
+        [],
+        [],
+        ["It is 3.5 miles away."],
+        [],
+        ["Bye"],
+    ]
+    assert segment(["Please pay. ", "It is $4", ".20 today. ", "Thanks."]) == [
+        ["Please pay."],
+        [],
+        [],
+        [],
+        ["It is $4.20 today. Thanks."],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_segment_response_async():
+    async def gen():
+        for token in ["Hello", ". What do", " you want to talk about", "?"]:
+            yield token
+
+    assert [sentence async for sentence in segment_response_async("test", gen())] == [
+        "Hello.",
+        "What do you want to talk about?",
+    ]
@@ -0,0 +1,86 @@
+import pickle
+from copy import deepcopy
+
+from vocode.streaming.agent.anthropic_utils import format_anthropic_chat_messages_from_transcript
+from vocode.streaming.agent.openai_utils import (
+    OPENAI_CHAT_MESSAGES_VIEW,
+    event_log_to_openai_chat_messages,
+    get_openai_chat_messages_from_transcript,
+    merge_event_logs,
+)
+from vocode.streaming.models.events import Sender
+from vocode.streaming.models.transcript import Message, Transcript
+
+
+def get_openai_chat_messages(transcript: Transcript):
+    return transcript.get_converted_event_logs(
+        OPENAI_CHAT_MESSAGES_VIEW, event_log_to_openai_chat_messages
+    )
+
+
+def rebuilt_openai_chat_messages(transcript: Transcript):
+    return get_openai_chat_messages_from_transcript(merge_event_logs(transcript.event_logs), "")[1:]
+
+
+def test_merged_event_logs_are_updated_incrementally():
+    transcript = Transcript()
+    transcript.add_bot_message("Hello!", conversation_id="test", is_final=True)
+    transcript.add_bot_message("How are you?", conversation_id="test")
+    assert get_openai_chat_messages(transcript) == rebuilt_openai_chat_messages(transcript)
+
+    transcript.add_human_message("Good, thanks!", conversation_id="test")
+    transcript.add_bot_message("Great", conversation_id="test")
+    transcript.event_logs.append(Message(sender=Sender.BOT, text="to hear.", is_final=True))
+    assert get_openai_chat_messages(transcript) == rebuilt_openai_chat_messages(transcript)
+    assert [event_log.text for event_log in transcript.get_merged_event_logs()] == [
+        "Hello! How are you?",
+        "Good, thanks!",
+        "Great to hear.",
+    ]
+
+
+def test_only_modified_event_logs_are_converted_again():
+    transcript = Transcript()
+    converted = []
+
+    def convert(event_log):
+        converted.append(event_log.text)
+        return [event_log.text]
+
+    transcript.add_human_message("Hi", conversation_id="test")
+    transcript.add_bot_message("Hello there, how can I help?", conversation_id="test")
+    assert transcript.get_converted_event_logs("texts", convert) == [
+        "Hi",
+        "Hello there, how can I help?",
+    ]
+    assert transcript.get_converted_event_logs("texts", convert) == converted
+
+    transcript.update_last_bot_message_on_cut_off("Hello there-")
+    transcript.add_human_message("Wait", conversation_id="test")
+    assert transcript.get_converted_event_logs("texts", convert) == ["Hi", "Hello there-", "Wait"]
+    assert converted == ["Hi", "Hello there, how can I help?", "Hello there-", "Wait"]
+
+    transcript.event_logs = [Message(sender=Sender.HUMAN, text="Again")]
+    assert transcript.get_converted_event_logs("texts", convert) == ["Again"]
+
+
+def test_anthropic_messages_match_transcript_string():
+    transcript = Transcript()
+    transcript.add_bot_message("Hello!", conversation_id="test", is_final=True)
+    transcript.add_human_message("uh huh", conversation_id="test", is_backchannel=True)
+    transcript.add_bot_message("So anyway", conversation_id="test")
+    assert format_anthropic_chat_messages_from_transcript(transcript)[0]["content"] == (
+        Transcript(event_logs=merge_event_logs(transcript.event_logs)).to_string(
+            mark_human_backchannels_with_brackets=True
+        )
+    )
+
+
+def test_transcript_with_views_can_be_copied():
+    transcript = Transcript()
+    transcript.add_human_message("Hi", conversation_id="test")
+    get_openai_chat_messages(transcript)
+    for copied in (deepcopy(transcript), pickle.loads(pickle.dumps(transcript))):
+        copied.event_logs[0].text = "Hello"
+        assert get_openai_chat_messages(copied) == [{"role": "user", "content": "Hello"}]
+    assert get_openai_chat_messages(transcript) == [{"role": "user", "content": "Hi"}]
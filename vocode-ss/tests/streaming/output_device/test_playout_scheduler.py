@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from vocode.streaming.output_device.playout_scheduler import PlayoutScheduler
+from vocode.streaming.utils.metrics import counter
+
+
+@pytest.mark.asyncio
+async def test_keeps_at_most_lead_seconds_buffered():
+    playout_scheduler = PlayoutScheduler(lead_seconds=0.1, paces_producer=True)
+    start = time.monotonic()
+    for _ in range(5):
+        await playout_scheduler.wait_for_slot()
+        playout_scheduler.schedule(0.05)
+        assert playout_scheduler.buffered_seconds() <= 0.15 + 0.01
+
+    # the first 0.1 seconds of audio go out immediately, the rest at playback speed
+    assert time.monotonic() - start == pytest.approx(0.15, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_stops_waiting_when_interrupted():
+    playout_scheduler = PlayoutScheduler(lead_seconds=0.0)
+    playout_scheduler.schedule(10)
+    stop_event = threading.Event()
+    asyncio.get_running_loop().call_later(0.05, stop_event.set)
+
+    await asyncio.wait_for(playout_scheduler.wait_for_slot(stop_event), 1)
+
+    playout_scheduler.reset()
+    assert playout_scheduler.buffered_seconds() == 0
+
+
+@pytest.mark.asyncio
+async def test_counts_underruns_within_an_utterance():
+    underruns = counter("output.underruns")
+    playout_scheduler = PlayoutScheduler(lead_seconds=0.0)
+    playout_scheduler.start_utterance()
+    playout_scheduler.schedule(0.01)
+    playout_scheduler.schedule(0.01)
+    underruns_before = underruns.snapshot()
+
+    await asyncio.sleep(0.05)
+    playout_scheduler.schedule(0.01)
+    assert underruns.snapshot() == underruns_before + 1
+
+    # silence between utterances is not an underrun
+    playout_scheduler.end_utterance()
+    await asyncio.sleep(0.05)
+    playout_scheduler.start_utterance()
+    playout_scheduler.schedule(0.01)
+    assert underruns.snapshot() == underruns_before + 1
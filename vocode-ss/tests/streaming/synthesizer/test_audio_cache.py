@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fakeredis import FakeAsyncRedis, FakeServer
 from pytest_mock import MockerFixture
@@ -59,3 +61,142 @@ async def test_safe_create_set_and_get_disabled(mocker: MockerFixture):
     await cache.set_audio(voice_identifier, text, audio_data)
 
     assert await cache.get_audio(voice_identifier, text) is None
+
+
+@pytest.mark.asyncio
+async def test_get_audio_served_from_local_cache(mocker: MockerFixture):
+    from vocode.streaming.synthesizer.audio_cache import AudioCache
+
+    fake_redis = FakeAsyncRedis()
+
+    mocker.patch(
+        "vocode.streaming.synthesizer.audio_cache.initialize_redis_bytes", return_value=fake_redis
+    )
+
+    cache = await AudioCache.safe_create()
+    await cache.set_audio("voice_id", "text", b"chunk")
+    assert await fake_redis.ttl(cache.get_audio_key("voice_id", "text")) == cache.ttl
+
+    redis_get = mocker.spy(fake_redis, "getex")
+    assert await cache.get_audio("voice_id", "text") == b"chunk"
+    redis_get.assert_not_called()
+
+    cache.local_cache.clear()
+    assert await cache.get_audio("voice_id", "text") == b"chunk"
+    redis_get.assert_called_once()
+    assert cache.local_cache.get("audio_cache:missing") is None
+    assert "voice_id" not in cache.get_audio_key("voice_id", "text")
+
+
+@pytest.mark.asyncio
+async def test_local_cache_evicts_by_size(mocker: MockerFixture):
+    from vocode.streaming.synthesizer.audio_cache import AudioCache
+
+    mocker.patch(
+        "vocode.streaming.synthesizer.audio_cache.initialize_redis_bytes",
+        return_value=FakeAsyncRedis(),
+    )
+    mocker.patch.dict("os.environ", {"AUDIO_CACHE_LOCAL_MAX_BYTES": "10"})
+
+    cache = await AudioCache.safe_create()
+    evictions_before = cache.local_cache.evictions.value
+    await cache.set_audio("voice_id", "first", b"12345")
+    await cache.set_audio("voice_id", "second", b"12345")
+    await cache.get_audio("voice_id", "first")  # first is now the most recently used
+    await cache.set_audio("voice_id", "third", b"12345")
+
+    assert cache.local_cache.size == 10
+    assert cache.local_cache.evictions.value - evictions_before == 1
+    assert cache.get_audio_key("voice_id", "first") in cache.local_cache
+    assert cache.get_audio_key("voice_id", "second") not in cache.local_cache
+
+
+@pytest.mark.asyncio
+async def test_audio_creation_is_shared_and_cached(mocker: MockerFixture):
+    from vocode.streaming.synthesizer.audio_cache import AudioCache
+
+    mocker.patch(
+        "vocode.streaming.synthesizer.audio_cache.initialize_redis_bytes",
+        return_value=FakeAsyncRedis(),
+    )
+
+    cache = await AudioCache.safe_create()
+    assert cache.get_audio_creation("voice_id", "text") is None
+    creation = cache.start_audio_creation("voice_id", "text")
+    assert cache.get_audio_creation("voice_id", "text") is creation
+
+    waiters = [asyncio.ensure_future(asyncio.shield(creation)) for _ in range(3)]
+    await cache.finish_audio_creation("voice_id", "text", creation, b"chunk")
+    assert await asyncio.gather(*waiters) == [b"chunk"] * 3
+    assert cache.get_audio_creation("voice_id", "text") is None
+    assert await cache.get_audio("voice_id", "text") == b"chunk"
+
+    failed_creation = cache.start_audio_creation("voice_id", "failed")
+    await cache.finish_audio_creation("voice_id", "failed", failed_creation, None)
+    assert await failed_creation is None
+    assert await cache.get_audio("voice_id", "failed") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_synthesizer_misses_synthesize_once(mocker: MockerFixture):
+    from tests.fixtures.synthesizer import TestSynthesizer, TestSynthesizerConfig
+    from vocode.streaming.models.audio import AudioEncoding, SamplingRate
+    from vocode.streaming.models.message import BotBackchannel
+
+    fake_redis = FakeAsyncRedis()
+    mocker.patch(
+        "vocode.streaming.synthesizer.audio_cache.initialize_redis_bytes", return_value=fake_redis
+    )
+    synthesizer = TestSynthesizer(
+        TestSynthesizerConfig(
+            sampling_rate=SamplingRate.RATE_8000, audio_encoding=AudioEncoding.LINEAR16
+        )
+    )
+    create_speech_uncached = mocker.spy(synthesizer, "create_speech_uncached")
+
+    results = await asyncio.gather(
+        *(synthesizer.create_speech(BotBackchannel(text="Mhm."), chunk_size=160) for _ in range(5))
+    )
+    assert create_speech_uncached.call_count == 1
+    audios = [b"".join([chunk.chunk async for chunk in r.chunk_generator]) for r in results]
+    assert all(audio == audios[0] for audio in audios) and audios[0]
+    # the first call streams the synthesis, the others get its audio once it's done
+    assert [result.cached for result in results] == [False, True, True, True, True]
+
+    from vocode.streaming.synthesizer.audio_cache import AudioCache
+
+    cache = await AudioCache.safe_create()
+    assert await cache.get_audio("test_voice", "Mhm.") == audios[0]
+
+    result = await synthesizer.create_speech(BotBackchannel(text="Mhm."), chunk_size=160)
+    assert result.cached
+    assert create_speech_uncached.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_synthesis_survives_redis_write_errors(mocker: MockerFixture):
+    from tests.fixtures.synthesizer import TestSynthesizer, TestSynthesizerConfig
+    from vocode.streaming.models.audio import AudioEncoding, SamplingRate
+    from vocode.streaming.models.message import BotBackchannel
+    from vocode.streaming.synthesizer.audio_cache import AudioCache
+
+    fake_redis = FakeAsyncRedis()
+    mocker.patch(
+        "vocode.streaming.synthesizer.audio_cache.initialize_redis_bytes", return_value=fake_redis
+    )
+    mocker.patch.object(fake_redis, "set", side_effect=ConnectionError("Redis is down"))
+    synthesizer = TestSynthesizer(
+        TestSynthesizerConfig(
+            sampling_rate=SamplingRate.RATE_8000, audio_encoding=AudioEncoding.LINEAR16
+        )
+    )
+
+    cache = await AudioCache.safe_create()
+    redis_errors_before = cache.redis_errors.value
+    result = await synthesizer.create_speech(BotBackchannel(text="Mhm."), chunk_size=160)
+    audio = b"".join([chunk.chunk async for chunk in result.chunk_generator])
+    assert audio
+    await asyncio.sleep(0)  # let the collected audio be written
+
+    assert cache.redis_errors.value - redis_errors_before == 1
+    assert await cache.get_audio("test_voice", "Mhm.") == audio
@@ -0,0 +1,89 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from vocode.streaming.models.audio import AudioEncoding, SamplingRate
+from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
+from vocode.streaming.synthesizer.azure_synthesizer import AzureSynthesizer
+
+
+@pytest.fixture
+def azure_synthesizer() -> AzureSynthesizer:
+    return AzureSynthesizer(
+        AzureSynthesizerConfig(
+            sampling_rate=SamplingRate.RATE_8000,
+            audio_encoding=AudioEncoding.MULAW,
+        ),
+        azure_speech_key="test",
+        azure_speech_region="eastus",
+    )
+
+
+def word_boundary_events(result_id: str, ssml: str, text: str):
+    # one event per word, 0.5s apart
+    for idx, word in enumerate(text.split()):
+        yield SimpleNamespace(
+            result_id=result_id,
+            audio_offset=int(idx * 0.5 * 10000 * 1000),
+            text_offset=ssml.index(word),
+        )
+
+
+def synthesis_finished_event(result_id: str):
+    return SimpleNamespace(result=SimpleNamespace(result_id=result_id))
+
+
+def get_message_up_to(
+    azure_synthesizer: AzureSynthesizer, result_id: str, text: str, ssml: str, seconds
+):
+    return azure_synthesizer.get_message_up_to(
+        text,
+        ssml,
+        seconds,
+        azure_synthesizer.claim_word_boundary_pool(result_id),
+        [match.end() for match in re.finditer(">", ssml)],
+    )
+
+
+def test_word_boundaries_are_scoped_per_utterance(azure_synthesizer: AzureSynthesizer):
+    first_text = "hello there my friend"
+    second_text = "how are you doing today"
+    first_ssml = azure_synthesizer.create_ssml(first_text, azure_synthesizer.synthesizer_config)
+    second_ssml = azure_synthesizer.create_ssml(second_text, azure_synthesizer.synthesizer_config)
+
+    for event in word_boundary_events("first", first_ssml, first_text):
+        azure_synthesizer.word_boundary_cb(event)
+    azure_synthesizer.synthesis_finished_cb(synthesis_finished_event("first"))
+    for event in word_boundary_events("second", second_ssml, second_text):
+        azure_synthesizer.word_boundary_cb(event)
+
+    assert (
+        get_message_up_to(azure_synthesizer, "first", first_text, first_ssml, 0.75)
+        == "hello there "
+    )
+    assert (
+        get_message_up_to(azure_synthesizer, "second", second_text, second_ssml, 1.25)
+        == "how are you "
+    )
+    assert (
+        get_message_up_to(azure_synthesizer, "second", second_text, second_ssml, None)
+        == second_text
+    )
+    assert (
+        get_message_up_to(azure_synthesizer, "second", second_text, second_ssml, 10) == second_text
+    )
+
+    azure_synthesizer.synthesis_finished_cb(synthesis_finished_event("second"))
+    assert azure_synthesizer.word_boundary_pools == {}
+    assert list(azure_synthesizer.unclaimed_word_boundary_pools) == []
+
+
+def test_unclaimed_word_boundary_pools_are_bounded(azure_synthesizer: AzureSynthesizer):
+    for idx in range(AzureSynthesizer.MAX_UNCLAIMED_WORD_BOUNDARY_POOLS * 2):
+        azure_synthesizer.synthesis_finished_cb(synthesis_finished_event(str(idx)))
+
+    assert (
+        len(azure_synthesizer.unclaimed_word_boundary_pools)
+        == AzureSynthesizer.MAX_UNCLAIMED_WORD_BOUNDARY_POOLS
+    )
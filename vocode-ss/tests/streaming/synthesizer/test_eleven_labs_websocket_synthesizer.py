@@ -0,0 +1,138 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+from websockets.protocol import State
+
+from vocode.streaming.models.audio import AudioEncoding, SamplingRate
+from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+from vocode.streaming.synthesizer import eleven_labs_websocket_synthesizer
+from vocode.streaming.synthesizer.eleven_labs_websocket_synthesizer import (
+    ElevenLabsWebsocketConnectionManager,
+    ElevenLabsWSSynthesizer,
+)
+
+
+class FakeWebsocket:
+    def __init__(self, index: int):
+        self.index = index
+        self.state = State.OPEN
+
+    async def close(self):
+        self.state = State.CLOSED
+
+
+class FakeConnector:
+    def __init__(self, num_failures: int = 0):
+        self.websockets: List[FakeWebsocket] = []
+        self.num_failures = num_failures
+
+    async def __call__(self) -> FakeWebsocket:
+        await asyncio.sleep(0)
+        if self.num_failures:
+            self.num_failures -= 1
+            raise ConnectionError("handshake failed")
+        websocket = FakeWebsocket(len(self.websockets))
+        self.websockets.append(websocket)
+        return websocket
+
+
+@pytest.mark.asyncio
+async def test_take_uses_warm_websocket_and_prewarms_the_next():
+    connector = FakeConnector()
+    manager = ElevenLabsWebsocketConnectionManager(connector)  # type: ignore
+    manager.prewarm()
+    await asyncio.sleep(0.01)
+    assert len(connector.websockets) == 1
+
+    websocket = await manager.take()
+    assert websocket is connector.websockets[0]
+    await asyncio.sleep(0.01)
+    assert len(connector.websockets) == 2
+
+    # the warm one was closed in the meantime, so a new one is connected
+    connector.websockets[1].state = State.CLOSED
+    websocket = await manager.take()
+    assert websocket is connector.websockets[2]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_unused_warm_websocket_is_replaced():
+    connector = FakeConnector()
+    manager = ElevenLabsWebsocketConnectionManager(connector, max_idle_seconds=0.02)  # type: ignore
+    manager.prewarm()
+    await asyncio.sleep(0.05)
+    assert len(connector.websockets) >= 2
+    assert connector.websockets[0].state is State.CLOSED
+    assert (await manager.take()).state is State.OPEN
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_prewarm_is_retried(mocker: MockerFixture):
+    mocker.patch.object(eleven_labs_websocket_synthesizer, "RECONNECT_MIN_DELAY_SECONDS", 0.01)
+    connector = FakeConnector(num_failures=2)
+    manager = ElevenLabsWebsocketConnectionManager(connector)  # type: ignore
+    manager.prewarm()
+    await asyncio.sleep(0.1)
+    assert len(connector.websockets) == 1
+    assert await manager.take() is connector.websockets[0]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_take_keeps_the_websocket():
+    connector = FakeConnector()
+    manager = ElevenLabsWebsocketConnectionManager(connector)  # type: ignore
+    manager.prewarm()
+    take = asyncio.create_task(manager.take())
+    await asyncio.sleep(0)
+    take.cancel()
+    await asyncio.sleep(0.01)
+    assert await manager.take() is connector.websockets[0]
+    assert connector.websockets[0].state is State.OPEN
+    await manager.close()
+
+
+def create_synthesizer_config() -> ElevenLabsSynthesizerConfig:
+    return ElevenLabsSynthesizerConfig(
+        sampling_rate=SamplingRate.RATE_8000,
+        audio_encoding=AudioEncoding.MULAW,
+        api_key="test",
+        stability=0.5,
+        similarity_boost=0.75,
+    )
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_prewarms_websocket_on_start(mocker: MockerFixture):
+    connector = FakeConnector()
+    mocker.patch.object(ElevenLabsWSSynthesizer, "connect_websocket", connector)
+    synthesizer = ElevenLabsWSSynthesizer(create_synthesizer_config())
+    await asyncio.sleep(0.01)
+    assert len(connector.websockets) == 1
+
+    # the first turn gets the socket that was connected on start
+    assert await synthesizer.connection_manager.take() is connector.websockets[0]
+    await synthesizer.tear_down()
+
+
+@pytest.mark.asyncio
+async def test_connect_websocket_sends_first_message(mocker: MockerFixture):
+    websocket = mocker.AsyncMock()
+    connect = mocker.patch.object(
+        eleven_labs_websocket_synthesizer.websockets,
+        "connect",
+        mocker.AsyncMock(return_value=websocket),
+    )
+    synthesizer = ElevenLabsWSSynthesizer(create_synthesizer_config())
+    assert await synthesizer.connect_websocket() is websocket
+    assert "inactivity_timeout=" in connect.call_args.args[0]
+    first_message = json.loads(websocket.send.call_args.args[0])
+    assert first_message["text"] == " "
+    assert first_message["xi_api_key"] == "test"
+    assert first_message["voice_settings"] == {"stability": 0.5, "similarity_boost": 0.75}
+    await synthesizer.tear_down()
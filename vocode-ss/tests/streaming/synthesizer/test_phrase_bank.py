@@ -0,0 +1,50 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.fixtures.synthesizer import TestSynthesizer, TestSynthesizerConfig
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.synthesizer.phrase_bank import PhraseBank
+
+
+@pytest.fixture
+def phrase_bank():
+    phrase_bank = PhraseBank()
+    yield phrase_bank
+    phrase_bank.clear()
+
+
+def create_synthesizer(sampling_rate: int = 16000) -> TestSynthesizer:
+    return TestSynthesizer(
+        TestSynthesizerConfig(sampling_rate=sampling_rate, audio_encoding=AudioEncoding.LINEAR16)
+    )
+
+
+@pytest.mark.asyncio
+async def test_pre_rendered_phrases_skip_synthesis(phrase_bank: PhraseBank, mocker: MockerFixture):
+    text = "Hello, how can I help you today?"
+    synthesizer = create_synthesizer()
+    assert await phrase_bank.warm(synthesizer, [text, text], chunk_size=4) == 1
+    assert await phrase_bank.warm(synthesizer, [text], chunk_size=4) == 0
+
+    create_speech_uncached = mocker.spy(synthesizer, "create_speech_uncached")
+    synthesis_result = await synthesizer.create_speech(BaseMessage(text=text), chunk_size=4)
+    chunk_results = [chunk_result async for chunk_result in synthesis_result.chunk_generator]
+
+    create_speech_uncached.assert_not_called()
+    assert synthesis_result.cached
+    assert b"".join(chunk_result.chunk for chunk_result in chunk_results) == text.encode()
+    assert all(len(chunk_result.chunk) == 4 for chunk_result in chunk_results[:-1])
+    assert [chunk_result.is_last_chunk for chunk_result in chunk_results].count(True) == 1
+    assert chunk_results[-1].is_last_chunk
+    assert synthesis_result.get_message_up_to(None) == text
+
+
+@pytest.mark.asyncio
+async def test_phrases_are_keyed_by_output_format(phrase_bank: PhraseBank):
+    text = "Thank you, and goodbye."
+    await phrase_bank.warm(create_synthesizer(16000), [text], chunk_size=4)
+
+    assert phrase_bank.get_phrase(create_synthesizer(16000), text, 4) is not None
+    assert phrase_bank.get_phrase(create_synthesizer(16000), text, 8) is None
+    assert phrase_bank.get_phrase(create_synthesizer(24000), text, 4) is None
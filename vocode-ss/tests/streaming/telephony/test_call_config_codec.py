@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from pytest_mock import MockerFixture
+
+from vocode.streaming.models.agent import ChatGPTAgentConfig
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+from vocode.streaming.models.telephony import TwilioCallConfig, TwilioConfig
+from vocode.streaming.telephony.config_manager import call_config_codec
+from vocode.streaming.telephony.config_manager.call_config_codec import (
+    decode_call_config,
+    encode_call_config,
+)
+from vocode.streaming.telephony.config_manager.redis_config_manager import RedisConfigManager
+from vocode.streaming.utils.metrics import counter
+
+
+def create_call_config() -> TwilioCallConfig:
+    return TwilioCallConfig(
+        transcriber_config=TwilioCallConfig.default_transcriber_config(),
+        agent_config=ChatGPTAgentConfig(
+            prompt_preamble="You are a helpful assistant. " * 50,
+            initial_message=BaseMessage(text="Hello"),
+        ),
+        synthesizer_config=ElevenLabsSynthesizerConfig.from_telephone_output_device(
+            api_key="api_key", voice_id="voice_id"
+        ),
+        twilio_config=TwilioConfig(account_sid="account_sid", auth_token="auth_token"),
+        twilio_sid="twilio_sid",
+        from_phone="+15555550100",
+        to_phone="+15555550101",
+        sentry_tags={"campaign": "test"},
+        direction="outbound",
+    )
+
+
+def test_round_trip():
+    call_config = create_call_config()
+    encoded = encode_call_config(call_config)
+    assert len(encoded) < len(call_config.json()) / 2
+
+    decoded = decode_call_config(encoded)
+    assert decoded == call_config
+    assert type(decoded.agent_config) is ChatGPTAgentConfig
+    assert decoded.json() == call_config.json()
+
+
+def test_decodes_legacy_json():
+    call_config = create_call_config()
+    assert decode_call_config(call_config.json().encode()) == call_config
+
+
+def test_schema_mismatch_validates(mocker: MockerFixture):
+    call_config = create_call_config()
+    encoded = encode_call_config(call_config)
+    mismatches = counter("config_manager.schema_mismatches").snapshot()
+    construct = mocker.spy(call_config_codec, "_construct")
+
+    mocker.patch.object(call_config_codec, "get_schema_hash", return_value=b"\0" * 8)
+    assert decode_call_config(encoded) == call_config
+    construct.assert_not_called()
+    assert counter("config_manager.schema_mismatches").snapshot() == mismatches + 1
+
+
+def test_rejects_unknown_version():
+    encoded = bytearray(encode_call_config(create_call_config()))
+    encoded[len(call_config_codec.CALL_CONFIG_MAGIC)] = 99
+    with pytest.raises(ValueError):
+        decode_call_config(bytes(encoded))
+
+
+@pytest.mark.asyncio
+async def test_redis_config_manager_caches_reads(mocker: MockerFixture):
+    mocker.patch(
+        "vocode.streaming.telephony.config_manager.redis_config_manager.initialize_redis_bytes",
+        return_value=FakeAsyncRedis(),
+    )
+    config_manager = RedisConfigManager()
+    call_config = create_call_config()
+    await config_manager.save_config("conversation_id", call_config)
+    redis_get = mocker.spy(config_manager.redis, "get")
+
+    assert await config_manager.get_config("conversation_id") == call_config
+    assert await config_manager.get_config("conversation_id") == call_config
+    assert redis_get.call_count == 1
+
+    await config_manager.delete_config("conversation_id")
+    assert await config_manager.get_config("conversation_id") is None
+    assert config_manager.deletion_listener_task is not None
+    config_manager.deletion_listener_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redis_config_manager_returns_copies(mocker: MockerFixture):
+    mocker.patch(
+        "vocode.streaming.telephony.config_manager.redis_config_manager.initialize_redis_bytes",
+        return_value=FakeAsyncRedis(),
+    )
+    config_manager = RedisConfigManager()
+    call_config = create_call_config()
+    await config_manager.save_config("conversation_id", call_config)
+
+    config = await config_manager.get_config("conversation_id")
+    assert config is not None
+    config.agent_config.model_name = "fallback-model"
+    assert await config_manager.get_config("conversation_id") == call_config
+    assert config_manager.deletion_listener_task is not None
+    config_manager.deletion_listener_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redis_config_manager_evicts_configs_deleted_by_other_processes(
+    mocker: MockerFixture,
+):
+    server = FakeServer()
+    mocker.patch(
+        "vocode.streaming.telephony.config_manager.redis_config_manager.initialize_redis_bytes",
+        side_effect=lambda **kwargs: FakeAsyncRedis(server=server),
+    )
+    telephony_server_config_manager = RedisConfigManager()
+    dialer_config_manager = RedisConfigManager()
+    call_config = create_call_config()
+    await dialer_config_manager.save_config("conversation_id", call_config)
+
+    # only reads, never waits for a deletion
+    assert await telephony_server_config_manager.get_config("conversation_id") == call_config
+    await dialer_config_manager.delete_config("conversation_id")
+    await asyncio.sleep(0.05)
+    assert await telephony_server_config_manager.get_config("conversation_id") is None
+    assert telephony_server_config_manager.deletion_listener_task is not None
+    telephony_server_config_manager.deletion_listener_task.cancel()
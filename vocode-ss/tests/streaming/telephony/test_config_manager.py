@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from pytest_mock import MockerFixture
+
+from vocode.streaming.telephony.config_manager.in_memory_config_manager import InMemoryConfigManager
+from vocode.streaming.telephony.config_manager.redis_config_manager import RedisConfigManager
+
+
+@pytest.mark.asyncio
+async def test_in_memory_wait_for_config_deletion():
+    config_manager = InMemoryConfigManager()
+    config_manager.configs["conversation_id"] = object()
+
+    assert not await config_manager.wait_for_config_deletion("conversation_id", timeout=0.01)
+
+    wait_task = asyncio.create_task(config_manager.wait_for_config_deletion("conversation_id"))
+    await asyncio.sleep(0)
+    await config_manager.delete_config("conversation_id")
+    assert await asyncio.wait_for(wait_task, timeout=1)
+    assert config_manager.deletion_events == {}
+    assert await config_manager.wait_for_config_deletion("conversation_id", timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_redis_wait_for_config_deletion(mocker: MockerFixture):
+    mocker.patch(
+        "vocode.streaming.telephony.config_manager.redis_config_manager.initialize_redis_bytes",
+        return_value=FakeAsyncRedis(),
+    )
+    config_manager = RedisConfigManager()
+    get_config = mocker.spy(config_manager, "get_config")
+    await config_manager.redis.set("first", "{}")
+    await config_manager.redis.set("second", "{}")
+
+    assert not await config_manager.wait_for_config_deletion("first", timeout=0.05)
+
+    first_wait = asyncio.create_task(config_manager.wait_for_config_deletion("first"))
+    second_wait = asyncio.create_task(config_manager.wait_for_config_deletion("second"))
+    await asyncio.sleep(0.05)
+    await config_manager.delete_config("first")
+    assert await asyncio.wait_for(first_wait, timeout=1)
+    assert not second_wait.done()
+
+    await config_manager.delete_config("second")
+    assert await asyncio.wait_for(second_wait, timeout=1)
+    assert await config_manager.wait_for_config_deletion("second", timeout=0.05)
+    assert config_manager.deletion_events == {}
+    get_config.assert_not_called()
+
+    assert config_manager.deletion_listener_task is not None
+    config_manager.deletion_listener_task.cancel()
@@ -0,0 +1,58 @@
+import base64
+import json
+
+from vocode.streaming.telephony.twilio_media_codec import TwilioMediaEncoder, decode_twilio_message
+
+
+def test_encoded_messages_match_json():
+    encoder = TwilioMediaEncoder("MZ123")
+    chunk = bytes(range(256))
+
+    assert json.loads(encoder.encode_media(chunk)) == {
+        "event": "media",
+        "streamSid": "MZ123",
+        "media": {"payload": base64.b64encode(chunk).decode("utf-8")},
+    }
+    assert json.loads(encoder.encode_mark('chunk "1"')) == {
+        "event": "mark",
+        "streamSid": "MZ123",
+        "mark": {"name": 'chunk "1"'},
+    }
+    assert json.loads(encoder.encode_clear()) == {"event": "clear", "streamSid": "MZ123"}
+
+
+def test_decodes_twilio_messages():
+    chunk = b"\xff\x7f" * 80
+    media_message = json.dumps(
+        {
+            "event": "media",
+            "sequenceNumber": "3",
+            "media": {
+                "track": "inbound",
+                "chunk": "1",
+                "timestamp": "5",
+                "payload": base64.b64encode(chunk).decode("utf-8"),
+            },
+            "streamSid": "MZ123",
+        },
+        separators=(",", ":"),
+    )
+    twilio_message = decode_twilio_message(media_message)
+    assert twilio_message.event == "media"
+    assert twilio_message.payload == chunk
+    assert twilio_message.data is None
+
+    # messages the fast path doesn't recognize are parsed as JSON
+    twilio_message = decode_twilio_message(
+        json.dumps({"event": "media", "media": {"payload": "AAE="}})
+    )
+    assert twilio_message.payload == b"\x00\x01"
+    assert twilio_message.data is not None
+
+    mark_message = '{"event":"mark","sequenceNumber":"4","streamSid":"MZ123","mark":{"name":"abc"}}'
+    assert decode_twilio_message(mark_message).mark_name == "abc"
+    assert decode_twilio_message(TwilioMediaEncoder("MZ123").encode_mark('a"b')).mark_name == 'a"b'
+
+    stop_message = decode_twilio_message('{"event":"stop","streamSid":"MZ123","stop":{}}')
+    assert stop_message.event == "stop"
+    assert stop_message.data == {"event": "stop", "streamSid": "MZ123", "stop": {}}
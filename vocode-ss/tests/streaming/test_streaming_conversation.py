@@ -9,15 +9,22 @@ from pytest_mock import MockerFixture
 
 from tests.fakedata.conversation import (
     DEFAULT_CHAT_GPT_AGENT_CONFIG,
+    DEFAULT_SAMPLING_RATE,
     DummyOutputDevice,
     create_fake_agent,
     create_fake_streaming_conversation,
 )
 from tests.fixtures.synthesizer import TestSynthesizer, TestSynthesizerConfig
 from tests.fixtures.transcriber import TestAsyncTranscriber, TestTranscriberConfig
+from vocode.streaming.agent.base_agent import AgentResponseMessage
 from vocode.streaming.agent.echo_agent import EchoAgent
-from vocode.streaming.models.actions import ActionInput
-from vocode.streaming.models.agent import EchoAgentConfig, InterruptSensitivity
+from vocode.streaming.agent.speculation import Speculation
+from vocode.streaming.models.actions import ActionInput, EndOfTurn
+from vocode.streaming.models.agent import (
+    EchoAgentConfig,
+    InterruptSensitivity,
+    SpeculativeResponseConfig,
+)
 from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage
@@ -610,3 +617,242 @@ async def test_streaming_conversation_pipeline(
     assert initial_message_audio_chunk.data == b"Hi there"
     first_response_audio_chunk = await output_device.dummy_playback_queue.get()
     assert first_response_audio_chunk.data == b"test"
+
+
+class GatedTestSynthesizer(TestSynthesizer):
+    """Records create_speech calls and holds them until `release` is set."""
+
+    def __init__(self, synthesizer_config: TestSynthesizerConfig):
+        super().__init__(synthesizer_config)
+        self.calls: List[tuple] = []
+        self.release = asyncio.Event()
+
+    async def create_speech(
+        self,
+        message: BaseMessage,
+        chunk_size: int,
+        is_first_text_chunk: bool = False,
+        is_sole_text_chunk: bool = False,
+    ) -> SynthesisResult:
+        self.calls.append((message.text, is_first_text_chunk))
+        await self.release.wait()
+        return await self.create_speech_uncached(message, chunk_size)
+
+
+@pytest.mark.asyncio
+async def test_agent_responses_worker_synthesizes_ahead(mocker: MockerFixture):
+    synthesizer = GatedTestSynthesizer(
+        TestSynthesizerConfig(
+            sampling_rate=DEFAULT_SAMPLING_RATE,
+            audio_encoding=AudioEncoding.MULAW,
+            synthesis_lookahead=2,
+        )
+    )
+    streaming_conversation = create_fake_streaming_conversation(mocker, synthesizer=synthesizer)
+    agent_responses_worker = streaming_conversation.agent_responses_worker
+    agent_responses_worker_consumer = QueueConsumer()
+    agent_responses_worker.consumer = agent_responses_worker_consumer
+    agent_responses_worker.start()
+
+    factory = streaming_conversation.interruptible_event_factory
+    for text in ["One.", "Two.", "Three.", "Four."]:
+        agent_responses_worker.consume_nonblocking(
+            factory.create_interruptible_agent_response_event(
+                AgentResponseMessage(message=BaseMessage(text=text))
+            )
+        )
+    agent_responses_worker.consume_nonblocking(
+        factory.create_interruptible_agent_response_event(AgentResponseMessage(message=EndOfTurn()))
+    )
+    agent_responses_worker.consume_nonblocking(
+        factory.create_interruptible_agent_response_event(
+            AgentResponseMessage(message=BaseMessage(text="Next turn."))
+        )
+    )
+    await asyncio.sleep(0.01)
+    # the first message and the two after it are synthesized at the same time
+    assert synthesizer.calls == [("One.", True), ("Two.", False), ("Three.", False)]
+
+    synthesizer.release.set()
+    played = []
+    for _ in range(6):
+        event = await _get_from_consumer_queue_if_exists(agent_responses_worker_consumer)
+        played.append(event.payload[0])
+    assert [message.text for message in played if isinstance(message, BaseMessage)] == [
+        "One.",
+        "Two.",
+        "Three.",
+        "Four.",
+        "Next turn.",
+    ]
+    assert synthesizer.calls[-1] == ("Next turn.", True)
+    await agent_responses_worker.terminate()
+
+
+@pytest.mark.asyncio
+async def test_agent_responses_worker_cancels_lookahead_on_interrupt(mocker: MockerFixture):
+    synthesizer = GatedTestSynthesizer(
+        TestSynthesizerConfig(
+            sampling_rate=DEFAULT_SAMPLING_RATE,
+            audio_encoding=AudioEncoding.MULAW,
+            synthesis_lookahead=2,
+        )
+    )
+    streaming_conversation = create_fake_streaming_conversation(mocker, synthesizer=synthesizer)
+    agent_responses_worker = streaming_conversation.agent_responses_worker
+    agent_responses_worker.consumer = QueueConsumer()
+    agent_responses_worker.start()
+
+    for text in ["One.", "Two.", "Three."]:
+        agent_responses_worker.consume_nonblocking(
+            streaming_conversation.interruptible_event_factory.create_interruptible_agent_response_event(
+                AgentResponseMessage(message=BaseMessage(text=text))
+            )
+        )
+    await asyncio.sleep(0.01)
+    lookahead_tasks = list(agent_responses_worker.lookahead_speech.values())
+    assert len(lookahead_tasks) == 2
+
+    await streaming_conversation.broadcast_interrupt()
+    await asyncio.sleep(0.01)
+    assert all(task.cancelled() for task in lookahead_tasks)
+    assert not agent_responses_worker.lookahead_speech
+    await agent_responses_worker.terminate()
+
+
+async def _start_speculating_transcriptions_worker(mocker: MockerFixture):
+    streaming_conversation = create_fake_streaming_conversation(
+        mocker,
+        agent=create_fake_agent(
+            mocker,
+            DEFAULT_CHAT_GPT_AGENT_CONFIG.copy(
+                update={"speculative_response_config": SpeculativeResponseConfig()}
+            ),
+        ),
+    )
+    streaming_conversation.initial_message_tracker.set()
+    streaming_conversation.transcript.add_bot_message(
+        text="What can I do for you?", is_final=True, conversation_id="test"
+    )
+    transcriptions_worker_consumer = QueueConsumer()
+    streaming_conversation.transcriptions_worker.consumer = transcriptions_worker_consumer
+    streaming_conversation.transcriptions_worker.start()
+    for message in ["I'd like to", "I'd like to book", "I'd like to book"]:
+        streaming_conversation.transcriptions_worker.consume_nonblocking(
+            Transcription(message=message, confidence=1.0, is_final=False)
+        )
+    return streaming_conversation, transcriptions_worker_consumer
+
+
+@pytest.mark.asyncio
+async def test_transcriptions_worker_commits_speculation(mocker: MockerFixture):
+    streaming_conversation, transcriptions_worker_consumer = (
+        await _start_speculating_transcriptions_worker(mocker)
+    )
+    speculative_event = await _get_from_consumer_queue_if_exists(transcriptions_worker_consumer)
+    speculation = speculative_event.payload.speculation
+    assert speculative_event.payload.transcription.message == "I'd like to book"
+    assert speculation is not None
+
+    streaming_conversation.transcriptions_worker.consume_nonblocking(
+        Transcription(message="I'd like to book.", confidence=1.0, is_final=True)
+    )
+    assert await _get_from_consumer_queue_if_exists(transcriptions_worker_consumer) is None
+    assert speculation.is_committed
+    assert speculation.final_transcription.message == "I'd like to book."
+    assert not speculative_event.is_interrupted()
+    await streaming_conversation.transcriptions_worker.terminate()
+
+
+@pytest.mark.asyncio
+async def test_transcriptions_worker_discards_speculation(mocker: MockerFixture):
+    streaming_conversation, transcriptions_worker_consumer = (
+        await _start_speculating_transcriptions_worker(mocker)
+    )
+    speculative_event = await _get_from_consumer_queue_if_exists(transcriptions_worker_consumer)
+    speculation = speculative_event.payload.speculation
+
+    streaming_conversation.transcriptions_worker.consume_nonblocking(
+        Transcription(
+            message="I'd like to book a table for two tomorrow", confidence=1.0, is_final=True
+        )
+    )
+    transcription_agent_input = await _get_from_consumer_queue_if_exists(
+        transcriptions_worker_consumer
+    )
+    assert (
+        transcription_agent_input.payload.transcription.message
+        == "I'd like to book a table for two tomorrow"
+    )
+    assert transcription_agent_input.payload.speculation is None
+    assert speculation.is_decided and not speculation.is_committed
+    assert speculative_event.is_interrupted()
+    await streaming_conversation.transcriptions_worker.terminate()
+
+
+@pytest.mark.asyncio
+async def test_transcriptions_worker_prefetches_stable_interims(mocker: MockerFixture):
+    streaming_conversation = create_fake_streaming_conversation(mocker)
+    streaming_conversation.initial_message_tracker.set()
+    transcriptions_worker_consumer = QueueConsumer()
+    streaming_conversation.transcriptions_worker.consumer = transcriptions_worker_consumer
+    streaming_conversation.transcriptions_worker.start()
+    for message in [
+        "What are",
+        "What are your hours",
+        "What are your hours",
+        "What are your hours",
+    ]:
+        streaming_conversation.transcriptions_worker.consume_nonblocking(
+            Transcription(message=message, confidence=1.0, is_final=False)
+        )
+    # without a speculative response config, the agent only prefetches, once
+    assert await _get_from_consumer_queue_if_exists(transcriptions_worker_consumer) is None
+    streaming_conversation.agent.prefetch.assert_called_once()
+    assert streaming_conversation.agent.prefetch.call_args.args[0].message == "What are your hours"
+    await streaming_conversation.transcriptions_worker.terminate()
+
+
+@pytest.mark.asyncio
+async def test_agent_responses_worker_holds_speculative_responses(mocker: MockerFixture):
+    synthesizer = GatedTestSynthesizer(
+        TestSynthesizerConfig(
+            sampling_rate=DEFAULT_SAMPLING_RATE, audio_encoding=AudioEncoding.MULAW
+        )
+    )
+    synthesizer.release.set()
+    streaming_conversation = create_fake_streaming_conversation(mocker, synthesizer=synthesizer)
+    agent_responses_worker = streaming_conversation.agent_responses_worker
+    agent_responses_worker_consumer = QueueConsumer()
+    agent_responses_worker.consumer = agent_responses_worker_consumer
+    agent_responses_worker.start()
+    factory = streaming_conversation.interruptible_event_factory
+
+    def send_response(text: str, speculation: Speculation):
+        event = factory.create_interruptible_agent_response_event(
+            AgentResponseMessage(message=BaseMessage(text=text), speculation=speculation)
+        )
+        agent_responses_worker.consume_nonblocking(event)
+        return event
+
+    transcription = Transcription(message="I'd like to book", confidence=1.0, is_final=False)
+    discarded_speculation = Speculation(transcription)
+    discarded_event = send_response("Which day?", discarded_speculation)
+    await asyncio.sleep(0.01)
+    # the first sentence is synthesized, but not played
+    assert synthesizer.calls == [("Which day?", True)]
+    assert await _get_from_consumer_queue_if_exists(agent_responses_worker_consumer) is None
+
+    discarded_speculation.discard()
+    await asyncio.sleep(0.01)
+    assert discarded_event.agent_response_tracker.is_set()
+    assert await _get_from_consumer_queue_if_exists(agent_responses_worker_consumer) is None
+
+    committed_speculation = Speculation(transcription)
+    send_response("For how many people?", committed_speculation)
+    await asyncio.sleep(0.01)
+    assert await _get_from_consumer_queue_if_exists(agent_responses_worker_consumer) is None
+    committed_speculation.commit(transcription)
+    event = await _get_from_consumer_queue_if_exists(agent_responses_worker_consumer)
+    assert event.payload[0].text == "For how many people?"
+    await agent_responses_worker.terminate()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from vocode.streaming.utils import dsp
+
+ALL_SAMPLES = np.arange(-32768, 32768, dtype=np.int16)
+ALL_CODES = bytes(range(256))
+
+
+def create_signal(sampling_rate: int, seconds: float = 0.5) -> np.ndarray:
+    t = np.arange(int(sampling_rate * seconds)) / sampling_rate
+    noise = np.random.default_rng(0).standard_normal(len(t))
+    return (8000 * np.sin(2 * np.pi * 440 * t) + 2000 * noise).astype(np.int16)
+
+
+def test_companding_round_trip():
+    assert dsp.lin2ulaw(np.zeros(1, dtype=np.int16).tobytes()) == b"\xff"
+    assert dsp.lin2alaw(np.zeros(1, dtype=np.int16).tobytes()) == b"\xd5"
+    samples = ALL_SAMPLES.astype(np.int32)
+    for encode, decode in [(dsp.ulaw_encode, dsp.ulaw_decode), (dsp.alaw_encode, dsp.alaw_decode)]:
+        decoded = decode(encode(ALL_SAMPLES)).astype(np.int32)
+        # G.711 keeps about 4% relative precision
+        assert np.all(np.abs(decoded - samples) <= np.abs(samples) * 0.04 + 16)
+
+
+def test_matches_audioop():
+    audioop = pytest.importorskip("audioop")
+    pcm = ALL_SAMPLES.tobytes()
+    assert dsp.lin2ulaw(pcm) == audioop.lin2ulaw(pcm, 2)
+    assert dsp.lin2alaw(pcm) == audioop.lin2alaw(pcm, 2)
+    assert dsp.ulaw2lin(ALL_CODES) == audioop.ulaw2lin(ALL_CODES, 2)
+    assert dsp.alaw2lin(ALL_CODES) == audioop.alaw2lin(ALL_CODES, 2)
+    assert dsp.ulaw2lin(ALL_CODES, 1) == audioop.ulaw2lin(ALL_CODES, 1)
+
+    signal = create_signal(24000).tobytes()
+    expected, _ = audioop.ratecv(signal, 2, 1, 24000, 8000, None)
+    assert dsp.resample(signal, 24000, 8000) == expected
+
+
+@pytest.mark.parametrize(
+    "input_rate,output_rate", [(24000, 8000), (8000, 16000), (44100, 8000), (22050, 16000)]
+)
+def test_resampler_is_independent_of_chunking(input_rate, output_rate):
+    signal = create_signal(input_rate)
+    whole = dsp.resample(signal.tobytes(), input_rate, output_rate)
+    assert len(whole) // 2 == pytest.approx(len(signal) * output_rate / input_rate, abs=1)
+
+    for chunk_size in [1, 160, 333]:
+        resampler = dsp.Resampler(input_rate, output_rate)
+        chunked = b"".join(
+            resampler.process(signal[i : i + chunk_size].tobytes())
+            for i in range(0, len(signal), chunk_size)
+        )
+        assert chunked == whole
+
+
+def test_gain_and_mix_clip():
+    samples = np.array([20000, -20000, 100], dtype=np.int16)
+    assert dsp.apply_gain(samples, 2).tolist() == [32767, -32768, 200]
+    assert dsp.apply_gain(samples, 0.5).tolist() == [10000, -10000, 50]
+    assert dsp.mix(samples, np.array([20000], dtype=np.int16)).tolist() == [32767, -20000, 100]
@@ -3,7 +3,8 @@ import asyncio
 import pytest
 
 from vocode.streaming.models.events import EventType, PhoneCallEndedEvent
-from vocode.streaming.utils.events_manager import EventsManager
+from vocode.streaming.utils.events_manager import EventQueueOverflowPolicy, EventsManager
+from vocode.streaming.utils.metrics import counter
 
 CONVERSATION_ID = "1"
 
@@ -50,6 +51,23 @@ async def test_handle_event_non_async_override(mocker):
     )
 
 
+@pytest.mark.asyncio
+async def test_handler_type_error_is_logged(mocker):
+    event = PhoneCallEndedEvent(conversation_id=CONVERSATION_ID, type=EventType.PHONE_CALL_ENDED)
+    manager = EventsManager([EventType.PHONE_CALL_ENDED])
+    manager.publish_event(event)
+    manager.publish_event(event)
+
+    async def handle_event(event):
+        raise TypeError("unsupported operand")
+
+    exception_logger_mock = mocker.patch("vocode.streaming.utils.events_manager.logger.exception")
+    manager.handle_event = handle_event
+    await manager.flush()
+    assert manager.queue.empty()
+    assert exception_logger_mock.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_start_and_active_loop():
     event = PhoneCallEndedEvent(
@@ -77,3 +95,56 @@ async def test_queue_empty_and_timeout():
     manager = EventsManager([EventType.TRANSCRIPT])
     await manager.flush()
     assert manager.queue.empty()
+
+
+def create_events(count):
+    return [
+        PhoneCallEndedEvent(conversation_id=str(i), type=EventType.PHONE_CALL_ENDED)
+        for i in range(count)
+    ]
+
+
+class RecordingEventsManager(EventsManager):
+    def __init__(self, **kwargs):
+        super().__init__([EventType.PHONE_CALL_ENDED], **kwargs)
+        self.batches = []
+
+    async def handle_events(self, events):
+        self.batches.append([event.conversation_id for event in events])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overflow_policy,expected",
+    [
+        (EventQueueOverflowPolicy.DROP_OLDEST, ["2", "3", "4"]),
+        (EventQueueOverflowPolicy.DROP_NEWEST, ["0", "1", "2"]),
+    ],
+)
+async def test_bounded_queue_overflow(overflow_policy, expected):
+    manager = RecordingEventsManager(
+        max_queue_size=3, overflow_policy=overflow_policy, max_batch_size=10
+    )
+    dropped = counter("events.dropped").snapshot()
+    for event in create_events(5):
+        manager.publish_event(event)
+    assert counter("events.dropped").snapshot() == dropped + 2
+    await manager.flush()
+    assert manager.batches == [expected]
+
+
+@pytest.mark.asyncio
+async def test_workers_handle_batches_concurrently():
+    class SlowEventsManager(RecordingEventsManager):
+        async def handle_events(self, events):
+            await asyncio.sleep(0.05)
+            await super().handle_events(events)
+
+    manager = SlowEventsManager(num_workers=2, max_batch_size=2)
+    for event in create_events(4):
+        manager.publish_event(event)
+    start_task = asyncio.create_task(manager.start())
+    await asyncio.sleep(0.08)
+    assert sorted(manager.batches) == [["0", "1"], ["2", "3"]]
+    start_task.cancel()
+    await asyncio.gather(start_task, return_exceptions=True)
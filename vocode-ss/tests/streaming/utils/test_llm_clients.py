@@ -0,0 +1,84 @@
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from vocode.streaming.utils.llm_clients import LLMClientRegistry, MeteredTransport
+from vocode.streaming.utils.metrics import get_metrics_snapshot
+from vocode.streaming.utils.singleton import Singleton
+
+
+@pytest.fixture(autouse=True)
+def cleanup_singleton_llm_client_registry():
+    if LLMClientRegistry in Singleton._instances:
+        del Singleton._instances[LLMClientRegistry]
+    yield
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_by_key():
+    registry = LLMClientRegistry()
+    client = registry.get_openai_client(api_key="key")
+    assert registry.get_openai_client(api_key="key") is client
+    assert registry.get_openai_client(api_key="other key") is not client
+    assert registry.get_openai_client(api_key="key", max_retries=0) is not client
+
+    groq_client = registry.get_openai_client(
+        api_key="key", base_url="https://api.groq.com/openai/v1"
+    )
+    assert str(groq_client.base_url) == "https://api.groq.com/openai/v1/"
+    azure_client = registry.get_azure_openai_client(
+        azure_endpoint="https://example.openai.azure.com", api_key="key", api_version="2024-02-01"
+    )
+    assert azure_client is not registry.get_azure_openai_client(
+        azure_endpoint="https://example.openai.azure.com", api_key="key", api_version="2024-06-01"
+    )
+
+    # one HTTP/2 connection pool per endpoint
+    assert groq_client._client is not client._client
+    assert all(transport._pool._http2 for transport in registry.transports.values())
+    assert registry.get_openai_client(api_key="other key")._client is client._client
+    assert set(registry.get_pool_stats()) == {
+        "https://api.openai.com/",
+        "https://api.groq.com/",
+        "https://example.openai.azure.com/",
+    }
+
+    await registry.close()
+    assert client._client.is_closed
+    assert registry.get_openai_client(api_key="key") is not client
+
+
+@pytest.mark.asyncio
+async def test_requests_in_flight_until_response_is_closed(mocker: MockerFixture):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        mocker.AsyncMock(
+            side_effect=lambda request: httpx.Response(
+                200, stream=httpx.ByteStream(b"data: {}\n\n"), request=request
+            )
+        ),
+    )
+    transport = MeteredTransport()
+    before = get_metrics_snapshot("llm.http.")["llm.http.requests_in_flight"]
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        async with http_client.stream("POST", "https://api.openai.com/v1/chat/completions") as r:
+            assert transport.requests_in_flight == 1
+            assert get_metrics_snapshot("llm.http.")["llm.http.requests_in_flight"] == before + 1
+            assert [chunk async for chunk in r.aiter_bytes()] == [b"data: {}\n\n"]
+        assert transport.requests_in_flight == 0
+        assert get_metrics_snapshot("llm.http.")["llm.http.requests_in_flight"] == before
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_in_flight(mocker: MockerFixture):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        mocker.AsyncMock(side_effect=httpx.ConnectError("refused")),
+    )
+    transport = MeteredTransport()
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        with pytest.raises(httpx.ConnectError):
+            await http_client.get("https://api.openai.com/v1/models")
+    assert transport.requests_in_flight == 0
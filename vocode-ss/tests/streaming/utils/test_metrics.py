@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+import pytest
+
+from vocode.streaming.utils.event_loop_monitor import EventLoopLagMonitor
+from vocode.streaming.utils.metrics import counter, gauge, get_metrics_snapshot, timing
+
+
+def test_metrics_are_shared_by_name():
+    counter("test_metrics.counter").inc()
+    counter("test_metrics.counter").inc(2)
+    gauge("test_metrics.gauge").set(5)
+    gauge("test_metrics.gauge").dec()
+    timing("test_metrics.timing").observe(0.5)
+    timing("test_metrics.timing").observe(1.5)
+
+    snapshot = get_metrics_snapshot("test_metrics.")
+    assert snapshot["test_metrics.counter"] == 3
+    assert snapshot["test_metrics.gauge"] == 4
+    assert snapshot["test_metrics.timing"] == {"count": 2, "total": 2.0, "mean": 1.0, "max": 1.5}
+
+
+def test_metric_type_mismatch():
+    counter("test_metrics.mismatch")
+    with pytest.raises(ValueError):
+        timing("test_metrics.mismatch")
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_records_blocking():
+    monitor = EventLoopLagMonitor(interval_seconds=0.01, blocking_threshold_seconds=0.05)
+    blocked_before = monitor.blocked_seconds.value
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.2)  # block the event loop
+    await asyncio.sleep(0.02)
+    await monitor.terminate()
+
+    assert monitor.blocked_seconds.value - blocked_before >= 0.1
+    assert monitor.lag_timing.max >= 0.1
@@ -0,0 +1,33 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from vocode.streaming.utils.redis import (
+    RedisPoolRegistry,
+    get_many,
+    initialize_redis,
+    initialize_redis_bytes,
+    set_many_with_ttl,
+    set_with_ttl,
+)
+
+
+def test_clients_share_pools_by_options():
+    assert initialize_redis().connection_pool is initialize_redis().connection_pool
+    assert initialize_redis_bytes().connection_pool is initialize_redis_bytes().connection_pool
+    assert initialize_redis().connection_pool is not initialize_redis_bytes().connection_pool
+    assert initialize_redis().connection_pool is not initialize_redis(retries=3).connection_pool
+    assert initialize_redis_bytes().connection_pool in RedisPoolRegistry().pools.values()
+
+
+@pytest.mark.asyncio
+async def test_multi_key_helpers():
+    redis = FakeAsyncRedis(decode_responses=True)
+
+    await set_with_ttl(redis, "a", "1", 60)
+    await set_many_with_ttl(redis, {"b": "2", "c": "3"}, 120)
+    await set_many_with_ttl(redis, {}, 120)
+
+    assert await get_many(redis, ["a", "b", "missing", "c"]) == ["1", "2", None, "3"]
+    assert await get_many(redis, []) == []
+    assert 0 < await redis.ttl("a") <= 60
+    assert 60 < await redis.ttl("c") <= 120
@@ -0,0 +1,28 @@
+import pytest
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.utils.dtmf_utils import DTMFToneGenerator, KeypadEntry
+from vocode.streaming.utils.silence import get_silent_chunk
+
+
+def test_silent_chunks_are_shared():
+    assert get_silent_chunk(AudioEncoding.MULAW, 160) == b"\xff" * 160
+    assert get_silent_chunk(AudioEncoding.LINEAR16, 320) == b"\x00" * 320
+    assert get_silent_chunk(AudioEncoding.MULAW, 160) is get_silent_chunk(AudioEncoding.MULAW, 160)
+    with pytest.raises(ValueError):
+        get_silent_chunk("unknown", 160)
+
+
+def test_dtmf_tones_are_cached_per_duration():
+    tone_generator = DTMFToneGenerator()
+    short_tone = tone_generator.generate(
+        KeypadEntry.ONE, 8000, AudioEncoding.MULAW, duration_seconds=0.1, silence_seconds=0
+    )
+    long_tone = tone_generator.generate(
+        KeypadEntry.ONE, 8000, AudioEncoding.MULAW, duration_seconds=0.2, silence_seconds=0
+    )
+    assert len(short_tone) == 800
+    assert len(long_tone) == 1600
+    assert short_tone is tone_generator.generate(
+        KeypadEntry.ONE, 8000, AudioEncoding.MULAW, duration_seconds=0.1, silence_seconds=0
+    )
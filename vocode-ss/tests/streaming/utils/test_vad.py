@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.models.transcriber import DeepgramTranscriberConfig, VADConfig
+from vocode.streaming.transcriber.deepgram_transcriber import (
+    DeepgramTranscriber,
+    DeepgramTranscriptionResult,
+)
+from vocode.streaming.utils import dsp
+from vocode.streaming.utils.vad import EnergyVAD, SilenceGate, chunk_energy
+
+SAMPLING_RATE = 8000
+CHUNK_SIZE = 160  # 20ms of 8kHz mulaw
+
+
+def make_chunk(amplitude: float, seed: int = 0) -> bytes:
+    samples = np.random.default_rng(seed).normal(0, amplitude, CHUNK_SIZE)
+    return dsp.lin2ulaw(np.clip(samples, -32768, 32767).astype(np.int16).tobytes())
+
+
+NOISE = make_chunk(30)
+SPEECH = make_chunk(3000)
+
+
+def feed(vad: EnergyVAD, chunk: bytes, seconds: float):
+    for _ in range(round(seconds / 0.02)):
+        vad.process(chunk)
+
+
+def test_chunk_energy_matches_decoded_samples():
+    samples = dsp.pcm16_view(dsp.ulaw2lin(SPEECH)).astype(np.float64)
+    assert chunk_energy(SPEECH, AudioEncoding.MULAW) == pytest.approx(np.mean(samples**2))
+    linear = dsp.ulaw2lin(SPEECH)
+    assert chunk_energy(linear, AudioEncoding.LINEAR16) == pytest.approx(np.mean(samples**2))
+    assert chunk_energy(b"", AudioEncoding.MULAW) == 0.0
+
+
+def test_vad_tracks_speech_and_silence():
+    vad = EnergyVAD(AudioEncoding.MULAW, SAMPLING_RATE, VADConfig(hangover_seconds=0.1))
+    feed(vad, NOISE, 1)
+    assert not vad.is_speech
+    assert vad.speech_seconds == 0
+
+    feed(vad, SPEECH, 0.5)
+    assert vad.is_speech
+    assert vad.speech_seconds == pytest.approx(0.5)
+    assert vad.silence_seconds == 0
+
+    feed(vad, NOISE, 0.1)
+    assert vad.is_speech  # hangover
+    feed(vad, NOISE, 0.3)
+    assert not vad.is_speech
+    assert vad.silence_seconds == pytest.approx(0.4)
+
+
+def test_silence_gate_thins_silence_and_keeps_pre_roll():
+    config = VADConfig(
+        gate_silence=True,
+        forward_silence_seconds=0.2,
+        keepalive_interval_seconds=0.5,
+        pre_roll_seconds=0.04,
+    )
+    gate = SilenceGate(EnergyVAD(AudioEncoding.MULAW, SAMPLING_RATE, config))
+    forwarded = [gate.filter(SPEECH) for _ in range(10)]
+    assert all(chunks == [SPEECH] for chunks in forwarded)
+
+    forwarded = [gate.filter(make_chunk(30, seed)) for seed in range(100)]
+    # 0.2s of silence after speech, then one chunk every 0.5s
+    assert sum(len(chunks) for chunks in forwarded) == 10 + 3
+
+    assert gate.filter(SPEECH) == [make_chunk(30, 98), make_chunk(30, 99), SPEECH]
+
+
+def test_deepgram_endpointing_uses_local_silence():
+    transcriber = DeepgramTranscriber(
+        DeepgramTranscriberConfig(
+            sampling_rate=SAMPLING_RATE,
+            audio_encoding=AudioEncoding.MULAW,
+            chunk_size=CHUNK_SIZE,
+            api_key="test",
+            vad_config=VADConfig(),
+        )
+    )
+    response = DeepgramTranscriptionResult(
+        is_final=True,
+        speech_final=False,
+        top_choice={"transcript": "", "confidence": 0.0, "words": []},
+        start=1.0,
+        duration=0.1,
+    )
+    assert transcriber.vad is not None
+    feed(transcriber.vad, SPEECH, 0.5)
+    feed(transcriber.vad, NOISE, 1.0)
+    assert transcriber.get_time_silent(0.2, response) == pytest.approx(0.9)
+    assert transcriber.get_time_silent(1.5, response) == 1.5
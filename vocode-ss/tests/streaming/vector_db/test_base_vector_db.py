@@ -0,0 +1,80 @@
+import asyncio
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from vocode.streaming.vector_db import base_vector_db
+from vocode.streaming.vector_db.base_vector_db import VectorDB, normalize_query
+
+
+class FakeVectorDB(VectorDB):
+    def __init__(self):
+        super().__init__()
+        self.queries: List[str] = []
+
+    async def similarity_search_with_score(self, query, filter=None, namespace=None):
+        self.queries.append(query)
+        await asyncio.sleep(0.01)
+        if query == "fail":
+            raise ValueError("search failed")
+        return [(query, 1.0)]
+
+
+def create_vector_db(mocker: MockerFixture) -> FakeVectorDB:
+    mocker.patch.dict(
+        "os.environ", {"OPENAI_API_KEY": "test", "AZURE_OPENAI_TEXT_EMBEDDING_ENGINE": ""}
+    )
+    return FakeVectorDB()
+
+
+def test_normalize_query():
+    assert normalize_query("  What are your HOURS? ") == "what are your hours"
+    assert normalize_query("I'd like to book.") == "i'd like to book"
+
+
+@pytest.mark.asyncio
+async def test_searches_are_shared_and_cached(mocker: MockerFixture):
+    vector_db = create_vector_db(mocker)
+    prefetch = vector_db.start_search("What are your hours")
+    results = await asyncio.shield(vector_db.start_search("what are your hours?"))
+    assert results == [("What are your hours", 1.0)]
+    assert await prefetch is results
+    assert await vector_db.start_search("What are your hours.") is results
+    assert await vector_db.start_search("What are your hours", namespace="other") is not results
+    assert vector_db.queries == ["What are your hours", "What are your hours"]
+    await vector_db.tear_down()
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_not_cached(mocker: MockerFixture):
+    vector_db = create_vector_db(mocker)
+    vector_db.start_search("fail")
+    await asyncio.sleep(0.02)
+    with pytest.raises(ValueError):
+        await vector_db.start_search("fail")
+    assert vector_db.queries == ["fail", "fail"]
+    await vector_db.tear_down()
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_batched_and_query_embeddings_cached(mocker: MockerFixture):
+    vector_db = create_vector_db(mocker)
+    mocker.patch.object(base_vector_db, "query_embeddings", base_vector_db.LRUCache(max_size=8))
+    create = mocker.patch.object(
+        vector_db.openai_client.embeddings,
+        "create",
+        mocker.AsyncMock(
+            side_effect=lambda input, model: mocker.MagicMock(
+                data=[
+                    mocker.MagicMock(index=index, embedding=[float(index)])
+                    for index in reversed(range(len(input)))
+                ]
+            )
+        ),
+    )
+    assert await vector_db.create_openai_embeddings(["a", "b", "c"]) == [[0.0], [1.0], [2.0]]
+    assert await vector_db.create_openai_embedding("Hello there") == [0.0]
+    assert await vector_db.create_openai_embedding("hello, there!") == [0.0]
+    assert create.call_count == 2
+    await vector_db.tear_down()
@@ -1,28 +1,36 @@
-from vocode.streaming.agent.openai_utils import merge_event_logs
-from vocode.streaming.models.transcript import ActionStart, EventLog, Transcript
+from vocode.streaming.models.transcript import ActionStart, EventLog, Message, Transcript
 
+ANTHROPIC_TRANSCRIPT_LINES_VIEW = "anthropic_transcript_lines"
 
-def format_anthropic_chat_messages_from_transcript(
-    transcript: Transcript,
-) -> list[dict]:
-    # merge consecutive bot messages
-    new_event_logs: list[EventLog] = merge_event_logs(event_logs=transcript.event_logs)
 
+def event_log_to_anthropic_transcript_lines(event_log: EventLog) -> list[str]:
     # Removing BOT_ACTION_START so that it doesn't confuse the completion-y prompt, e.g.
     # BOT: BOT_ACTION_START: action_end_conversation
     # Right now, this version of context does not work for normal actions, only phrase trigger actions
+    if isinstance(event_log, ActionStart):
+        return []
+    if isinstance(event_log, Message):
+        return [
+            event_log.to_string(
+                include_timestamp=False,
+                mark_human_backchannels_with_brackets=True,
+            )
+        ]
+    return [event_log.to_string(include_timestamp=False)]
 
-    merged_event_logs_sans_bot_action_start = [
-        event_log for event_log in new_event_logs if not isinstance(event_log, ActionStart)
-    ]
+
+def format_anthropic_chat_messages_from_transcript(
+    transcript: Transcript,
+) -> list[dict]:
+    # consecutive bot messages are merged
+    transcript_lines: list[str] = transcript.get_converted_event_logs(
+        ANTHROPIC_TRANSCRIPT_LINES_VIEW, event_log_to_anthropic_transcript_lines
+    )
 
     return [
         {
             "role": "user",
-            "content": Transcript(event_logs=merged_event_logs_sans_bot_action_start).to_string(
-                include_timestamps=False,
-                mark_human_backchannels_with_brackets=True,
-            ),
+            "content": "\n".join(transcript_lines),
         },
         {"role": "assistant", "content": "BOT:"},
     ]
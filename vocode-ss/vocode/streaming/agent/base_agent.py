@@ -22,6 +22,7 @@ from vocode.streaming.action.phone_call_action import (
 )
 from vocode.streaming.agent.goodbye import is_goodbye_simple
 from vocode.streaming.agent.phrase_trigger import matches_phrase_trigger
+from vocode.streaming.agent.speculation import Speculation
 from vocode.streaming.models.actions import (
     ActionConfig,
     ActionInput,
@@ -73,6 +74,8 @@ class AgentInput(TypedModel, type=AgentInputType.BASE.value):  # type: ignore
     vonage_uuid: Optional[str]
     twilio_sid: Optional[str]
     agent_response_tracker: Optional[asyncio.Event] = None
+    # set when responding to an interim transcription, see vocode.streaming.agent.speculation
+    speculation: Optional[Speculation] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -96,7 +99,11 @@ class AgentResponseType(str, Enum):
 
 
 class AgentResponse(TypedModel, type=AgentResponseType.BASE.value):  # type: ignore
-    pass
+    # responses to a speculative input are held back until the speculation is committed
+    speculation: Optional[Speculation] = None
+
+    class Config:
+        arbitrary_types_allowed = True
 
 
 class AgentResponseMessage(AgentResponse, type=AgentResponseType.MESSAGE.value):  # type: ignore
@@ -220,8 +227,20 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
 
         return num_bot_messages <= (1 if self.agent_config.initial_message is not None else 0)
 
+    def supports_speculative_responses(self) -> bool:
+        """Whether the agent can respond to a `TranscriptionAgentInput` with a `speculation`."""
+        return False
+
+    def prefetch(self, transcription: Transcription):
+        """Called with an interim transcription that has stopped changing, before the final one
+        arrives, so the agent can start lookups its response will need."""
+        pass
+
 
 class RespondAgent(BaseAgent[AgentConfigType]):
+    def supports_speculative_responses(self) -> bool:
+        return self.agent_config.generate_responses
+
     async def _maybe_prepend_interrupt_responses(
         self,
         transcription: Transcription,
@@ -297,6 +316,7 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                     AgentResponseMessage(
                         message=generated_response.message,
                         is_first=is_first_response_of_turn,
+                        speculation=agent_input.speculation,
                     ),
                     is_interruptible=self.agent_config.allow_agent_to_be_cut_off
                     and generated_response.is_interruptible,
@@ -330,12 +350,17 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                     AgentResponseMessage(
                         message=EndOfTurn(),
                         is_first=is_first_response_of_turn,
+                        speculation=agent_input.speculation,
                     ),
                     is_interruptible=self.agent_config.allow_agent_to_be_cut_off,
                     agent_response_tracker=end_of_turn_agent_response_tracker,
                 ),
             )
 
+        # actions can't be undone, so a speculative response waits to be committed
+        if agent_input.speculation is not None and not await agent_input.speculation.wait():
+            return False
+
         phrase_trigger_match_action_config = (
             matches_phrase_trigger(responses_buffer, self.agent_config.actions)
             if self.agent_config.actions
@@ -391,10 +416,15 @@ class RespondAgent(BaseAgent[AgentConfigType]):
             agent_input = item.payload
             if isinstance(agent_input, TranscriptionAgentInput):
                 transcription = typing.cast(TranscriptionAgentInput, agent_input).transcription
-                self.transcript.add_human_message(
-                    text=transcription.message,
-                    conversation_id=agent_input.conversation_id,
-                )
+                if agent_input.speculation is not None:
+                    transcription = agent_input.speculation.add_human_message(
+                        self.transcript, agent_input.conversation_id
+                    )
+                else:
+                    self.transcript.add_human_message(
+                        text=transcription.message,
+                        conversation_id=agent_input.conversation_id,
+                    )
             elif isinstance(agent_input, ActionResultAgentInput):
                 self.transcript.add_action_finish_log(
                     action_input=agent_input.action_input,
@@ -433,7 +463,8 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                 logger.debug("Agent is muted, skipping processing")
                 return
 
-            if self.agent_config.send_filler_audio:
+            # a committed speculation doesn't keep the caller waiting
+            if self.agent_config.send_filler_audio and agent_input.speculation is None:
                 self.agent_responses_consumer.consume_nonblocking(
                     self.interruptible_event_factory.create_interruptible_agent_response_event(
                         AgentResponseFillerAudio(),
@@ -457,7 +488,7 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                 logger.debug("Agent requested to stop")
                 self.agent_responses_consumer.consume_nonblocking(
                     self.interruptible_event_factory.create_interruptible_agent_response_event(
-                        AgentResponseStop(),
+                        AgentResponseStop(speculation=agent_input.speculation),
                     )
                 )
                 return
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import random
 from typing import Any, AsyncGenerator, Dict, List, Optional, TypeVar, Union
@@ -16,23 +17,34 @@ from vocode.streaming.agent.openai_utils import (
     openai_get_tokens,
     vector_db_result_to_openai_chat_message,
 )
-from vocode.streaming.agent.streaming_utils import collate_response_async, stream_response_async
+from vocode.streaming.agent.streaming_utils import segment_response_async, stream_response_async
+from vocode.streaming.agent.token_utils import TokenLedger
 from vocode.streaming.models.actions import FunctionCallActionTrigger
 from vocode.streaming.models.agent import ChatGPTAgentConfig
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage, BotBackchannel, LLMToken
+from vocode.streaming.models.transcriber import Transcription
 from vocode.streaming.models.transcript import Message
+from vocode.streaming.utils.llm_clients import (
+    OPENAI_DEFAULT_BASE_URL,
+    get_azure_openai_client,
+    get_openai_client,
+)
+from vocode.streaming.utils.metrics import timing
 from vocode.streaming.vector_db.factory import VectorDBFactory
 from vocode.utils.sentry_utils import CustomSentrySpans, sentry_create_span
 from agent_config import AgentConfig
-from call_config import CallConfig
+from call_config import CallConfig, CallState
 
 ChatGPTAgentConfigType = TypeVar("ChatGPTAgentConfigType", bound=ChatGPTAgentConfig)
 
+# how long responses waited for retrieval, after the prompt was formatted
+retrieval_wait = timing("agent.vector_db.retrieval_wait")
+
 
 def instantiate_openai_client(agent_config: ChatGPTAgentConfig, model_fallback: bool = False):
     if agent_config.azure_params:
-        return AsyncAzureOpenAI(
+        return get_azure_openai_client(
             azure_endpoint=agent_config.azure_params.base_url,
             api_key=agent_config.azure_params.api_key,
             api_version=agent_config.azure_params.api_version,
@@ -43,9 +55,9 @@ def instantiate_openai_client(agent_config: ChatGPTAgentConfig, model_fallback:
             logger.info("Using OpenAI API key override")
         if agent_config.base_url_override is not None:
             logger.info(f"Using OpenAI base URL override: {agent_config.base_url_override}")
-        return AsyncOpenAI(
+        return get_openai_client(
             api_key=agent_config.openai_api_key or os.environ["OPENAI_API_KEY"],
-            base_url=agent_config.base_url_override or "https://api.openai.com/v1",
+            base_url=agent_config.base_url_override or OPENAI_DEFAULT_BASE_URL,
             max_retries=0 if model_fallback else OPENAI_DEFAULT_MAX_RETRIES,
         )
 
@@ -71,9 +83,12 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
 
         if not self.openai_client.api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
+        self.token_ledger = TokenLedger()
 
         if self.agent_config.vector_db_config:
             self.vector_db = vector_db_factory.create_vector_db(self.agent_config.vector_db_config)
+        # created on the first response, once the conversation id is known
+        self.call_state: Optional[CallState] = None
 
     def get_functions(self):
         assert self.agent_config.actions
@@ -94,6 +109,7 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
             self.get_model_name_for_tokenizer(),
             self.functions,
             self.agent_config.prompt_preamble,
+            token_ledger=self.token_ledger,
         )
 
         parameters: Dict[str, Any] = {
@@ -162,6 +178,10 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
             stream = await self.openai_client.chat.completions.create(**chat_parameters)
         return stream
 
+    def prefetch(self, transcription: Transcription):
+        if self.agent_config.vector_db_config:
+            self.vector_db.start_search(transcription.message)
+
     def should_backchannel(self, human_input: str) -> bool:
         return (
             not self.is_first_response()
@@ -193,9 +213,18 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
         chat_parameters = {}
         if self.agent_config.vector_db_config:
             try:
-                docs_with_scores = await self.vector_db.similarity_search_with_score(
-                    self.transcript.get_last_user_message()[1]
+                # started before the prompt is formatted, if prefetch hasn't already started it
+                # on an interim transcription
+                search = self.vector_db.start_search(self.transcript.get_last_user_message()[1])
+                messages = format_openai_chat_messages_from_transcript(
+                    self.transcript,
+                    self.agent_config.model_name,
+                    self.functions,
+                    self.agent_config.prompt_preamble,
+                    token_ledger=self.token_ledger,
                 )
+                with retrieval_wait.time():
+                    docs_with_scores = await asyncio.shield(search)
                 docs_with_scores_str = "\n\n".join(
                     [
                         "Document: "
@@ -208,12 +237,6 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
                 vector_db_result = (
                     f"Found {len(docs_with_scores)} similar documents:\n{docs_with_scores_str}"
                 )
-                messages = format_openai_chat_messages_from_transcript(
-                    self.transcript,
-                    self.agent_config.model_name,
-                    self.functions,
-                    self.agent_config.prompt_preamble,
-                )
                 messages.insert(-1, vector_db_result_to_openai_chat_message(vector_db_result))
                 chat_parameters = self.get_chat_parameters(messages)
             except Exception as e:
@@ -260,14 +283,23 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
         )
 
         #stream = await self._create_openai_stream(chat_parameters)
-        first_sentence, stream, _ = await AgentConfig().chat_completion(human_input, CallConfig().get_call_metadata())
+        if self.call_state is None:
+            self.call_state = CallState(
+                thread_id=conversation_id, language=self.agent_config.language
+            )
+        # scopes CallConfig() reads in the graph to this conversation
+        CallConfig().set_call_state(self.call_state)
+        first_sentence, stream, _ = await AgentConfig().chat_completion(
+            human_input, self.call_state.call_metadata
+        )
 
         if isinstance(first_sentence, str):
             yield StreamedResponse(message=LLMToken(text=first_sentence), is_interruptible=True)
         else: 
             yield StreamedResponse(message=first_sentence, is_interruptible=True)
 
-        response_generator = collate_response_async
+        # the graph already streams whole sentences, pass each on as soon as it arrives
+        response_generator = segment_response_async
         using_input_streaming_synthesizer = (
             self.conversation_state_manager.using_input_streaming_synthesizer()
         )
@@ -300,4 +332,10 @@ class ChatGPTAgent(RespondAgent[ChatGPTAgentConfigType]):
     async def terminate(self):
         if hasattr(self, "vector_db") and self.vector_db is not None:
             await self.vector_db.tear_down()
+        if self.call_state is not None:
+            # the graph's checkpoints for this conversation are never read again
+            try:
+                await AgentConfig().end_conversation(self.call_state.call_metadata)
+            except Exception:
+                logger.exception("Failed to free the conversation's graph checkpoints")
         return await super().terminate()
@@ -11,8 +11,8 @@ from vocode.streaming.action.abstract_factory import AbstractActionFactory
 from vocode.streaming.action.default_factory import DefaultActionFactory
 from vocode.streaming.agent.base_agent import GeneratedResponse, RespondAgent, StreamedResponse
 from vocode.streaming.agent.openai_utils import (
-    get_openai_chat_messages_from_transcript,
-    merge_event_logs,
+    OPENAI_CHAT_MESSAGES_VIEW,
+    event_log_to_openai_chat_messages,
     openai_get_tokens,
     vector_db_result_to_openai_chat_message,
 )
@@ -21,7 +21,7 @@ from vocode.streaming.models.actions import FunctionCallActionTrigger
 from vocode.streaming.models.agent import GroqAgentConfig
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage, BotBackchannel, LLMToken
-from vocode.streaming.models.transcript import EventLog, Message, Transcript
+from vocode.streaming.models.transcript import Message, Transcript
 from vocode.streaming.vector_db.factory import VectorDBFactory
 from vocode.utils.sentry_utils import CustomSentrySpans, sentry_create_span
 
@@ -65,14 +65,14 @@ class GroqAgent(RespondAgent[GroqAgentConfig]):
         prompt_preamble: str,
     ) -> List[dict]:
         # merge consecutive bot messages
-        merged_event_logs: List[EventLog] = merge_event_logs(event_logs=transcript.event_logs)
-
-        chat_messages: List[Dict[str, Optional[Any]]]
-        chat_messages = get_openai_chat_messages_from_transcript(
-            merged_event_logs=merged_event_logs,
-            prompt_preamble=prompt_preamble,
+        chat_messages: List[Dict[str, Optional[Any]]] = [
+            {"role": "system", "content": prompt_preamble}
+        ]
+        chat_messages.extend(
+            transcript.get_converted_event_logs(
+                OPENAI_CHAT_MESSAGES_VIEW, event_log_to_openai_chat_messages
+            )
         )
-
         return chat_messages
 
     def get_chat_parameters(self, messages: Optional[List] = None, use_functions: bool = True):
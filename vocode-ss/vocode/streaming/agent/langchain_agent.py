@@ -15,9 +15,24 @@ from vocode.streaming.agent.streaming_utils import collate_response_async, strea
 from vocode.streaming.models.agent import LangchainAgentConfig
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage, LLMToken
-from vocode.streaming.models.transcript import Message
+from vocode.streaming.models.transcript import EventLog, Message
 from vocode.utils.sentry_utils import CustomSentrySpans, sentry_create_span
 
+LANGCHAIN_MESSAGES_VIEW = "langchain_messages"
+
+
+def event_log_to_langchain_messages(event_log: EventLog) -> list[tuple]:
+    if isinstance(event_log, Message):
+        return [
+            (
+                "ai" if event_log.sender == Sender.BOT else "human",
+                event_log.to_string(include_sender=False),
+            )
+        ]
+    raise ValueError(
+        f"Invalid event log type {type(event_log)}. Langchain currently only supports human and bot messages"
+    )
+
 
 class LangchainAgent(RespondAgent[LangchainAgentConfig]):
 
@@ -64,19 +79,9 @@ class LangchainAgent(RespondAgent[LangchainAgentConfig]):
     def format_langchain_messages_from_transcript(self) -> list[tuple]:
         if not self.transcript:
             raise ValueError("A transcript is not attached to the agent")
-        messages = []
-        for event_log in self.transcript.event_logs:
-            if isinstance(event_log, Message):
-                messages.append(
-                    (
-                        "ai" if event_log.sender == Sender.BOT else "human",
-                        event_log.to_string(include_sender=False),
-                    )
-                )
-            else:
-                raise ValueError(
-                    f"Invalid event log type {type(event_log)}. Langchain currently only supports human and bot messages"
-                )
+        messages = self.transcript.get_converted_event_logs(
+            LANGCHAIN_MESSAGES_VIEW, event_log_to_langchain_messages, merge_bot_messages=False
+        )
 
         if self.agent_config.provider == "anthropic":
             messages = merge_bot_messages_for_langchain(messages)
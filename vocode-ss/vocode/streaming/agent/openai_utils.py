@@ -4,11 +4,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from loguru import logger
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 
-from vocode.streaming.agent.token_utils import (
-    get_chat_gpt_max_tokens,
-    num_tokens_from_functions,
-    num_tokens_from_messages,
-)
+from vocode.streaming.agent.token_utils import TokenLedger, get_chat_gpt_max_tokens
 from vocode.streaming.models.actions import FunctionFragment, PhraseBasedActionTrigger
 from vocode.streaming.models.agent import LLM_AGENT_DEFAULT_MAX_TOKENS
 from vocode.streaming.models.events import Sender
@@ -21,6 +17,8 @@ from vocode.streaming.models.transcript import (
     Transcript,
 )
 
+OPENAI_CHAT_MESSAGES_VIEW = "openai_chat_messages"
+
 
 def vector_db_result_to_openai_chat_message(vector_db_result):
     return {"role": "user", "content": vector_db_result}
@@ -37,47 +35,49 @@ def is_phrase_based_action_event_log(event_log: EventLog) -> bool:
     )
 
 
+def event_log_to_openai_chat_messages(event_log: EventLog) -> List[dict]:
+    if isinstance(event_log, Message):
+        if len(event_log.text.strip()) == 0:
+            return []
+        return [
+            {
+                "role": ("assistant" if event_log.sender == Sender.BOT else "user"),
+                "content": event_log.to_string(include_sender=False),
+            }
+        ]
+    elif isinstance(event_log, ActionStart):
+        if is_phrase_based_action_event_log(event_log=event_log):
+            return []
+        return [
+            {
+                "role": "assistant",
+                "content": None,
+                "function_call": {
+                    "name": event_log.action_type,
+                    "arguments": event_log.action_input.params.json(),
+                },
+            }
+        ]
+    elif isinstance(event_log, ActionFinish):
+        return [
+            {
+                "role": "function",
+                "name": event_log.action_type,
+                "content": event_log.to_string(include_header=False),
+            }
+        ]
+    elif isinstance(event_log, ConferenceEvent):
+        return [{"role": "user", "content": event_log.to_string(include_sender=False)}]
+    return []
+
+
 def get_openai_chat_messages_from_transcript(
     merged_event_logs: List[EventLog],
     prompt_preamble: str,
 ) -> List[dict]:
     chat_messages = [{"role": "system", "content": prompt_preamble}]
     for event_log in merged_event_logs:
-        if isinstance(event_log, Message):
-            if len(event_log.text.strip()) == 0:
-                continue
-            else:
-                chat_messages.append(
-                    {
-                        "role": ("assistant" if event_log.sender == Sender.BOT else "user"),
-                        "content": event_log.to_string(include_sender=False),
-                    },
-                )
-        elif isinstance(event_log, ActionStart):
-            action_message: Dict[str, Any]
-            if is_phrase_based_action_event_log(event_log=event_log):
-                pass
-            else:
-                action_message = {
-                    "role": "assistant",
-                    "content": None,
-                    "function_call": {
-                        "name": event_log.action_type,
-                        "arguments": event_log.action_input.params.json(),
-                    },
-                }
-                chat_messages.append(action_message)
-        elif isinstance(event_log, ActionFinish):
-            action_message = {
-                "role": "function",
-                "name": event_log.action_type,
-                "content": event_log.to_string(include_header=False),
-            }
-            chat_messages.append(action_message)
-        elif isinstance(event_log, ConferenceEvent):
-            chat_messages.append(
-                {"role": "user", "content": event_log.to_string(include_sender=False)},
-            )
+        chat_messages.extend(event_log_to_openai_chat_messages(event_log))
     return chat_messages
 
 
@@ -111,36 +111,34 @@ def format_openai_chat_messages_from_transcript(
     model_name: str,
     functions: Optional[List[Dict]],
     prompt_preamble: str,
+    token_ledger: Optional[TokenLedger] = None,
 ) -> List[dict]:
-    # merge consecutive bot messages
-    merged_event_logs: List[EventLog] = merge_event_logs(event_logs=transcript.event_logs)
-
-    chat_messages: List[Dict[str, Optional[Any]]]
-    chat_messages = get_openai_chat_messages_from_transcript(
-        merged_event_logs=merged_event_logs,
-        prompt_preamble=prompt_preamble,
+    # consecutive bot messages are merged, and only messages new since the last turn are converted
+    chat_messages: List[Dict[str, Optional[Any]]] = [{"role": "system", "content": prompt_preamble}]
+    chat_messages.extend(
+        transcript.get_converted_event_logs(
+            OPENAI_CHAT_MESSAGES_VIEW, event_log_to_openai_chat_messages
+        )
     )
 
-    context_size = num_tokens_from_messages(
-        messages=chat_messages,
-        model=model_name,
-    ) + num_tokens_from_functions(functions=functions, model=model_name)
+    token_ledger = token_ledger or TokenLedger()
+    message_tokens = token_ledger.count_messages(chat_messages, model_name)
+    # every reply is primed with <|start|>assistant<|message|>
+    context_size = 3 + sum(message_tokens) + token_ledger.count_functions(functions, model_name)
 
+    # drop the oldest messages after the system prompt in one pass
+    # context limit includes the max tokens, and 50 for safety
+    max_context_size = get_chat_gpt_max_tokens(model_name) - LLM_AGENT_DEFAULT_MAX_TOKENS - 50
     num_removed_messages = 0
-    while (
-        context_size > get_chat_gpt_max_tokens(model_name) - LLM_AGENT_DEFAULT_MAX_TOKENS - 50
-    ):  # context limit includes the max tokens, and 50 for safety
-        if len(chat_messages) <= 1:
+    while context_size > max_context_size:
+        if len(chat_messages) - num_removed_messages <= 1:
             logger.error(f"Prompt is too long to fit in context window, num tokens {context_size}")
             break
         num_removed_messages += 1
-        chat_messages.pop(1)
-        context_size = num_tokens_from_messages(
-            messages=chat_messages,
-            model=model_name,
-        ) + num_tokens_from_functions(functions=functions, model=model_name)
+        context_size -= message_tokens[num_removed_messages]
 
     if num_removed_messages > 0:
+        del chat_messages[1 : num_removed_messages + 1]
         logger.info(
             "Removed %d messages from prompt to satisfy context limit",
             num_removed_messages,
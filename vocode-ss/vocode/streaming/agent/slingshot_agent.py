@@ -17,11 +17,17 @@ from vocode.streaming.agent.openai_utils import (
     vector_db_result_to_openai_chat_message,
 )
 from vocode.streaming.agent.streaming_utils import collate_response_async, stream_response_async
+from vocode.streaming.agent.token_utils import TokenLedger
 from vocode.streaming.models.actions import FunctionCallActionTrigger
 from vocode.streaming.models.agent import SlingshotGPTAgentConfig
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage, BotBackchannel, LLMToken
 from vocode.streaming.models.transcript import Message
+from vocode.streaming.utils.llm_clients import (
+    OPENAI_DEFAULT_BASE_URL,
+    get_azure_openai_client,
+    get_openai_client,
+)
 from vocode.streaming.vector_db.factory import VectorDBFactory
 from vocode.utils.sentry_utils import CustomSentrySpans, sentry_create_span
 
@@ -30,7 +36,7 @@ SlingshotGPTAgentConfigType = TypeVar("SlingshotGPTAgentConfigType", bound=Sling
 
 def instantiate_openai_client(agent_config: SlingshotGPTAgentConfig, model_fallback: bool = False):
     if agent_config.azure_params:
-        return AsyncAzureOpenAI(
+        return get_azure_openai_client(
             azure_endpoint=agent_config.azure_params.base_url,
             api_key=agent_config.azure_params.api_key,
             api_version=agent_config.azure_params.api_version,
@@ -41,9 +47,9 @@ def instantiate_openai_client(agent_config: SlingshotGPTAgentConfig, model_fallb
             logger.info("Using OpenAI API key override")
         if agent_config.base_url_override is not None:
             logger.info(f"Using OpenAI base URL override: {agent_config.base_url_override}")
-        return AsyncOpenAI(
+        return get_openai_client(
             api_key=agent_config.openai_api_key or os.environ["OPENAI_API_KEY"],
-            base_url=agent_config.base_url_override or "https://api.openai.com/v1",
+            base_url=agent_config.base_url_override or OPENAI_DEFAULT_BASE_URL,
             max_retries=0 if model_fallback else OPENAI_DEFAULT_MAX_RETRIES,
         )
 
@@ -69,6 +75,7 @@ class SlingshotAgent(RespondAgent[SlingshotGPTAgentConfigType]):
 
         if not self.openai_client.api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
+        self.token_ledger = TokenLedger()
 
         if self.agent_config.vector_db_config:
             self.vector_db = vector_db_factory.create_vector_db(self.agent_config.vector_db_config)
@@ -92,6 +99,7 @@ class SlingshotAgent(RespondAgent[SlingshotGPTAgentConfigType]):
             self.get_model_name_for_tokenizer(),
             self.functions,
             self.agent_config.prompt_preamble,
+            token_ledger=self.token_ledger,
         )
 
         parameters: Dict[str, Any] = {
@@ -211,6 +219,7 @@ class SlingshotAgent(RespondAgent[SlingshotGPTAgentConfigType]):
                     self.agent_config.model_name,
                     self.functions,
                     self.agent_config.prompt_preamble,
+                    token_ledger=self.token_ledger,
                 )
                 messages.insert(-1, vector_db_result_to_openai_chat_message(vector_db_result))
                 chat_parameters = self.get_chat_parameters(messages)
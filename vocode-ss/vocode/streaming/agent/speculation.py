@@ -0,0 +1,111 @@
+"""Speculative responses to interim transcriptions.
+
+Normally the agent only sees a transcription once it's final, so the LLM's time to first token
+only starts after the transcriber's endpointing. With a `SpeculativeResponseConfig`, the
+conversation starts the agent on an interim transcription once it has stopped changing. The
+agent's responses (and, optionally, the synthesis of the first one) go ahead, but nothing is
+played and no action is run until the final transcription arrives: if it's similar enough, the
+speculation is committed and the responses are played as if they had been generated for it,
+otherwise they're discarded and the agent responds to the final transcription as usual.
+
+Each discarded speculation is an LLM call that was wasted, so `agent.speculation.committed` and
+`agent.speculation.wasted` are counted, and `agent.speculation.head_start` records how long
+before the final transcription the committed ones were started.
+"""
+
+import asyncio
+import re
+import time
+from difflib import SequenceMatcher
+from typing import List, Optional
+
+from vocode.streaming.models.events import Sender
+from vocode.streaming.models.transcriber import Transcription
+from vocode.streaming.models.transcript import Message, Transcript
+from vocode.streaming.utils.metrics import counter, timing
+
+speculations_started = counter("agent.speculation.started")
+speculations_committed = counter("agent.speculation.committed")
+speculations_wasted = counter("agent.speculation.wasted")
+speculation_head_start = timing("agent.speculation.head_start")
+
+
+def transcription_words(text: str) -> List[str]:
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def transcription_similarity(text: str, other_text: str) -> float:
+    """Similarity of the words of two transcriptions, from 0 to 1, ignoring case and punctuation."""
+    words, other_words = transcription_words(text), transcription_words(other_text)
+    if not words and not other_words:
+        return 1.0
+    return SequenceMatcher(None, words, other_words, autojunk=False).ratio()
+
+
+class Speculation:
+    """A response being generated for an interim transcription, see the module docstring.
+
+    The agent adds the human message through `add_human_message`, so that it can be corrected
+    to the final transcription on `commit` and removed on `discard`.
+    """
+
+    def __init__(self, transcription: Transcription, synthesize_first_sentence: bool = True):
+        self.transcription = transcription
+        self.synthesize_first_sentence = synthesize_first_sentence
+        self.started_at = time.monotonic()
+        self.final_transcription: Optional[Transcription] = None
+        self.is_committed = False
+        self.decided = asyncio.Event()
+        self.human_message: Optional[Message] = None
+        self.transcript: Optional[Transcript] = None
+        self.conversation_id: Optional[str] = None
+        speculations_started.inc()
+
+    @property
+    def is_decided(self) -> bool:
+        return self.decided.is_set()
+
+    async def wait(self) -> bool:
+        """Waits for the final transcription and returns whether the speculation was committed."""
+        await self.decided.wait()
+        return self.is_committed
+
+    def add_human_message(self, transcript: Transcript, conversation_id: str) -> Transcription:
+        """Adds the human message to the transcript and returns the transcription to respond to.
+        The message is only published to the events manager once the speculation is committed."""
+        transcription = self.final_transcription or self.transcription
+        self.human_message = Message(text=transcription.message, sender=Sender.HUMAN)
+        self.transcript = transcript
+        self.conversation_id = conversation_id
+        transcript.add_message(
+            message=self.human_message,
+            conversation_id=conversation_id,
+            publish_to_events_manager=self.is_committed,
+        )
+        return transcription
+
+    def commit(self, final_transcription: Transcription):
+        self.final_transcription = final_transcription
+        self.is_committed = True
+        self.decided.set()
+        speculations_committed.inc()
+        speculation_head_start.observe(time.monotonic() - self.started_at)
+        if self.human_message is not None:
+            assert self.transcript is not None and self.conversation_id is not None
+            self.human_message.text = final_transcription.message
+            self.transcript.maybe_publish_transcript_event_from_message(
+                message=self.human_message,
+                conversation_id=self.conversation_id,
+            )
+
+    def discard(self):
+        self.decided.set()
+        speculations_wasted.inc()
+        if self.human_message is not None:
+            assert self.transcript is not None
+            event_logs = self.transcript.event_logs
+            # by identity, as pydantic models compare equal by value
+            for index in range(len(event_logs) - 1, -1, -1):
+                if event_logs[index] is self.human_message:
+                    del event_logs[index]
+                    break
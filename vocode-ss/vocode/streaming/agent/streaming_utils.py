@@ -4,6 +4,7 @@ from typing import AsyncGenerator, AsyncIterable, List, Literal, Optional, Union
 from sentry_sdk.tracing import Span
 
 from vocode.streaming.models.actions import FunctionCall, FunctionFragment
+from vocode.streaming.utils.sentence_segmenter import SentenceSegmenter
 
 TOKENS_TO_GENERATE_PAST_PERIOD = 3
 SENTENCE_ENDINGS_EXCEPT_PERIOD_PATTERN = r"[?!\n\t\r]"
@@ -98,6 +99,41 @@ async def collate_response_async(
         yield FunctionCall(name=function_name_buffer, arguments=function_args_buffer)
 
 
+async def segment_response_async(
+    conversation_id: str,
+    gen: AsyncIterable[Union[str, FunctionFragment]],
+    get_functions: Literal[True, False] = False,
+    sentry_span: Optional[Span] = None,
+) -> AsyncGenerator[
+    Union[str, FunctionCall],
+    None,
+]:
+    """Like `collate_response_async`, but yields each sentence as soon as `SentenceSegmenter`
+    sees it end instead of waiting for tokens past the period."""
+    segmenter = SentenceSegmenter()
+    function_name_buffer = ""
+    function_args_buffer = ""
+    is_first = True
+    async for token in gen:
+        if is_first:
+            if sentry_span:
+                sentry_span.finish()
+            is_first = False
+        if not token:
+            continue
+        if isinstance(token, str):
+            for sentence in segmenter.feed(token):
+                yield sentence
+        elif isinstance(token, FunctionFragment):
+            function_name_buffer += token.name
+            function_args_buffer += token.arguments
+    remainder = segmenter.flush()
+    if remainder:
+        yield remainder
+    if function_name_buffer and get_functions:
+        yield FunctionCall(name=function_name_buffer, arguments=function_args_buffer)
+
+
 async def stream_response_async(
     conversation_id: str,
     gen: AsyncIterable[Union[str, FunctionFragment]],
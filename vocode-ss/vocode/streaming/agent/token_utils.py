@@ -2,7 +2,7 @@
 
 import json
 import textwrap
-from typing import Any, Dict, List, NamedTuple, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import tiktoken
 from loguru import logger
@@ -259,3 +259,69 @@ def _format_func_into_prompt_str(func) -> str:
         result += "_: " + formatted
     result += ") => any;\n\n"
     return result
+
+
+def _freeze_message(message: Dict[str, Any]) -> tuple:
+    return tuple(
+        (key, _freeze_message(value) if isinstance(value, dict) else value)
+        for key, value in message.items()
+    )
+
+
+class TokenLedger:
+    """Caches token counts across prompt builds of one conversation.
+
+    Each chat message is tokenized once and looked up by its contents afterwards, and the
+    function schema overhead is counted once per list of functions, so rebuilding the prompt on
+    every turn only tokenizes what is new.
+    """
+
+    def __init__(self):
+        # model -> message contents -> num tokens
+        self.message_tokens: Dict[str, Dict[tuple, int]] = {}
+        self.tokenizer_infos: Dict[str, Optional[TokenizerInfo]] = {}
+        # model -> (functions, num tokens)
+        self.functions_tokens: Dict[str, Tuple[Optional[List[dict]], int]] = {}
+
+    def _get_tokenizer_info(self, model: str) -> TokenizerInfo:
+        if model not in self.tokenizer_infos:
+            self.tokenizer_infos[model] = get_tokenizer_info(model)
+        tokenizer_info = self.tokenizer_infos[model]
+        if tokenizer_info is None:
+            raise NotImplementedError(
+                f"TokenLedger is not implemented for model {model}, see num_tokens_from_messages"
+            )
+        return tokenizer_info
+
+    def count_messages(self, messages: List[dict], model: str) -> List[int]:
+        """Returns each message's share of `num_tokens_from_messages`, which is their sum plus 3.
+
+        Counts of messages that are no longer in `messages` are dropped.
+        """
+        tokenizer_info = self._get_tokenizer_info(model)
+        cached_message_tokens = self.message_tokens.get(model, {})
+        message_tokens = {}
+        counts = []
+        for message in messages:
+            key = _freeze_message(message)
+            num_tokens = cached_message_tokens.get(key)
+            if num_tokens is None:
+                num_tokens = tokenizer_info.tokens_per_message + tokens_from_dict(
+                    encoding=tokenizer_info.encoding,
+                    d=message,
+                    tokens_per_name=tokenizer_info.tokens_per_name,
+                )
+            message_tokens[key] = num_tokens
+            counts.append(num_tokens)
+        self.message_tokens[model] = message_tokens
+        return counts
+
+    def count_functions(self, functions: Optional[List[dict]], model: str) -> int:
+        """Same as `num_tokens_from_functions`, cached for as long as the same list is passed."""
+        if model in self.functions_tokens:
+            cached_functions, num_tokens = self.functions_tokens[model]
+            if cached_functions is functions:
+                return num_tokens
+        num_tokens = num_tokens_from_functions(functions=functions, model=model)
+        self.functions_tokens[model] = (functions, num_tokens)
+        return num_tokens
@@ -1,5 +1,7 @@
 TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS = 0.1
 PER_CHUNK_ALLOWANCE_SECONDS = 0.01
+# how much audio is sent ahead of playback to devices that buffer it remotely, e.g. Twilio
+PLAYOUT_LEAD_SECONDS = 1.0
 ALLOWED_IDLE_TIME = 15
 SENTENCE_ENDINGS = [".", "!", "?", "\n"]
 CHECK_HUMAN_PRESENT_MESSAGE_CHOICES = [
@@ -73,6 +73,19 @@ class FillerAudioConfig(BaseModel):
         return v
 
 
+class SpeculativeResponseConfig(BaseModel):
+    """Starts generating a response to an interim transcription once it has stopped changing,
+    and keeps it if the final transcription is similar enough."""
+
+    # number of consecutive interim transcriptions with the same words
+    min_stable_interims: int = 2
+    min_words: int = 2
+    # word-level similarity (0 to 1) the final transcription needs for the response to be kept
+    similarity_threshold: float = 0.9
+    # also synthesize the first sentence before the response is kept
+    synthesize_first_sentence: bool = True
+
+
 class WebhookConfig(BaseModel):
     url: str
 
@@ -105,6 +118,7 @@ class AgentConfig(TypedModel, type=AgentType.BASE.value):  # type: ignore
     goodbye_phrases: Optional[List[str]] = None
     interrupt_sensitivity: InterruptSensitivity = "low"
     cut_off_response: Optional[CutOffResponse] = None
+    speculative_response_config: Optional[SpeculativeResponseConfig] = None
 
 
 class LLMAgentConfig(AgentConfig, type=AgentType.LLM.value):  # type: ignore
@@ -133,6 +147,8 @@ class ChatGPTAgentConfig(AgentConfig, type=AgentType.CHAT_GPT.value):  # type: i
     backchannel_probability: float = 0.7
     first_response_filler_message: Optional[str] = None
     llm_fallback: Optional[LLMFallback] = None
+    # language the agent's graph speaks, see call_config.SUPPORTED_LANGUAGES
+    language: Optional[str] = None
 
 
 class AnthropicAgentConfig(AgentConfig, type=AgentType.ANTHROPIC.value):  # type: ignore
@@ -42,6 +42,8 @@ class SynthesizerConfig(TypedModel, type=SynthesizerType.BASE.value):  # type: i
     audio_encoding: AudioEncoding
     should_encode_as_wav: bool = False
     sentiment_config: Optional[SentimentConfig] = None
+    # how many upcoming agent messages to start synthesizing while the current one is synthesized
+    synthesis_lookahead: int = 0
 
     class Config:
         arbitrary_types_allowed = True
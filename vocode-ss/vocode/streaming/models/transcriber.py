@@ -51,6 +51,24 @@ class PunctuationEndpointingConfig(
     time_cutoff_seconds: float = 0.4
 
 
+class VADConfig(BaseModel):
+    """Local energy-based voice activity detection on the audio sent to the transcriber.
+
+    A chunk is speech if its level is `threshold_db` above the tracked background noise level and
+    at least `min_speech_db`. With `gate_silence`, silence more than `forward_silence_seconds`
+    after speech is only forwarded once every `keepalive_interval_seconds`, and the last
+    `pre_roll_seconds` of held back audio is sent when speech starts again.
+    """
+
+    threshold_db: float = 12.0
+    min_speech_db: float = 35.0
+    hangover_seconds: float = 0.2
+    gate_silence: bool = False
+    forward_silence_seconds: float = 0.6
+    keepalive_interval_seconds: float = 1.0
+    pre_roll_seconds: float = 0.2
+
+
 class TranscriberConfig(TypedModel, type=TranscriberType.BASE.value):  # type: ignore
     sampling_rate: int
     audio_encoding: AudioEncoding
@@ -59,6 +77,7 @@ class TranscriberConfig(TypedModel, type=TranscriberType.BASE.value):  # type: i
     downsampling: Optional[int] = None
     min_interrupt_confidence: Optional[float] = None
     mute_during_speech: bool = False
+    vad_config: Optional[VADConfig] = None
 
     @validator("min_interrupt_confidence")
     def min_interrupt_confidence_must_be_between_0_and_1(cls, v):
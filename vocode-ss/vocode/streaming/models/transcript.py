@@ -1,8 +1,9 @@
 import time
+from bisect import bisect_right
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional, Sequence
 
-from pydantic.v1 import BaseModel, Field
+from pydantic.v1 import BaseModel, Field, PrivateAttr
 
 from vocode.streaming.models.actions import ActionInput, ActionOutput
 from vocode.streaming.models.events import ActionEvent, Event, EventType, Sender
@@ -12,6 +13,18 @@ from vocode.streaming.utils.events_manager import EventsManager
 class EventLog(BaseModel):
     sender: Sender
     timestamp: float = Field(default_factory=time.time)
+    # the transcript view that has to be updated when this event log is modified
+    _transcript_view: Optional["TranscriptView"] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.__fields__ and self._transcript_view is not None:
+            self._transcript_view.mark_changed(self)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {"_transcript_view": None}
+        return state
 
     def to_string(self, include_timestamp: bool = False) -> str:
         raise NotImplementedError
@@ -116,14 +129,182 @@ class TranscriptEvent(Event, type=EventType.TRANSCRIPT):  # type: ignore
         return f"{self.sender.name}: {self.text}"
 
 
+def is_bot_message(event_log: EventLog) -> bool:
+    return isinstance(event_log, Message) and event_log.sender == Sender.BOT
+
+
+def merge_bot_messages(bot_messages: List[Message]) -> Message:
+    if len(bot_messages) == 1:
+        return bot_messages[0]
+    return bot_messages[-1].copy(
+        update={"text": " ".join(bot_message.text for bot_message in bot_messages)}
+    )
+
+
+class ConvertedEventLogs:
+    """The concatenated results of `convert` for each event log of a list, extended as the list
+    grows. `offsets[i]` is where the results for event log `i` start in `items`."""
+
+    def __init__(self, convert: Callable[[EventLog], Sequence[Any]]):
+        self.convert = convert
+        self.items: List[Any] = []
+        self.offsets: List[int] = []
+
+    def truncate(self, num_event_logs: int):
+        if num_event_logs < len(self.offsets):
+            del self.items[self.offsets[num_event_logs] :]
+            del self.offsets[num_event_logs:]
+
+    def update(self, event_logs: List[EventLog]) -> List[Any]:
+        for event_log in event_logs[len(self.offsets) :]:
+            converted = self.convert(event_log)
+            self.offsets.append(len(self.items))
+            self.items.extend(converted)
+        return self.items
+
+
+class TranscriptView:
+    """Keeps the merged event logs of a transcript (consecutive bot messages joined into one,
+    as prompts show them) and conversions of them up to date incrementally.
+
+    Event logs are expected to be appended. Appending only converts the new event logs, and
+    modifying one (e.g. a bot message's text as it's spoken or cut off) only reconverts from that
+    event log on. If the list is replaced or shortened, everything is rebuilt.
+    """
+
+    def __init__(self):
+        self.event_logs: Optional[List[EventLog]] = None
+        self.num_synced = 0
+        self.last_synced: Optional[EventLog] = None
+        self.changed_from: Optional[int] = None
+        self.index_by_id: Dict[int, int] = {}
+        self.merged_event_logs: List[EventLog] = []
+        # index in `event_logs` of the first event log behind each merged event log
+        self.merged_starts: List[int] = []
+        self.merged_conversions: Dict[Hashable, ConvertedEventLogs] = {}
+        self.conversions: Dict[Hashable, ConvertedEventLogs] = {}
+
+    def mark_changed(self, event_log: EventLog):
+        index = self.index_by_id.get(id(event_log))
+        if (
+            index is not None
+            and index < self.num_synced
+            and self.event_logs is not None
+            and self.event_logs[index] is event_log
+        ):
+            self.changed_from = (
+                index if self.changed_from is None else min(self.changed_from, index)
+            )
+
+    def sync(self, event_logs: List[EventLog]):
+        if (
+            event_logs is not self.event_logs
+            or len(event_logs) < self.num_synced
+            or (self.num_synced and event_logs[self.num_synced - 1] is not self.last_synced)
+        ):
+            self.event_logs = event_logs
+            self.num_synced = 0
+            self.index_by_id.clear()
+            self.changed_from = 0
+        if self.changed_from is None and self.num_synced == len(event_logs):
+            return
+        start = self.num_synced if self.changed_from is None else self.changed_from
+
+        for conversion in self.conversions.values():
+            conversion.truncate(start)
+        # rebuild from the merged event log containing `start`, or from the bot messages before
+        # it, which it may have to be merged with
+        num_kept = bisect_right(self.merged_starts, start) - 1
+        if num_kept < 0:
+            num_kept = 0
+        elif self.merged_starts[num_kept] < start and not is_bot_message(event_logs[start - 1]):
+            num_kept += 1
+        elif (
+            self.merged_starts[num_kept] == start
+            and start
+            and is_bot_message(event_logs[start - 1])
+        ):
+            num_kept -= 1
+        index = self.merged_starts[num_kept] if num_kept < len(self.merged_starts) else start
+        del self.merged_event_logs[num_kept:]
+        del self.merged_starts[num_kept:]
+        for conversion in self.merged_conversions.values():
+            conversion.truncate(num_kept)
+        while index < len(event_logs):
+            self.merged_starts.append(index)
+            bot_messages: List[Message] = []
+            while index < len(event_logs) and is_bot_message(event_logs[index]):
+                bot_messages.append(event_logs[index])  # type: ignore
+                index += 1
+            if bot_messages:
+                self.merged_event_logs.append(merge_bot_messages(bot_messages))
+            else:
+                self.merged_event_logs.append(event_logs[index])
+                index += 1
+
+        for index in range(self.num_synced, len(event_logs)):
+            event_log = event_logs[index]
+            self.index_by_id[id(event_log)] = index
+            event_log._transcript_view = self
+        self.num_synced = len(event_logs)
+        self.last_synced = event_logs[-1] if event_logs else None
+        self.changed_from = None
+
+    def get_converted(
+        self,
+        key: Hashable,
+        convert: Callable[[EventLog], Sequence[Any]],
+        merge_bot_messages: bool,
+    ) -> List[Any]:
+        conversions = self.merged_conversions if merge_bot_messages else self.conversions
+        conversion = conversions.get(key)
+        if conversion is None:
+            conversion = conversions[key] = ConvertedEventLogs(convert)
+        assert self.event_logs is not None
+        return conversion.update(self.merged_event_logs if merge_bot_messages else self.event_logs)
+
+
 class Transcript(BaseModel):
     event_logs: List[EventLog] = []
     start_time: float = Field(default_factory=time.time)
     events_manager: Optional[EventsManager] = None
+    _view: Optional[TranscriptView] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {"_view": None}
+        return state
+
+    def _get_synced_view(self) -> TranscriptView:
+        if self._view is None:
+            self._view = TranscriptView()
+        self._view.sync(self.event_logs)
+        return self._view
+
+    def get_merged_event_logs(self) -> List[EventLog]:
+        """The event logs with consecutive bot messages merged, like `merge_event_logs`.
+
+        Bot messages that weren't merged with others are returned as is, so they must not be
+        modified.
+        """
+        return list(self._get_synced_view().merged_event_logs)
+
+    def get_converted_event_logs(
+        self,
+        key: Hashable,
+        convert: Callable[[EventLog], Sequence[Any]],
+        merge_bot_messages: bool = True,
+    ) -> List[Any]:
+        """Concatenates `convert(event_log)` over the (merged) event logs, e.g. to build the chat
+        messages for an LLM provider. The results are cached under `key` and only event logs
+        added or modified since the last call are converted again, so `convert` must only depend
+        on the event log it's given and its results must not be modified.
+        """
+        return list(self._get_synced_view().get_converted(key, convert, merge_bot_messages))
+
     def to_string(
         self, include_timestamps: bool = False, mark_human_backchannels_with_brackets: bool = False
     ) -> str:
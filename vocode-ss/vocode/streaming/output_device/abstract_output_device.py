@@ -1,8 +1,10 @@
 import asyncio
 from abc import abstractmethod
+from typing import Optional
 
 from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.output_device.audio_chunk import AudioChunk
+from vocode.streaming.output_device.playout_scheduler import PlayoutScheduler
 from vocode.streaming.utils.worker import AsyncWorker, InterruptibleEvent
 
 
@@ -13,12 +15,15 @@ class AbstractOutputDevice(AsyncWorker[InterruptibleEvent[AudioChunk]]):
     - it must call AudioChunk.on_play() when the chunk is played back and set AudioChunk.state = ChunkState.PLAYED
     - it must call AudioChunk.on_interrupt() when the chunk is interrupted and set AudioChunk.state = ChunkState.INTERRUPTED
     - if the interruptible event marker is set, then it must also mark the chunk as interrupted
+
+    Devices may keep a PlayoutScheduler that tracks how much audio is buffered ahead of playback.
     """
 
     def __init__(self, sampling_rate: int, audio_encoding: AudioEncoding):
         super().__init__()
         self.sampling_rate = sampling_rate
         self.audio_encoding = audio_encoding
+        self.playout_scheduler: Optional[PlayoutScheduler] = None
 
     @abstractmethod
     def interrupt(self):
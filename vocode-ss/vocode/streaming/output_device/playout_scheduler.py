@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from vocode.streaming.utils.metrics import counter, timing
+
+playout_lag = timing("output.playout_lag")
+underruns = counter("output.underruns")
+
+# how often a wait checks whether it should stop early
+STOP_EVENT_POLL_SECONDS = 0.05
+
+
+class PlayoutScheduler:
+    """Paces audio against a monotonic playout clock.
+
+    `schedule` records that a chunk was sent, and `playout_end` is when everything sent so far
+    will have finished playing. `wait_for_slot` sleeps until at most `lead_seconds` of audio is
+    still buffered ahead of playback. Sleeps are measured against the clock rather than added up,
+    so oversleeping on a busy loop doesn't accumulate into drift.
+
+    After the first chunk of an utterance (between `start_utterance` and `end_utterance`), a chunk
+    sent after the buffer ran dry counts as an underrun, and how late each chunk was sent
+    relative to its slot is recorded as the playout lag.
+
+    If `paces_producer` is set, whoever sends audio to the output device is expected to wait on
+    the scheduler (the device plays whatever it's given); otherwise the device paces itself.
+    """
+
+    def __init__(self, lead_seconds: float, paces_producer: bool = False):
+        self.lead_seconds = lead_seconds
+        self.paces_producer = paces_producer
+        self.playout_end: Optional[float] = None
+        self.in_utterance = False
+        self.utterance_started_playing = False
+
+    def buffered_seconds(self) -> float:
+        if self.playout_end is None:
+            return 0.0
+        return max(self.playout_end - time.monotonic(), 0.0)
+
+    async def wait_for_slot(self, stop_event: Optional[threading.Event] = None):
+        """Returns once the next chunk can be sent, or soon after `stop_event` is set."""
+        while True:
+            wait_seconds = self.buffered_seconds() - self.lead_seconds
+            if wait_seconds <= 0 or (stop_event is not None and stop_event.is_set()):
+                return
+            if stop_event is not None:
+                wait_seconds = min(wait_seconds, STOP_EVENT_POLL_SECONDS)
+            await asyncio.sleep(wait_seconds)
+
+    def schedule(self, duration_seconds: float):
+        now = time.monotonic()
+        mid_utterance = self.in_utterance and self.utterance_started_playing
+        if self.playout_end is None or self.playout_end < now:
+            if mid_utterance and self.playout_end is not None:
+                underruns.inc()
+                playout_lag.observe(now - self.playout_end + self.lead_seconds)
+            self.playout_end = now
+        elif mid_utterance:
+            playout_lag.observe(max(now - (self.playout_end - self.lead_seconds), 0.0))
+        self.playout_end += duration_seconds
+        self.utterance_started_playing = self.in_utterance
+
+    def start_utterance(self):
+        self.in_utterance = True
+        self.utterance_started_playing = False
+
+    def end_utterance(self):
+        self.in_utterance = False
+
+    def reset(self):
+        """Forgets buffered audio, e.g. after the output device was cleared."""
+        self.playout_end = None
@@ -1,18 +1,21 @@
 import asyncio
-import time
 from abc import abstractmethod
 
 from vocode.streaming.constants import PER_CHUNK_ALLOWANCE_SECONDS
 from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.output_device.abstract_output_device import AbstractOutputDevice
 from vocode.streaming.output_device.audio_chunk import ChunkState
+from vocode.streaming.output_device.playout_scheduler import PlayoutScheduler
 from vocode.streaming.utils import get_chunk_size_per_second
 
 
 class RateLimitInterruptionsOutputDevice(AbstractOutputDevice):
     """Output device that works by rate limiting the chunks sent to the output. For interrupts to work properly,
     the next chunk of audio can only be sent after the last chunk is played, so we send
-    a chunk of x seconds only after x seconds have passed since the last chunk was sent."""
+    a chunk of x seconds only after x seconds have passed since the last chunk was sent.
+
+    Chunks are paced against a playout clock, and each is sent `per_chunk_allowance_seconds`
+    before the previous one finishes playing."""
 
     def __init__(
         self,
@@ -22,10 +25,10 @@ class RateLimitInterruptionsOutputDevice(AbstractOutputDevice):
     ):
         super().__init__(sampling_rate, audio_encoding)
         self.per_chunk_allowance_seconds = per_chunk_allowance_seconds
+        self.playout_scheduler = PlayoutScheduler(lead_seconds=per_chunk_allowance_seconds)
 
     async def _run_loop(self):
         while True:
-            start_time = time.time()
             try:
                 item = await self._input_queue.get()
             except asyncio.CancelledError:
@@ -44,17 +47,10 @@ class RateLimitInterruptionsOutputDevice(AbstractOutputDevice):
                 self.sampling_rate,
             )
             await self.play(audio_chunk.data)
+            self.playout_scheduler.schedule(speech_length_seconds)
             audio_chunk.on_play()
             audio_chunk.state = ChunkState.PLAYED
-            end_time = time.time()
-            await asyncio.sleep(
-                max(
-                    speech_length_seconds
-                    - (end_time - start_time)
-                    - self.per_chunk_allowance_seconds,
-                    0,
-                ),
-            )
+            await self.playout_scheduler.wait_for_slot()
             self.interruptible_event.is_interruptible = False
 
     @abstractmethod
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import audioop
-import base64
-import json
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
 from loguru import logger
 from pydantic import BaseModel
 
+from vocode.streaming.constants import PLAYOUT_LEAD_SECONDS
 from vocode.streaming.output_device.abstract_output_device import AbstractOutputDevice
 from vocode.streaming.output_device.audio_chunk import AudioChunk, ChunkState
+from vocode.streaming.output_device.playout_scheduler import PlayoutScheduler
 from vocode.streaming.telephony.constants import DEFAULT_AUDIO_ENCODING, DEFAULT_SAMPLING_RATE
+from vocode.streaming.telephony.twilio_media_codec import TwilioMediaEncoder
 from vocode.streaming.utils.create_task import asyncio_create_task
 from vocode.streaming.utils.dtmf_utils import DTMFToneGenerator, KeypadEntry
 from vocode.streaming.utils.worker import InterruptibleEvent
@@ -27,11 +27,23 @@ MarkMessage = Union[ChunkFinishedMarkMessage]  # space for more mark messages
 
 
 class TwilioOutputDevice(AbstractOutputDevice):
-    def __init__(self, ws: Optional[WebSocket] = None, stream_sid: Optional[str] = None):
+    def __init__(
+        self,
+        ws: Optional[WebSocket] = None,
+        stream_sid: Optional[str] = None,
+        playout_lead_seconds: float = PLAYOUT_LEAD_SECONDS,
+    ):
         super().__init__(sampling_rate=DEFAULT_SAMPLING_RATE, audio_encoding=DEFAULT_AUDIO_ENCODING)
         self.ws = ws
-        self.stream_sid = stream_sid
+        self.encoder = TwilioMediaEncoder(stream_sid)
+        # media messages of the tones sent so far, IVR menus repeat the same few digits
+        self._dtmf_messages: Dict[KeypadEntry, str] = {}
         self.active = True
+        # Twilio plays whatever it's sent, so the conversation keeps at most
+        # `playout_lead_seconds` of audio buffered there and a clear only has that much to drop
+        self.playout_scheduler = PlayoutScheduler(
+            lead_seconds=playout_lead_seconds, paces_producer=True
+        )
 
         self._twilio_events_queue: asyncio.Queue[str] = asyncio.Queue()
         self._mark_message_queue: asyncio.Queue[MarkMessage] = asyncio.Queue()
@@ -39,6 +51,15 @@ class TwilioOutputDevice(AbstractOutputDevice):
             asyncio.Queue()
         )
 
+    @property
+    def stream_sid(self) -> Optional[str]:
+        return self.encoder.stream_sid
+
+    @stream_sid.setter
+    def stream_sid(self, stream_sid: Optional[str]):
+        self.encoder = TwilioMediaEncoder(stream_sid)
+        self._dtmf_messages = {}
+
     def consume_nonblocking(self, item: InterruptibleEvent[AudioChunk]):
         if not item.is_interrupted():
             self._send_audio_chunk_and_mark(
@@ -52,6 +73,7 @@ class TwilioOutputDevice(AbstractOutputDevice):
 
     def interrupt(self):
         self._send_clear_message()
+        self.playout_scheduler.reset()
 
     def enqueue_mark_message(self, mark_message: MarkMessage):
         self._mark_message_queue.put_nowait(mark_message)
@@ -60,15 +82,17 @@ class TwilioOutputDevice(AbstractOutputDevice):
         tone_generator = DTMFToneGenerator()
         for keypad_entry in keypad_entries:
             logger.info(f"Sending DTMF tone {keypad_entry.value}")
-            dtmf_tone = tone_generator.generate(
-                keypad_entry, sampling_rate=self.sampling_rate, audio_encoding=self.audio_encoding
-            )
-            dtmf_message = {
-                "event": "media",
-                "streamSid": self.stream_sid,
-                "media": {"payload": base64.b64encode(dtmf_tone).decode("utf-8")},
-            }
-            self._twilio_events_queue.put_nowait(json.dumps(dtmf_message))
+            dtmf_message = self._dtmf_messages.get(keypad_entry)
+            if dtmf_message is None:
+                dtmf_tone = tone_generator.generate(
+                    keypad_entry,
+                    sampling_rate=self.sampling_rate,
+                    audio_encoding=self.audio_encoding,
+                )
+                dtmf_message = self._dtmf_messages[keypad_entry] = self.encoder.encode_media(
+                    dtmf_tone
+                )
+            self._twilio_events_queue.put_nowait(dtmf_message)
 
     async def _send_twilio_messages(self):
         while True:
@@ -115,24 +139,8 @@ class TwilioOutputDevice(AbstractOutputDevice):
         await asyncio.gather(send_twilio_messages_task, process_mark_messages_task)
 
     def _send_audio_chunk_and_mark(self, chunk: bytes, chunk_id: str):
-        media_message = {
-            "event": "media",
-            "streamSid": self.stream_sid,
-            "media": {"payload": base64.b64encode(chunk).decode("utf-8")},
-        }
-        self._twilio_events_queue.put_nowait(json.dumps(media_message))
-        mark_message = {
-            "event": "mark",
-            "streamSid": self.stream_sid,
-            "mark": {
-                "name": chunk_id,
-            },
-        }
-        self._twilio_events_queue.put_nowait(json.dumps(mark_message))
+        self._twilio_events_queue.put_nowait(self.encoder.encode_media(chunk))
+        self._twilio_events_queue.put_nowait(self.encoder.encode_mark(chunk_id))
 
     def _send_clear_message(self):
-        clear_message = {
-            "event": "clear",
-            "streamSid": self.stream_sid,
-        }
-        self._twilio_events_queue.put_nowait(json.dumps(clear_message))
+        self._twilio_events_queue.put_nowait(self.encoder.encode_clear())
@@ -7,10 +7,13 @@ import re
 import threading
 import time
 import typing
+from collections import deque
 from typing import (
     Any,
     Awaitable,
     Callable,
+    Deque,
+    Dict,
     Generic,
     Iterator,
     List,
@@ -36,13 +39,18 @@ from vocode.streaming.agent.base_agent import (
     TranscriptionAgentInput,
 )
 from vocode.streaming.agent.chat_gpt_agent import ChatGPTAgent
+from vocode.streaming.agent.speculation import (
+    Speculation,
+    transcription_similarity,
+    transcription_words,
+)
 from vocode.streaming.constants import (
     ALLOWED_IDLE_TIME,
     CHECK_HUMAN_PRESENT_MESSAGE_CHOICES,
     TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
 )
 from vocode.streaming.models.actions import EndOfTurn
-from vocode.streaming.models.agent import FillerAudioConfig
+from vocode.streaming.models.agent import FillerAudioConfig, SpeculativeResponseConfig
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.message import BaseMessage, BotBackchannel, LLMToken, SilenceMessage
 from vocode.streaming.models.transcriber import TranscriberConfig, Transcription
@@ -163,6 +171,11 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
             self.has_associated_unignored_utterance: bool = False
             self.human_backchannels_buffer: List[Transcription] = []
             self.ignore_next_message: bool = False
+            # the words of the latest interim transcription and how many in a row had them
+            self.interim_words: List[str] = []
+            self.num_stable_interims = 0
+            self.speculation: Optional[Speculation] = None
+            self.speculation_event: Optional[InterruptibleEvent[Any]] = None
 
         def should_ignore_utterance(self, transcription: Transcription):
             if self.has_associated_unignored_utterance:
@@ -189,6 +202,115 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
             cleaned = re.sub("[^\w\s]", "", transcription.message).strip().lower()
             return any(re.fullmatch(regex, cleaned) for regex in BACKCHANNEL_PATTERNS)
 
+        def flush_human_backchannels(self):
+            # clear out backchannels and add to the transcript
+            for human_backchannel in self.human_backchannels_buffer:
+                self.conversation.transcript.add_human_message(
+                    text=human_backchannel.message,
+                    conversation_id=self.conversation.id,
+                    is_backchannel=True,
+                )
+            self.human_backchannels_buffer = []
+
+        def create_agent_input_event(
+            self,
+            transcription: Transcription,
+            speculation: Optional[Speculation] = None,
+        ) -> InterruptibleEvent[Any]:
+            # we use getattr here to avoid the dependency cycle between PhoneConversation and StreamingConversation
+            return self.interruptible_event_factory.create_interruptible_event(
+                TranscriptionAgentInput(
+                    transcription=transcription,
+                    conversation_id=self.conversation.id,
+                    vonage_uuid=getattr(self.conversation, "vonage_uuid", None),
+                    twilio_sid=getattr(self.conversation, "twilio_sid", None),
+                    speculation=speculation,
+                ),
+            )
+
+        def maybe_speculate(self, transcription: Transcription):
+            """Once enough interim transcriptions in a row had the same words, lets the agent
+            prefetch for them and starts a speculative response, see
+            vocode.streaming.agent.speculation."""
+            agent = self.conversation.agent
+            config = agent.get_agent_config().speculative_response_config
+            should_speculate = config is not None and agent.supports_speculative_responses()
+            # without speculative responses, the default thresholds still decide when to prefetch
+            config = config or SpeculativeResponseConfig()
+            if self.speculation is not None:
+                if (
+                    transcription_similarity(
+                        transcription.message, self.speculation.transcription.message
+                    )
+                    >= config.similarity_threshold
+                ):
+                    return
+                logger.debug("Interim transcription moved on, discarding speculation")
+                self.discard_speculation()
+            words = transcription_words(transcription.message)
+            if words == self.interim_words:
+                self.num_stable_interims += 1
+            else:
+                self.interim_words = words
+                self.num_stable_interims = 1
+            if (
+                self.num_stable_interims < config.min_stable_interims
+                or len(words) < config.min_words
+            ):
+                return
+            if self.num_stable_interims == config.min_stable_interims:
+                agent.prefetch(transcription)
+            if not should_speculate:
+                return
+
+            logger.debug(f"Speculatively responding to: {transcription.message}")
+            self.flush_human_backchannels()
+            speculative_transcription = transcription.copy()
+            if speculative_transcription.is_interrupt:
+                speculative_transcription.bot_was_in_medias_res = self.is_bot_in_medias_res()
+            self.conversation.warmup_synthesizer()
+            self.speculation = Speculation(
+                speculative_transcription,
+                synthesize_first_sentence=config.synthesize_first_sentence,
+            )
+            self.speculation_event = self.create_agent_input_event(
+                speculative_transcription, speculation=self.speculation
+            )
+            self.consumer.consume_nonblocking(self.speculation_event)
+
+        def resolve_speculation(self, transcription: Transcription) -> bool:
+            """Commits or discards the pending speculation for the final transcription, and returns
+            whether it was committed, in which case the agent is already responding."""
+            speculation = self.speculation
+            self.interim_words = []
+            self.num_stable_interims = 0
+            if speculation is None:
+                return False
+            config = self.conversation.agent.get_agent_config().speculative_response_config
+            similarity = transcription_similarity(
+                transcription.message, speculation.transcription.message
+            )
+            if config is not None and similarity >= config.similarity_threshold:
+                logger.debug("Final transcription matches, committing speculation")
+                speculation.commit(transcription)
+                self.speculation = None
+                self.speculation_event = None
+                return True
+            logger.debug("Final transcription differs, discarding speculation")
+            self.discard_speculation()
+            return False
+
+        def discard_speculation(self):
+            if self.speculation is None:
+                return
+            assert self.speculation_event is not None
+            self.speculation.discard()
+            self.speculation_event.interrupt()
+            if self.conversation.agent.interruptible_event is self.speculation_event:
+                self.conversation.agent.cancel_current_task()
+            self.speculation = None
+            self.speculation_event = None
+
         def _most_recent_transcript_messages(self) -> Iterator[Message]:
             return (
                 event_log
@@ -251,6 +373,7 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                 self.has_associated_ignored_utterance = False
                 agent_response_tracker = None
                 self.ignore_next_message = False
+                self.discard_speculation()
                 return
             if transcription.is_final:
                 if (
@@ -286,16 +409,8 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
             if transcription.is_final:
                 self.has_associated_ignored_utterance = False
                 self.has_associated_unignored_utterance = False
-                agent_response_tracker = None
 
-                # clear out backchannels and add to the transcript
-                for human_backchannel in self.human_backchannels_buffer:
-                    self.conversation.transcript.add_human_message(
-                        text=human_backchannel.message,
-                        conversation_id=self.conversation.id,
-                        is_backchannel=True,
-                    )
-                self.human_backchannels_buffer = []
+                self.flush_human_backchannels()
 
                 if transcription.is_interrupt:
                     transcription.bot_was_in_medias_res = self.is_bot_in_medias_res()
@@ -305,19 +420,14 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
 
                 self.conversation.speed_manager.update(transcription)
 
+                if self.resolve_speculation(transcription):
+                    return
+
                 self.conversation.warmup_synthesizer()
 
-                # we use getattr here to avoid the dependency cycle between PhoneConversation and StreamingConversation
-                event = self.interruptible_event_factory.create_interruptible_event(
-                    TranscriptionAgentInput(
-                        transcription=transcription,
-                        conversation_id=self.conversation.id,
-                        vonage_uuid=getattr(self.conversation, "vonage_uuid", None),
-                        twilio_sid=getattr(self.conversation, "twilio_sid", None),
-                        agent_response_tracker=agent_response_tracker,
-                    ),
-                )
-                self.consumer.consume_nonblocking(event)
+                self.consumer.consume_nonblocking(self.create_agent_input_event(transcription))
+            else:
+                self.maybe_speculate(transcription)
 
     class FillerAudioWorker(InterruptibleWorker[InterruptibleAgentResponseEvent[FillerAudio]]):
         """
@@ -392,6 +502,127 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
             self.last_agent_response_tracker: Optional[asyncio.Event] = None
             self.is_first_text_chunk = True
 
+            synthesizer = self.conversation.synthesizer
+            self.lookahead = 0
+            if synthesizer.supports_concurrent_speech and not isinstance(
+                synthesizer, InputStreamingSynthesizer
+            ):
+                self.lookahead = synthesizer.get_synthesizer_config().synthesis_lookahead
+            # with lookahead, the events waiting to be processed (in order), the one being
+            # processed, and the speech already being synthesized for some of the waiting ones
+            self.upcoming_events: Deque[InterruptibleAgentResponseEvent[AgentResponse]] = deque()
+            self.processing_event: Optional[InterruptibleAgentResponseEvent[AgentResponse]] = None
+            self.lookahead_speech: Dict[
+                InterruptibleAgentResponseEvent[AgentResponse], asyncio.Task[SynthesisResult]
+            ] = {}
+
+        def consume_nonblocking(self, item: InterruptibleAgentResponseEvent[AgentResponse]):
+            super().consume_nonblocking(item)
+            if self.lookahead:
+                self.upcoming_events.append(item)
+                self.start_lookahead_speech()
+
+        async def wait_for_speculation(
+            self, item: InterruptibleAgentResponseEvent[AgentResponse]
+        ) -> bool:
+            """Holds back a response to a speculation until it's decided, and returns whether the
+            response is still to be sent."""
+            speculation = item.payload.speculation
+            if speculation is None or await speculation.wait():
+                return True
+            logger.debug("Discarding response to a discarded speculation")
+            self._cancel_lookahead_speech(item)
+            item.agent_response_tracker.set()
+            return False
+
+        def start_lookahead_speech(self):
+            """Starts synthesizing the next `lookahead` messages, with the `is_first_text_chunk`
+            each of them will have when it's processed. SynthesisResultsWorker still plays them in
+            the order they're processed."""
+            is_first_text_chunk = self.is_first_text_chunk
+            # when nothing is being processed, the first message is the one that's processed next
+            max_messages = self.lookahead + 1
+            if self.processing_event is not None:
+                is_first_text_chunk = self._is_first_text_chunk_after(
+                    self.processing_event, is_first_text_chunk
+                )
+                max_messages = self.lookahead
+            num_messages = 0
+            for event in self.upcoming_events:
+                if event.is_interrupted():
+                    continue
+                agent_response = event.payload
+                if isinstance(agent_response, AgentResponseMessage) and not isinstance(
+                    agent_response.message, EndOfTurn
+                ):
+                    if num_messages >= max_messages or not self._can_synthesize(agent_response):
+                        break
+                    num_messages += 1
+                    if event not in self.lookahead_speech:
+                        self.lookahead_speech[event] = asyncio_create_task(
+                            self.conversation.synthesizer.create_speech(
+                                agent_response.message,
+                                self.chunk_size,
+                                is_first_text_chunk=is_first_text_chunk,
+                                is_sole_text_chunk=agent_response.is_sole_text_chunk,
+                            )
+                        )
+                is_first_text_chunk = self._is_first_text_chunk_after(event, is_first_text_chunk)
+
+        def _can_synthesize(self, agent_response: AgentResponse) -> bool:
+            """Responses to a speculation are only synthesized before it's committed if configured,
+            and not by input streaming synthesizers, which can't take back what they were sent."""
+            speculation = agent_response.speculation
+            return (
+                speculation is None
+                or speculation.is_committed
+                or (
+                    speculation.synthesize_first_sentence
+                    and not isinstance(self.conversation.synthesizer, InputStreamingSynthesizer)
+                )
+            )
+
+        @staticmethod
+        def _is_first_text_chunk_after(
+            event: InterruptibleAgentResponseEvent[AgentResponse], is_first_text_chunk: bool
+        ) -> bool:
+            agent_response = event.payload
+            if not isinstance(agent_response, AgentResponseMessage):
+                return is_first_text_chunk
+            if isinstance(agent_response.message, EndOfTurn):
+                return True
+            return is_first_text_chunk and isinstance(agent_response.message, SilenceMessage)
+
+        def _start_processing(self, item: InterruptibleAgentResponseEvent[AgentResponse]):
+            # events before this one were skipped because they were interrupted
+            while self.upcoming_events:
+                event = self.upcoming_events.popleft()
+                if event is item:
+                    break
+                self._cancel_lookahead_speech(event)
+            self.processing_event = item
+
+        def _cancel_lookahead_speech(self, event: InterruptibleAgentResponseEvent[AgentResponse]):
+            task = self.lookahead_speech.pop(event, None)
+            if task is None:
+                return
+            if task.done():
+                if not task.cancelled() and task.exception() is not None:
+                    logger.debug(f"Discarding failed lookahead synthesis: {task.exception()}")
+            else:
+                task.cancel()
+
+        def cancel_current_task(self):
+            for event in list(self.lookahead_speech):
+                if event.is_interrupted():
+                    self._cancel_lookahead_speech(event)
+            return super().cancel_current_task()
+
+        async def terminate(self):
+            for event in list(self.lookahead_speech):
+                self._cancel_lookahead_speech(event)
+            return await super().terminate()
+
         def send_filler_audio(self, agent_response_tracker: Optional[asyncio.Event]):
             assert self.conversation.filler_audio_worker is not None
             logger.debug("Sending filler audio")
@@ -408,11 +639,21 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                 logger.debug("No filler audio available for synthesizer")
 
         async def process(self, item: InterruptibleAgentResponseEvent[AgentResponse]):
+            if self.lookahead:
+                self._start_processing(item)
             if not self.conversation.synthesis_enabled:
                 logger.debug("Synthesis disabled, not synthesizing speech")
+                self._cancel_lookahead_speech(item)
+                self.processing_event = None
                 return
             try:
                 agent_response = item.payload
+                if not (
+                    isinstance(agent_response, AgentResponseMessage)
+                    and not isinstance(agent_response.message, EndOfTurn)
+                    and self._can_synthesize(agent_response)
+                ) and not await self.wait_for_speculation(item):
+                    return
                 if isinstance(agent_response, AgentResponseFillerAudio):
                     self.send_filler_audio(item.agent_response_tracker)
                     return
@@ -482,6 +723,9 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                         message=agent_response_message.message,
                         chunk_size=self.chunk_size,
                     )
+                elif item in self.lookahead_speech:
+                    logger.debug("Waiting for speech synthesized ahead of time")
+                    maybe_synthesis_result = await self.lookahead_speech.pop(item)
                 else:
                     logger.debug("Synthesizing speech for message")
                     maybe_synthesis_result = await self.conversation.synthesizer.create_speech(
@@ -500,6 +744,8 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                         maybe_synthesis_result = (
                             self.conversation.synthesizer.get_current_utterance_synthesis_result()
                         )
+                if not await self.wait_for_speculation(item):
+                    return
                 if maybe_synthesis_result is not None:
                     synthesis_result = maybe_synthesis_result
                     synthesis_result.is_first = agent_response_message.is_first
@@ -518,6 +764,10 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                     self.is_first_text_chunk = False
             except asyncio.CancelledError:
                 pass
+            finally:
+                if self.lookahead:
+                    self.processing_event = None
+                    self.start_lookahead_speech()
 
     class SynthesisResultsWorker(
         InterruptibleWorker[
@@ -942,7 +1192,13 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
         audio_chunks: List[AudioChunk] = []
         processed_events: List[asyncio.Event] = []
         interrupted_before_all_chunks_sent = False
+        playout_scheduler = self.output_device.playout_scheduler
+        if playout_scheduler:
+            playout_scheduler.start_utterance()
         async for chunk_idx, chunk_result in enumerate_async_iter(synthesis_result.chunk_generator):
+            if playout_scheduler and playout_scheduler.paces_producer:
+                # don't send the device more than its lead window ahead of playback
+                await playout_scheduler.wait_for_slot(stop_event)
             if stop_event.is_set():
                 logger.debug("Interrupted before all chunks were sent")
                 interrupted_before_all_chunks_sent = True
@@ -967,6 +1223,13 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
                         interruption_event=stop_event,
                     ),
                 )
+            if playout_scheduler and playout_scheduler.paces_producer:
+                playout_scheduler.schedule(
+                    len(chunk_result.chunk)
+                    / get_chunk_size_per_second(
+                        self.output_device.audio_encoding, self.output_device.sampling_rate
+                    )
+                )
             audio_chunks.append(audio_chunk)
             processed_events.append(processed_event)
 
@@ -974,6 +1237,8 @@ class StreamingConversation(AudioPipeline[OutputDeviceType]):
 
         if processed_events:
             await processed_events[-1].wait()
+        if playout_scheduler:
+            playout_scheduler.end_utterance()
 
         maybe_first_interrupted_audio_chunk = next(
             (
@@ -1,15 +1,49 @@
-from typing import Optional
+import asyncio
+import hashlib
+from typing import Dict, Optional
 
 from loguru import logger
 
-from vocode.streaming.utils.redis import initialize_redis_bytes
+from vocode import getenv
+from vocode.streaming.utils.lru_cache import LRUCache
+from vocode.streaming.utils.metrics import counter
+from vocode.streaming.utils.redis import initialize_redis_bytes, set_with_ttl
+from vocode.streaming.utils.single_flight import SingleFlight
 from vocode.streaming.utils.singleton import Singleton
 
+AUDIO_CACHE_DEFAULT_LOCAL_MAX_BYTES = 64 * 1024 * 1024
+AUDIO_CACHE_DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
 
 class AudioCache(Singleton):
+    """Two-tier cache of synthesized audio.
+
+    The first tier is an in-process LRU bounded by AUDIO_CACHE_LOCAL_MAX_BYTES, so repeated phrases
+    (initial messages, fillers) don't cost a Redis round trip. The second tier is Redis: entries
+    expire after AUDIO_CACHE_TTL_SECONDS and every hit refreshes the TTL, so phrases that stop
+    being used age out. Run Redis with `maxmemory-policy allkeys-lfu` to evict by frequency under
+    memory pressure.
+
+    Concurrent lookups of the same phrase are collapsed into one Redis request, and misses on a
+    phrase that is being synthesized wait for that synthesis instead of starting another one.
+    """
+
     def __init__(self):
         self.redis = initialize_redis_bytes()
         self.disabled = False
+        self.ttl = int(getenv("AUDIO_CACHE_TTL_SECONDS", AUDIO_CACHE_DEFAULT_TTL_SECONDS))
+        self.local_cache: LRUCache[str, bytes] = LRUCache(
+            max_size=int(
+                getenv("AUDIO_CACHE_LOCAL_MAX_BYTES", AUDIO_CACHE_DEFAULT_LOCAL_MAX_BYTES)
+            ),
+            get_size=len,
+            metrics_prefix="audio_cache.local",
+        )
+        self.redis_lookups: SingleFlight[str, Optional[bytes]] = SingleFlight()
+        self.audio_creations: Dict[str, asyncio.Future[Optional[bytes]]] = {}
+        self.redis_hits = counter("audio_cache.redis.hits")
+        self.redis_misses = counter("audio_cache.redis.misses")
+        self.redis_errors = counter("audio_cache.redis.errors")
 
     @staticmethod
     async def safe_create():
@@ -25,23 +59,77 @@ class AudioCache(Singleton):
         return audio_cache
 
     def get_audio_key(self, voice_identifier: str, text: str) -> str:
-        return f"audio_cache:{voice_identifier}:{text}"
+        digest = hashlib.sha256(f"{voice_identifier}:{text}".encode()).hexdigest()
+        return f"audio_cache:{digest}"
 
     async def get_audio(self, voice_identifier: str, text: str) -> Optional[bytes]:
-        audio_key = self.get_audio_key(voice_identifier, text)
         if self.disabled:
             return None
-        return await self.redis.get(audio_key)
+        audio_key = self.get_audio_key(voice_identifier, text)
+        audio = self.local_cache.get(audio_key)
+        if audio is not None:
+            return audio
+        return await self.redis_lookups.do(audio_key, lambda: self._get_audio_from_redis(audio_key))
+
+    async def _get_audio_from_redis(self, audio_key: str) -> Optional[bytes]:
+        try:
+            audio = await self.redis.getex(audio_key, ex=self.ttl)
+        except Exception:
+            logger.exception(f"Failed to get {audio_key} from the audio cache")
+            self.redis_errors.inc()
+            return None
+        if audio is None:
+            self.redis_misses.inc()
+            return None
+        self.redis_hits.inc()
+        self.local_cache.set(audio_key, audio)
+        return audio
 
     async def set_audio(
         self, voice_identifier: str, text: str, audio: bytes, ttl: Optional[int] = None
     ):
-        # TODO: cache eviction
         if self.disabled:
             logger.warning("Audio cache is disabled")
             return
         logger.info(f"Setting audio for {voice_identifier} {text}")
         audio_key = self.get_audio_key(voice_identifier, text)
-        await self.redis.set(audio_key, audio)
-        if ttl is not None:
-            await self.redis.expire(audio_key, ttl)
+        self.local_cache.set(audio_key, audio)
+        try:
+            await set_with_ttl(self.redis, audio_key, audio, ttl or self.ttl)
+        except Exception:
+            logger.exception(f"Failed to set {audio_key} in the audio cache")
+            self.redis_errors.inc()
+
+    def get_audio_creation(
+        self, voice_identifier: str, text: str
+    ) -> Optional[asyncio.Future[Optional[bytes]]]:
+        """The in-flight synthesis of the phrase, if any. It resolves to the audio, or to None if
+        the synthesis failed."""
+        return self.audio_creations.get(self.get_audio_key(voice_identifier, text))
+
+    def start_audio_creation(
+        self, voice_identifier: str, text: str
+    ) -> asyncio.Future[Optional[bytes]]:
+        """Marks the phrase as being synthesized, so that concurrent misses can wait for it with
+        `get_audio_creation`. The caller must call `finish_audio_creation` when it's done."""
+        creation: asyncio.Future[Optional[bytes]] = asyncio.get_running_loop().create_future()
+        self.audio_creations[self.get_audio_key(voice_identifier, text)] = creation
+        return creation
+
+    async def finish_audio_creation(
+        self,
+        voice_identifier: str,
+        text: str,
+        creation: asyncio.Future[Optional[bytes]],
+        audio: Optional[bytes],
+        ttl: Optional[int] = None,
+    ):
+        """Hands the synthesized audio (None if the synthesis failed) to the callers waiting for
+        it, then caches it."""
+        audio_key = self.get_audio_key(voice_identifier, text)
+        if self.audio_creations.get(audio_key) is creation:
+            del self.audio_creations[audio_key]
+        if not creation.done():
+            creation.set_result(audio)
+        if audio is not None:
+            await self.set_audio(voice_identifier, text, audio, ttl)
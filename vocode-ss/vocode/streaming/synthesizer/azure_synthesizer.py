@@ -1,8 +1,12 @@
 import asyncio
+import bisect
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 from xml.etree import ElementTree
 
 import azure.cognitiveservices.speech as speechsdk
@@ -20,6 +24,7 @@ from vocode.streaming.synthesizer.base_synthesizer import (
     SynthesisResult,
     encode_as_wav,
 )
+from vocode.streaming.utils.metrics import timing
 
 NAMESPACES = {
     "mstts": "https://www.w3.org/2001/mstts",
@@ -31,31 +36,66 @@ ElementTree.register_namespace("mstts", NAMESPACES["mstts"])
 
 _AZURE_INSIDE_VOICE_REGEX = r"<voice[^>]*>(.*?)<\/voice>"
 
+AZURE_SYNTHESIZER_DEFAULT_MAX_WORKERS = 64
+
+_thread_pool_executor: Optional[ThreadPoolExecutor] = None
+_thread_pool_executor_lock = threading.Lock()
+
+
+def get_azure_thread_pool_executor() -> ThreadPoolExecutor:
+    """Returns the process-wide executor that runs all blocking Azure Speech SDK calls.
+
+    Shared by every AzureSynthesizer so the number of SDK threads is bounded regardless of how
+    many conversations are running. Size it with AZURE_SYNTHESIZER_MAX_WORKERS.
+    """
+    global _thread_pool_executor
+    with _thread_pool_executor_lock:
+        if _thread_pool_executor is None:
+            _thread_pool_executor = ThreadPoolExecutor(
+                max_workers=int(
+                    getenv(
+                        "AZURE_SYNTHESIZER_MAX_WORKERS",
+                        AZURE_SYNTHESIZER_DEFAULT_MAX_WORKERS,
+                    )
+                ),
+                thread_name_prefix="azure_synthesizer",
+            )
+        return _thread_pool_executor
+
 
 class AzureSynthesizerException(Exception):
     pass
 
 
 class WordBoundaryEventPool:
+    """Word boundaries of a single utterance as (audio offset in seconds, ssml text offset) pairs,
+    kept sorted by audio offset so lookups are a binary search."""
+
     def __init__(self):
-        self.events = []
+        self.events: List[Tuple[float, int]] = []
+        self.claimed = False
 
     def add(self, event):
-        self.events.append(
-            {
-                "text": event.text,
-                "text_offset": event.text_offset,
-                "audio_offset": (event.audio_offset + 5000) / (10000 * 1000),
-                "boudary_type": event.boundary_type,
-            }
-        )
+        word_boundary = ((event.audio_offset + 5000) / (10000 * 1000), event.text_offset)
+        if not self.events or self.events[-1][0] <= word_boundary[0]:
+            self.events.append(word_boundary)
+        else:
+            bisect.insort(self.events, word_boundary)
+
+    def get_text_offset_after(self, seconds: float) -> Optional[int]:
+        """Returns the ssml offset of the first word that starts after `seconds`, if any."""
+        idx = bisect.bisect_right(self.events, seconds, key=lambda event: event[0])
+        if idx == len(self.events):
+            return None
+        return self.events[idx][1]
 
-    def get_events_sorted(self):
-        return sorted(self.events, key=lambda event: event["audio_offset"])
+
+ReturnType = TypeVar("ReturnType")
 
 
 class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
     OFFSET_MS = 100
+    MAX_UNCLAIMED_WORD_BOUNDARY_POOLS = 16
 
     def __init__(
         self,
@@ -110,7 +150,27 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         self.voice_name = self.synthesizer_config.voice_name
         self.pitch = self.synthesizer_config.pitch
         self.rate = self.synthesizer_config.rate
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+        self.thread_pool_executor = get_azure_thread_pool_executor()
+        self.executor_wait_timing = timing("azure_synthesizer.executor_wait")
+
+        # word boundary events are routed to the utterance they belong to by result id, and
+        # dropped from here once that utterance's synthesis is over
+        self.word_boundary_lock = threading.Lock()
+        self.word_boundary_pools: Dict[str, WordBoundaryEventPool] = {}
+        # pools of utterances that finished before create_speech_uncached claimed them
+        self.unclaimed_word_boundary_pools: OrderedDict[str, WordBoundaryEventPool] = OrderedDict()
+        self.synthesizer.synthesis_word_boundary.connect(self.word_boundary_cb)
+        self.synthesizer.synthesis_completed.connect(self.synthesis_finished_cb)
+        self.synthesizer.synthesis_canceled.connect(self.synthesis_finished_cb)
+
+    async def _run_in_executor(self, func: Callable[..., ReturnType], *args) -> ReturnType:
+        submitted_at = time.perf_counter()
+
+        def run():
+            self.executor_wait_timing.observe(time.perf_counter() - submitted_at)
+            return func(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(self.thread_pool_executor, run)
 
     @classmethod
     def get_voice_identifier(cls, synthesizer_config: AzureSynthesizerConfig) -> str:
@@ -148,9 +208,7 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
                     message=filler_phrase.text, synthesizer_config=self.synthesizer_config
                 )
                 self.total_chars += self.get_total_chars_from_ssml(ssml)
-                result = await asyncio.get_event_loop().run_in_executor(
-                    self.thread_pool_executor, self.synthesizer.speak_ssml, ssml
-                )
+                result = await self._run_in_executor(self.synthesizer.speak_ssml, ssml)
                 offset = self.synthesizer_config.sampling_rate * self.OFFSET_MS // 1000
                 audio_data = result.audio_data[offset:]
                 with open(filler_audio_path, "wb") as f:
@@ -176,9 +234,31 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
             return with_mark
         return with_mark + self.add_marks(rest_stripped, index + 1)
 
-    def word_boundary_cb(self, evt, pool):
+    def word_boundary_cb(self, evt):
+        with self.word_boundary_lock:
+            pool = self.word_boundary_pools.setdefault(evt.result_id, WordBoundaryEventPool())
         pool.add(evt)
 
+    def synthesis_finished_cb(self, evt):
+        with self.word_boundary_lock:
+            pool = self.word_boundary_pools.pop(evt.result.result_id, None)
+            if pool is None or not pool.claimed:
+                self.unclaimed_word_boundary_pools[evt.result.result_id] = (
+                    pool or WordBoundaryEventPool()
+                )
+                while (
+                    len(self.unclaimed_word_boundary_pools) > self.MAX_UNCLAIMED_WORD_BOUNDARY_POOLS
+                ):
+                    self.unclaimed_word_boundary_pools.popitem(last=False)
+
+    def claim_word_boundary_pool(self, result_id: str) -> WordBoundaryEventPool:
+        with self.word_boundary_lock:
+            pool = self.unclaimed_word_boundary_pools.pop(result_id, None)
+            if pool is None:
+                pool = self.word_boundary_pools.setdefault(result_id, WordBoundaryEventPool())
+            pool.claimed = True
+            return pool
+
     @classmethod
     def compute_total_chars(
         cls, message: BaseMessage, synthesizer_config: AzureSynthesizerConfig
@@ -227,8 +307,11 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         return ssml
 
     def synthesize_ssml(self, ssml: str) -> speechsdk.AudioDataStream:
+        return self._start_speaking_ssml(ssml)[1]
+
+    def _start_speaking_ssml(self, ssml: str) -> Tuple[str, speechsdk.AudioDataStream]:
         result = self.synthesizer.start_speaking_ssml_async(ssml).get()
-        return speechsdk.AudioDataStream(result)
+        return result.result_id, speechsdk.AudioDataStream(result)
 
     def ready_synthesizer(self, chunk_size: int):
         # TODO: remove warming up the synthesizer for now
@@ -243,18 +326,18 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         ssml: str,
         seconds: Optional[float],
         word_boundary_event_pool: WordBoundaryEventPool,
+        ssml_tag_ends: List[int],
     ) -> str:
         if seconds is None:
             return message
-        events = word_boundary_event_pool.get_events_sorted()
-        for event in events:
-            if event["audio_offset"] > seconds:
-                ssml_fragment = ssml[: event["text_offset"]]
-                # TODO: this is a little hacky, but it works for now
-                return ssml_fragment.split(">")[-1]
-        return message
-
-    async def _check_stream_for_errors(self, audio_data_stream: speechsdk.AudioDataStream):
+        text_offset = word_boundary_event_pool.get_text_offset_after(seconds)
+        if text_offset is None:
+            return message
+        # the text between the last tag and the first unspoken word
+        tag_idx = bisect.bisect_right(ssml_tag_ends, text_offset)
+        return ssml[ssml_tag_ends[tag_idx - 1] if tag_idx else 0 : text_offset]
+
+    def _check_stream_for_errors(self, audio_data_stream: speechsdk.AudioDataStream):
         if (
             audio_data_stream.cancellation_details
             and audio_data_stream.cancellation_details.reason == speechsdk.CancellationReason.Error
@@ -263,6 +346,15 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
                 f"Azure Synthesizer Error: {audio_data_stream.cancellation_details.error_details}"
             )
 
+    def _read_chunk(
+        self, audio_data_stream: speechsdk.AudioDataStream, chunk_size: int
+    ) -> Tuple[bytes, int]:
+        # blocks until chunk_size bytes are available or the stream ends, run it in the executor
+        audio_buffer = bytes(chunk_size)
+        filled_size = audio_data_stream.read_data(audio_buffer)
+        self._check_stream_for_errors(audio_data_stream)
+        return audio_buffer, filled_size
+
     async def create_speech_uncached(
         self,
         message: BaseMessage,
@@ -286,21 +378,18 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         async def chunk_generator(
             audio_data_stream: speechsdk.AudioDataStream, chunk_transform=lambda x: x
         ):
-            audio_buffer = bytes(chunk_size)
-            filled_size = await asyncio.get_event_loop().run_in_executor(
-                self.thread_pool_executor,
-                lambda: audio_data_stream.read_data(audio_buffer),
+            audio_buffer, filled_size = await self._run_in_executor(
+                self._read_chunk, audio_data_stream, chunk_size
             )
-
-            await self._check_stream_for_errors(audio_data_stream)
             if filled_size != chunk_size:
                 yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer[offset:]), True)
                 return
             else:
                 yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer[offset:]), False)
             while True:
-                audio_buffer = bytes(chunk_size)
-                filled_size = audio_data_stream.read_data(audio_buffer)
+                audio_buffer, filled_size = await self._run_in_executor(
+                    self._read_chunk, audio_data_stream, chunk_size
+                )
                 if filled_size != chunk_size:
                     yield SynthesisResult.ChunkResult(
                         chunk_transform(audio_buffer[: filled_size - offset]), True
@@ -308,19 +397,15 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
                     break
                 yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), False)
 
-        word_boundary_event_pool = WordBoundaryEventPool()
-        self.synthesizer.synthesis_word_boundary.connect(
-            lambda event: self.word_boundary_cb(event, word_boundary_event_pool)
-        )
         ssml = (
             message.ssml
             if isinstance(message, SSMLMessage)
             else self.create_ssml(message=message.text, synthesizer_config=self.synthesizer_config)
         )
         self.total_chars += self.get_total_chars_from_ssml(ssml)
-        audio_data_stream = await asyncio.get_event_loop().run_in_executor(
-            self.thread_pool_executor, self.synthesize_ssml, ssml
-        )
+        result_id, audio_data_stream = await self._run_in_executor(self._start_speaking_ssml, ssml)
+        word_boundary_event_pool = self.claim_word_boundary_pool(result_id)
+        ssml_tag_ends = [match.end() for match in re.finditer(">", ssml)]
         if self.synthesizer_config.should_encode_as_wav:
             output_generator = chunk_generator(
                 audio_data_stream,
@@ -332,6 +417,6 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         return SynthesisResult(
             output_generator,
             lambda seconds: self.get_message_up_to(
-                message.text, ssml, seconds, word_boundary_event_pool
+                message.text, ssml, seconds, word_boundary_event_pool, ssml_tag_ends
             ),
         )
@@ -1,5 +1,4 @@
 import asyncio
-import audioop
 import io
 import math
 import os
@@ -29,10 +28,11 @@ from vocode.streaming.models.message import BaseMessage, BotBackchannel, Silence
 from vocode.streaming.models.synthesizer import SynthesizerConfig
 from vocode.streaming.synthesizer.audio_cache import AudioCache
 from vocode.streaming.synthesizer.miniaudio_worker import MiniaudioWorker
-from vocode.streaming.telephony.constants import MULAW_SILENCE_BYTE, PCM_SILENCE_BYTE
-from vocode.streaming.utils import convert_wav, get_chunk_size_per_second
+from vocode.streaming.synthesizer.phrase_bank import PhraseBank, PreRenderedPhrase
+from vocode.streaming.utils import convert_wav, dsp, get_chunk_size_per_second
 from vocode.streaming.utils.async_requester import AsyncRequestor
 from vocode.streaming.utils.create_task import asyncio_create_task
+from vocode.streaming.utils.silence import get_silent_chunk
 from vocode.streaming.utils.worker import QueueConsumer
 
 if TYPE_CHECKING:
@@ -150,7 +150,7 @@ class CachedAudio:
         self.trailing_silence_seconds = trailing_silence_seconds
 
     def create_synthesis_result(self, chunk_size) -> SynthesisResult:
-        async def chunk_generator():
+        async def chunk_generator() -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
             if isinstance(self.message, BotBackchannel):
                 yield SynthesisResult.ChunkResult(
                     self.audio_data, self.trailing_silence_seconds == 0.0
@@ -189,24 +189,21 @@ class CachedAudio:
         )
 
     def create_silence_synthesis_result(self, chunk_size) -> SynthesisResult:
-        async def chunk_generator():
+        async def chunk_generator() -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
             size_of_silence = int(
                 self.trailing_silence_seconds * self.synthesizer_config.sampling_rate
             )
-            silence_byte: bytes
             if self.synthesizer_config.audio_encoding == AudioEncoding.LINEAR16:
-                silence_byte = PCM_SILENCE_BYTE
                 size_of_silence *= 2
-            elif self.synthesizer_config.audio_encoding == AudioEncoding.MULAW:
-                silence_byte = MULAW_SILENCE_BYTE
+            silent_chunk = get_silent_chunk(self.synthesizer_config.audio_encoding, chunk_size)
 
             for _ in range(
                 0,
                 size_of_silence,
                 chunk_size,
             ):
-                yield SynthesisResult.ChunkResult(silence_byte * chunk_size, False)
-            yield SynthesisResult.ChunkResult(silence_byte * chunk_size, True)
+                yield SynthesisResult.ChunkResult(silent_chunk, False)
+            yield SynthesisResult.ChunkResult(silent_chunk, True)
 
         def get_message_up_to(seconds):
             return ""
@@ -217,6 +214,34 @@ class CachedAudio:
         )
 
 
+class PreRenderedAudio:
+    def __init__(
+        self,
+        message: BaseMessage,
+        phrase: PreRenderedPhrase,
+        synthesizer_config: SynthesizerConfig,
+    ):
+        self.message = message
+        self.phrase = phrase
+        self.synthesizer_config = synthesizer_config
+
+    def create_synthesis_result(self) -> SynthesisResult:
+        async def chunk_generator() -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
+            for i, chunk in enumerate(self.phrase.chunks):
+                yield SynthesisResult.ChunkResult(chunk, i == len(self.phrase.chunks) - 1)
+
+        def get_message_up_to(seconds: Optional[float]):
+            return BaseSynthesizer.get_message_cutoff_from_total_response_length(
+                self.synthesizer_config, self.message, seconds, self.phrase.num_bytes
+            )
+
+        return SynthesisResult(
+            chunk_generator=chunk_generator(),
+            get_message_up_to=get_message_up_to,
+            cached=True,
+        )
+
+
 class SilenceAudio(CachedAudio):
     def __init__(
         self,
@@ -240,6 +265,8 @@ SynthesizerConfigType = TypeVar("SynthesizerConfigType", bound=SynthesizerConfig
 class BaseSynthesizer(Generic[SynthesizerConfigType]):
     streaming_conversation: "StreamingConversation"
     total_chars: int
+    # whether create_speech can be called for the next messages before earlier calls return
+    supports_concurrent_speech: bool = True
 
     def __init__(
         self,
@@ -329,6 +356,19 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
         tokens = word_tokenize(message.text)
         return TreebankWordDetokenizer().detokenize(tokens[:estimated_words_spoken])
 
+    def is_cacheable(self, message: BaseMessage) -> bool:
+        """Backchannels (including fillers) and messages with a `cache_phrase`, e.g. initial
+        messages, repeat across calls, so their audio is written to the audio cache. Wav encoded
+        audio is streamed as separately encoded chunks, which can't be stored as one."""
+        return (
+            isinstance(message, BotBackchannel) or message.cache_phrase is not None
+        ) and not self.synthesizer_config.should_encode_as_wav
+
+    def _get_trailing_silence_seconds(self, message: BaseMessage) -> float:
+        if isinstance(message, BotBackchannel):
+            return message.trailing_silence_seconds
+        return 0.0
+
     async def get_cached_audio(
         self,
         message: BaseMessage,
@@ -341,11 +381,88 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
         if audio_data is None:
             return None
         logger.info(f"Got cached audio for {cache_phrase}")
+        return CachedAudio(
+            message,
+            audio_data,
+            self.synthesizer_config,
+            self._get_trailing_silence_seconds(message),
+        )
 
-        trailing_silence_seconds = 0.0
-        if isinstance(message, BotBackchannel):
-            trailing_silence_seconds = message.trailing_silence_seconds
-        return CachedAudio(message, audio_data, self.synthesizer_config, trailing_silence_seconds)
+    async def get_or_create_cached_audio(
+        self,
+        message: BaseMessage,
+        chunk_size: int,
+        is_first_text_chunk: bool = False,
+        is_sole_text_chunk: bool = False,
+    ) -> SynthesisResult:
+        """Returns the cached audio for a cacheable message. On a miss, the message is synthesized
+        and streamed as usual while its audio is collected and cached once the synthesis ends.
+        Calls that miss on the same phrase meanwhile wait for that synthesis."""
+        audio_cache = await AudioCache.safe_create()
+        voice_identifier = self.get_voice_identifier(self.synthesizer_config)
+        cache_phrase = message.cache_phrase or message.text.strip()
+
+        audio_data = await audio_cache.get_audio(voice_identifier, cache_phrase)
+        if audio_data is None:
+            creation = audio_cache.get_audio_creation(voice_identifier, cache_phrase)
+            if creation is not None:
+                # None if the synthesis failed, in which case we synthesize it ourselves
+                audio_data = await asyncio.shield(creation)
+        if audio_data is not None:
+            return CachedAudio(
+                message,
+                audio_data,
+                self.synthesizer_config,
+                self._get_trailing_silence_seconds(message),
+            ).create_synthesis_result(chunk_size)
+
+        creation = audio_cache.start_audio_creation(voice_identifier, cache_phrase)
+        try:
+            synthesis_result = await self.create_speech_uncached(
+                message,
+                chunk_size,
+                is_first_text_chunk=is_first_text_chunk,
+                is_sole_text_chunk=is_sole_text_chunk,
+            )
+        except BaseException:
+            await audio_cache.finish_audio_creation(voice_identifier, cache_phrase, creation, None)
+            raise
+
+        synthesis_chunks = synthesis_result.chunk_generator
+        chunk_results: asyncio.Queue[Union[SynthesisResult.ChunkResult, Exception, None]] = (
+            asyncio.Queue()
+        )
+
+        # the synthesis is drained in the background, so that it completes (and waiting calls are
+        # released) even if the caller stops consuming it, e.g. when the bot is interrupted
+        async def collect_audio() -> None:
+            chunks: List[bytes] = []
+            audio: Optional[bytes] = None
+            try:
+                async for chunk_result in synthesis_chunks:
+                    chunks.append(chunk_result.chunk)
+                    chunk_results.put_nowait(chunk_result)
+                audio = b"".join(chunks)
+            except Exception as e:
+                chunk_results.put_nowait(e)
+            finally:
+                chunk_results.put_nowait(None)
+                await audio_cache.finish_audio_creation(
+                    voice_identifier, cache_phrase, creation, audio
+                )
+
+        async def chunk_generator() -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
+            while True:
+                chunk_result = await chunk_results.get()
+                if chunk_result is None:
+                    break
+                if isinstance(chunk_result, Exception):
+                    raise chunk_result
+                yield chunk_result
+
+        asyncio_create_task(collect_audio())
+        synthesis_result.chunk_generator = chunk_generator()
+        return synthesis_result
 
     async def create_speech_uncached(
         self,
@@ -369,6 +486,20 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
                 self.synthesizer_config,
             ).create_synthesis_result(chunk_size)
 
+        if not isinstance(message, BotBackchannel):
+            phrase = PhraseBank().get_phrase(self, message.cache_phrase or message.text, chunk_size)
+            if phrase is not None:
+                return PreRenderedAudio(
+                    message, phrase, self.synthesizer_config
+                ).create_synthesis_result()
+
+        if self.is_cacheable(message):
+            return await self.get_or_create_cached_audio(
+                message,
+                chunk_size,
+                is_first_text_chunk=is_first_text_chunk,
+                is_sole_text_chunk=is_sole_text_chunk,
+            )
         maybe_cached_audio = await self.get_cached_audio(message)
         if maybe_cached_audio is not None:
             return maybe_cached_audio.create_synthesis_result(chunk_size)
@@ -455,12 +586,10 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
             while True:
                 # Get the wav chunk and the flag from the output queue of the MiniaudioWorker
                 wav_chunk, is_last = await miniaudio_worker_consumer.input_queue.get()
+                # the worker already outputs audio in the synthesizer's encoding
                 if self.synthesizer_config.should_encode_as_wav:
                     wav_chunk = encode_as_wav(wav_chunk, self.synthesizer_config)
 
-                if self.synthesizer_config.audio_encoding == AudioEncoding.MULAW:
-                    wav_chunk = audioop.lin2ulaw(wav_chunk, 2)
-
                 yield SynthesisResult.ChunkResult(wav_chunk, is_last)
                 # If this is the last chunk, break the loop
                 if is_last:
@@ -476,16 +605,7 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
         current_sample_rate: int,
         target_sample_rate: int,
     ) -> bytes:
-        resampled_chunk, _ = audioop.ratecv(
-            chunk,
-            2,
-            1,
-            current_sample_rate,
-            target_sample_rate,
-            None,
-        )
-
-        return resampled_chunk
+        return dsp.resample(chunk, current_sample_rate, target_sample_rate)
 
     async def tear_down(self):
         pass
@@ -12,6 +12,9 @@ from vocode.streaming.synthesizer.base_synthesizer import BaseSynthesizer, Synth
 
 
 class CartesiaSynthesizer(BaseSynthesizer[CartesiaSynthesizerConfig]):
+    # messages of a turn continue one Cartesia context, so they must be sent in order
+    supports_concurrent_speech = False
+
     def __init__(
         self,
         synthesizer_config: CartesiaSynthesizerConfig,
@@ -1,12 +1,14 @@
 import asyncio
-import audioop
 import base64
-from typing import AsyncGenerator, List, Optional, Tuple
+import time
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional, Tuple
 
 import numpy as np
 import websockets
 from loguru import logger
 from pydantic import BaseModel, conint
+from websockets.asyncio.client import ClientConnection
+from websockets.protocol import State
 
 from vocode.streaming.models.audio import AudioEncoding, SamplingRate
 from vocode.streaming.models.message import BaseMessage, BotBackchannel, LLMToken
@@ -14,9 +16,23 @@ from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
 from vocode.streaming.synthesizer.base_synthesizer import BaseSynthesizer, SynthesisResult
 from vocode.streaming.synthesizer.eleven_labs_synthesizer import ElevenLabsSynthesizer
 from vocode.streaming.synthesizer.input_streaming_synthesizer import InputStreamingSynthesizer
+from vocode.streaming.utils import dsp
+from vocode.streaming.utils.metrics import counter, timing
 
 NONCE = "071b5f21-3b24-4427-817e-62508007ae60"
 ELEVEN_LABS_BASE_URL = "wss://api.elevenlabs.io/v1/"
+# ElevenLabs closes a stream-input socket that hasn't been sent text for this long (at most 180s)
+WEBSOCKET_INACTIVITY_TIMEOUT_SECONDS = 180
+# a warm socket that hasn't been used by then is replaced, so it's never handed out as it closes
+WARM_WEBSOCKET_MAX_IDLE_SECONDS = 150
+RECONNECT_MIN_DELAY_SECONDS = 0.5
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+websocket_handshake_latency = timing("synthesizer.eleven_labs_ws.handshake")
+websocket_first_audio_latency = timing("synthesizer.eleven_labs_ws.first_audio")
+warm_websockets_used = counter("synthesizer.eleven_labs_ws.warm_websockets_used")
+cold_websockets_used = counter("synthesizer.eleven_labs_ws.cold_websockets_used")
+websocket_connect_errors = counter("synthesizer.eleven_labs_ws.connect_errors")
 
 
 # Based on https://github.com/elevenlabs/elevenlabs-python/blob/main/src/elevenlabs/tts.py
@@ -76,6 +92,108 @@ class ElevenLabsWebsocketResponse(BaseModel):
         return f"ElevenLabsWebsocketResponse(has_audio={self.audio is not None}, isFinal={self.isFinal}, alignment={self.alignment})"
 
 
+class ElevenLabsWebsocketConnectionManager:
+    """Keeps a connected stream-input websocket ready for the next turn.
+
+    `connect` opens a socket and sends the first message, which carries the voice settings and
+    the API key, so a turn that `take`s a warm socket can send its text straight away instead of
+    waiting for the TLS and websocket handshakes. ElevenLabs closes the socket once a turn's
+    audio is final, so every `take` starts connecting the next one in the background. A warm
+    socket that isn't used within `max_idle_seconds` is replaced, and failed connections are
+    retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[ClientConnection]],
+        max_idle_seconds: float = WARM_WEBSOCKET_MAX_IDLE_SECONDS,
+    ):
+        self.connect = connect
+        self.max_idle_seconds = max_idle_seconds
+        self.next_websocket: Optional[asyncio.Task[ClientConnection]] = None
+        self.reconnect_delay = RECONNECT_MIN_DELAY_SECONDS
+        self.scheduled_refresh: Optional[asyncio.TimerHandle] = None
+
+    def prewarm(self):
+        """Starts connecting the next socket, if one isn't ready or on its way."""
+        if self.next_websocket is not None:
+            return
+        self.next_websocket = asyncio.create_task(self.connect())
+        self.next_websocket.add_done_callback(self._on_connected)
+
+    def _on_connected(self, task: asyncio.Task[ClientConnection]):
+        if task is not self.next_websocket or task.cancelled():
+            return
+        self._cancel_scheduled_refresh()
+        loop = asyncio.get_running_loop()
+        if task.exception() is not None:
+            websocket_connect_errors.inc()
+            logger.warning(f"Failed to prewarm ElevenLabs websocket: {task.exception()}")
+            self.scheduled_refresh = loop.call_later(self.reconnect_delay, self._refresh)
+            self.reconnect_delay = min(self.reconnect_delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+        else:
+            self.reconnect_delay = RECONNECT_MIN_DELAY_SECONDS
+            self.scheduled_refresh = loop.call_later(self.max_idle_seconds, self._refresh)
+
+    def _refresh(self):
+        self.scheduled_refresh = None
+        self._discard_next_websocket()
+        self.prewarm()
+
+    def _cancel_scheduled_refresh(self):
+        if self.scheduled_refresh is not None:
+            self.scheduled_refresh.cancel()
+            self.scheduled_refresh = None
+
+    def _discard_next_websocket(self):
+        task, self.next_websocket = self.next_websocket, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        else:
+            self._close_unused(task)
+
+    async def take(self) -> ClientConnection:
+        """Returns the warm socket (waiting for it if it's still connecting), or connects a new
+        one if it failed or was closed, and starts warming up the one after it."""
+        self._cancel_scheduled_refresh()
+        task, self.next_websocket = self.next_websocket, None
+        websocket: Optional[ClientConnection] = None
+        if task is not None:
+            try:
+                websocket = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # keep the socket for the next turn rather than throwing the handshake away
+                if self.next_websocket is None:
+                    self.next_websocket = task
+                    if task.done():
+                        self._on_connected(task)
+                else:
+                    task.add_done_callback(self._close_unused)
+                raise
+            except Exception as e:
+                logger.debug(f"Warm ElevenLabs websocket failed to connect: {e}")
+            if websocket is not None and websocket.state is not State.OPEN:
+                websocket = None
+        if websocket is None:
+            cold_websockets_used.inc()
+            websocket = await self.connect()
+        else:
+            warm_websockets_used.inc()
+        self.prewarm()
+        return websocket
+
+    @staticmethod
+    def _close_unused(task: asyncio.Task[ClientConnection]):
+        if not task.cancelled() and task.exception() is None:
+            asyncio.create_task(task.result().close())
+
+    async def close(self):
+        self._cancel_scheduled_refresh()
+        self._discard_next_websocket()
+
+
 class ElevenLabsWSSynthesizer(
     BaseSynthesizer[ElevenLabsSynthesizerConfig], InputStreamingSynthesizer
 ):
@@ -112,6 +230,15 @@ class ElevenLabsWSSynthesizer(
         self.upsample = None
         self.sample_rate = self.synthesizer_config.sampling_rate
 
+        self.connection_manager = ElevenLabsWebsocketConnectionManager(self.connect_websocket)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # not created by a conversation, the first turn connects instead
+        else:
+            # connect while the conversation starts, so the first turn gets a warm socket too
+            self.connection_manager.prewarm()
+
         # While this looks useless, we need to assign the response of `asyncio.gather`
         # to *something* or we risk garbage collection of the running coroutines spawned
         # by `asyncio.gather`.
@@ -152,35 +279,57 @@ class ElevenLabsWSSynthesizer(
 
     def reduce_chunk_amplitude(self, chunk: bytes, factor: float) -> bytes:
         if self.synthesizer_config.audio_encoding == AudioEncoding.MULAW:
-            chunk = audioop.ulaw2lin(chunk, 2)
-        pcm = np.frombuffer(chunk, dtype=np.int16)
-        pcm = (pcm * factor).astype(np.int16)
-        pcm_bytes = pcm.tobytes()
-        if self.synthesizer_config.audio_encoding == AudioEncoding.MULAW:
-            return audioop.lin2ulaw(pcm_bytes, 2)
-        else:
-            return pcm_bytes
+            return dsp.ulaw_encode(
+                dsp.apply_gain(dsp.ulaw_decode(np.frombuffer(chunk, dtype=np.uint8)), factor)
+            ).tobytes()
+        return dsp.apply_gain(dsp.pcm16_view(chunk), factor).tobytes()
 
-    async def establish_websocket_listeners(self, chunk_size):
+    def get_websocket_url(self) -> str:
         url = (
             ELEVEN_LABS_BASE_URL
             + f"text-to-speech/{self.voice_id}/stream-input?output_format={self.output_format}"
+            + f"&inactivity_timeout={WEBSOCKET_INACTIVITY_TIMEOUT_SECONDS}"
         )
         if self.optimize_streaming_latency:
             url += f"&optimize_streaming_latency={self.optimize_streaming_latency}"
         if self.model_id:
             url += f"&model_id={self.model_id}"
-        headers = {"xi-api-key": self.api_key}
+        return url
+
+    async def connect_websocket(self) -> ClientConnection:
+        """Opens a stream-input socket and sends the first message, which only initializes it."""
+        start = time.monotonic()
+        ws = await websockets.connect(
+            self.get_websocket_url(),
+            additional_headers={"xi-api-key": self.api_key},
+        )
+        try:
+            await ws.send(
+                ElevenLabsWebsocketFirstMessage(
+                    text=" ",
+                    voice_settings=self.get_eleven_labs_websocket_voice_settings(),
+                    generation_config=ElevenLabsWebsocketGenerationConfig(
+                        chunk_length_schedule=[50],
+                    ),
+                    try_trigger_generation=False,
+                    xi_api_key=self.api_key,
+                ).json(exclude_none=True)
+            )
+        except BaseException:
+            await ws.close()
+            raise
+        websocket_handshake_latency.observe(time.monotonic() - start)
+        return ws
 
+    async def establish_websocket_listeners(self, chunk_size):
         backchannelled = False
+        first_text_sent_at: Optional[float] = None
 
-        async with websockets.connect(
-            url,
-            additional_headers=headers,
-        ) as ws:
+        ws = await self.connection_manager.take()
+        try:
 
             async def write() -> None:
-                nonlocal backchannelled
+                nonlocal backchannelled, first_text_sent_at
                 try:
                     first_message = True
                     while True:
@@ -189,29 +338,21 @@ class ElevenLabsWSSynthesizer(
                             break
                         if first_message and isinstance(message, BotBackchannel):
                             backchannelled = True
-                        eleven_labs_ws_message = (
+                        await ws.send(
                             ElevenLabsWebsocketMessage(
                                 text=message.text,
                                 flush=not isinstance(message, LLMToken),
                             ).json()
-                            if not first_message
-                            else ElevenLabsWebsocketFirstMessage(
-                                text=message.text,
-                                voice_settings=self.get_eleven_labs_websocket_voice_settings(),
-                                generation_config=ElevenLabsWebsocketGenerationConfig(
-                                    chunk_length_schedule=[50],
-                                ),
-                                flush=not isinstance(message, LLMToken),
-                                xi_api_key=self.api_key,
-                            ).json(exclude_none=True)
                         )
-                        await ws.send(eleven_labs_ws_message)
+                        if first_message:
+                            first_text_sent_at = time.monotonic()
                         first_message = False
                 finally:
                     await ws.send(ElevenLabsWebsocketMessage(text="").json())
 
             async def listen() -> None:
                 """Listen to the websocket for audio data and stream it."""
+                nonlocal first_text_sent_at
 
                 first_message = True
                 buffer = bytearray()
@@ -221,6 +362,11 @@ class ElevenLabsWSSynthesizer(
                         continue
                     response = ElevenLabsWebsocketResponse.model_validate_json(message)
                     if response.audio:
+                        if first_text_sent_at is not None:
+                            websocket_first_audio_latency.observe(
+                                time.monotonic() - first_text_sent_at
+                            )
+                            first_text_sent_at = None
                         decoded = base64.b64decode(response.audio)
                         seconds = len(decoded) / (
                             self.sample_width * self.synthesizer_config.sampling_rate
@@ -263,6 +409,8 @@ class ElevenLabsWSSynthesizer(
             self.websocket_tasks["listener"] = asyncio.create_task(listen())
             self.websocket_tasks["writer"] = asyncio.create_task(write())
             self.websocket_functions = await asyncio.gather(*self.websocket_tasks.values())
+        finally:
+            await ws.close()
 
     def get_current_utterance_synthesis_result(self):
         return SynthesisResult(
@@ -353,4 +501,5 @@ class ElevenLabsWSSynthesizer(
 
     async def tear_down(self):
         await self.cancel_websocket_tasks()
+        await self.connection_manager.close()
         await super().tear_down()
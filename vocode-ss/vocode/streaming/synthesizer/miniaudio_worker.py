@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import queue
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import miniaudio
 from loguru import logger
 
+from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.models.synthesizer import SynthesizerConfig
-from vocode.streaming.utils import convert_wav
-from vocode.streaming.utils.mp3_helper import decode_mp3
+from vocode.streaming.utils import convert_linear_audio
+from vocode.streaming.utils.mp3_helper import StreamingMP3Source, stream_decode_mp3
 from vocode.streaming.utils.worker import AbstractWorker, ThreadAsyncWorker
 
 
@@ -24,6 +25,11 @@ class MiniaudioWorker(ThreadAsyncWorker[Union[bytes, None]]):
         super().__init__()
         self.synthesizer_config = synthesizer_config
         self.chunk_size = chunk_size
+        # decode roughly one output chunk's worth of audio per decoder read
+        self.frames_per_read = max(
+            chunk_size // (2 if synthesizer_config.audio_encoding == AudioEncoding.LINEAR16 else 1),
+            1,
+        )
         self._ended = False
 
     async def run_thread_forwarding(self):
@@ -43,58 +49,55 @@ class MiniaudioWorker(ThreadAsyncWorker[Union[bytes, None]]):
             except asyncio.CancelledError:
                 break
 
-    def _run_loop(self):
-        # tracks the mp3 so far
-        current_mp3_buffer = bytearray()
-        # tracks the wav so far
-        current_wav_buffer = bytearray()
-        # the leftover chunks of the wav that haven't been sent to the output queue yet
-        current_wav_output_buffer = bytearray()
+    def _get_next_mp3_chunk(self) -> Optional[bytes]:
+        # blocks until the next mp3 chunk arrives, returns None at the end of the utterance
         while not self._ended:
-            # Get a tuple of (mp3_chunk, is_last) from the input queue
             try:
-                mp3_chunk = self.input_janus_queue.sync_q.get(timeout=1)
+                return self.input_janus_queue.sync_q.get(timeout=1)
             except queue.Empty:
                 continue
-            if mp3_chunk is None:
-                current_mp3_buffer.clear()
-                current_wav_buffer.clear()
-                self.output_janus_queue.sync_q.put((bytes(current_wav_output_buffer), True))
-                current_wav_output_buffer.clear()
-                continue
-            try:
-                current_mp3_buffer.extend(mp3_chunk)
-                output_bytes = decode_mp3(bytes(current_mp3_buffer))
-            except miniaudio.DecodeError as e:
-                # TODO: better logging
-                logger.exception("MiniaudioWorker error: " + str(e), exc_info=True)
-                self.output_janus_queue.sync_q.put(
-                    (bytes(current_wav_output_buffer), True)
-                )  # sentinel
-                continue
-            converted_output_bytes = convert_wav(
-                output_bytes,
-                output_sample_rate=self.synthesizer_config.sampling_rate,
-                output_encoding=self.synthesizer_config.audio_encoding,
-            )
-            # take the difference between the current_wav_buffer and the converted_output_bytes
-            # and put the difference in the output buffer
-            new_bytes = converted_output_bytes[len(current_wav_buffer) :]
-            current_wav_output_buffer.extend(new_bytes)
+        return None
 
-            # chunk up new_bytes in chunks of chunk_size bytes, but keep the last chunk (less than chunk size) in the wav output buffer
-            output_buffer_idx = 0
-            while output_buffer_idx < len(current_wav_output_buffer) - self.chunk_size:
-                chunk = current_wav_output_buffer[
-                    output_buffer_idx : output_buffer_idx + self.chunk_size
-                ]
-                self.output_janus_queue.sync_q.put(
-                    (chunk, False)
-                )  # don't need to use bytes() since we already sliced it (which is a copy)
-                output_buffer_idx += self.chunk_size
+    def _run_loop(self):
+        while not self._ended:
+            self._decode_utterance()
 
-            current_wav_output_buffer = current_wav_output_buffer[output_buffer_idx:]
-            current_wav_buffer.extend(new_bytes)
+    def _decode_utterance(self):
+        # the leftover bytes of the output that haven't been sent to the output queue yet
+        output_buffer = bytearray()
+        source = StreamingMP3Source(self._get_next_mp3_chunk)
+        try:
+            for pcm_chunk in stream_decode_mp3(
+                source,
+                output_sample_rate=self.synthesizer_config.sampling_rate,
+                frames_per_read=self.frames_per_read,
+            ):
+                output_buffer.extend(
+                    convert_linear_audio(
+                        pcm_chunk,
+                        input_sample_rate=self.synthesizer_config.sampling_rate,
+                        output_sample_rate=self.synthesizer_config.sampling_rate,
+                        output_encoding=self.synthesizer_config.audio_encoding,
+                    )
+                )
+                # send full chunks, keep the last chunk (less than chunk size) in the output buffer
+                while len(output_buffer) >= self.chunk_size:
+                    self.output_janus_queue.sync_q.put(
+                        (bytes(output_buffer[: self.chunk_size]), False)
+                    )
+                    del output_buffer[: self.chunk_size]
+        except miniaudio.DecodeError as e:
+            if self._ended:
+                return
+            if source.bytes_received > 0:
+                # TODO: better logging
+                logger.exception("MiniaudioWorker error: " + str(e), exc_info=True)
+            # drain the rest of the utterance so it isn't decoded as the start of the next one
+            while not source.ended:
+                source.read(len(source.buffer) or 1)
+        if self._ended:
+            return
+        self.output_janus_queue.sync_q.put((bytes(output_buffer), True))  # sentinel
 
     async def terminate(self):
         self._ended = True
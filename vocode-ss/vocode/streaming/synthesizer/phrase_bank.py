@@ -0,0 +1,148 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+from pydantic.v1 import BaseModel
+
+from vocode.streaming.constants import TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import SynthesizerConfig
+from vocode.streaming.utils import get_chunk_size_per_second
+from vocode.streaming.utils.metrics import counter, gauge
+from vocode.streaming.utils.singleton import Singleton
+
+if TYPE_CHECKING:
+    from vocode.streaming.synthesizer.base_synthesizer import BaseSynthesizer
+
+
+class PhraseBankConfig(BaseModel):
+    synthesizer_config: SynthesizerConfig
+    phrases: List[str]
+
+
+class PhraseKey(NamedTuple):
+    voice_identifier: str
+    audio_encoding: AudioEncoding
+    sampling_rate: int
+    chunk_size: int
+    text: str
+
+
+class PreRenderedPhrase(NamedTuple):
+    chunks: Tuple[bytes, ...]
+    num_bytes: int
+
+
+def get_default_chunk_size(synthesizer_config: SynthesizerConfig) -> int:
+    """The chunk size StreamingConversation asks its synthesizer for."""
+    return int(
+        TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS
+        * get_chunk_size_per_second(
+            synthesizer_config.audio_encoding, synthesizer_config.sampling_rate
+        )
+    )
+
+
+class PhraseBank(Singleton):
+    """Phrases synthesized ahead of time, e.g. initial messages and goodbyes.
+
+    Each phrase is rendered once per voice, encoding, sampling rate and chunk size, and stored
+    already split into output chunks so it can be played straight from memory.
+    """
+
+    def __init__(self):
+        self.phrases: Dict[PhraseKey, PreRenderedPhrase] = {}
+        self.hits = counter("phrase_bank.hits")
+        self.size_gauge = gauge("phrase_bank.bytes")
+
+    @staticmethod
+    def get_phrase_key(
+        synthesizer: "BaseSynthesizer", text: str, chunk_size: int
+    ) -> Optional[PhraseKey]:
+        synthesizer_config = synthesizer.get_synthesizer_config()
+        try:
+            voice_identifier = synthesizer.get_voice_identifier(synthesizer_config)
+        except NotImplementedError:
+            return None
+        return PhraseKey(
+            voice_identifier=voice_identifier,
+            audio_encoding=synthesizer_config.audio_encoding,
+            sampling_rate=synthesizer_config.sampling_rate,
+            chunk_size=chunk_size,
+            text=text.strip(),
+        )
+
+    def get_phrase(
+        self, synthesizer: "BaseSynthesizer", text: str, chunk_size: int
+    ) -> Optional[PreRenderedPhrase]:
+        if not self.phrases:
+            return None
+        phrase_key = self.get_phrase_key(synthesizer, text, chunk_size)
+        if phrase_key is None:
+            return None
+        phrase = self.phrases.get(phrase_key)
+        if phrase is not None:
+            self.hits.inc()
+        return phrase
+
+    def set_phrase(self, phrase_key: PhraseKey, chunks: List[bytes]):
+        previous = self.phrases.get(phrase_key)
+        self.phrases[phrase_key] = PreRenderedPhrase(
+            chunks=tuple(chunks), num_bytes=sum(len(chunk) for chunk in chunks)
+        )
+        self.size_gauge.inc(
+            self.phrases[phrase_key].num_bytes - (previous.num_bytes if previous else 0)
+        )
+
+    async def warm(
+        self,
+        synthesizer: "BaseSynthesizer",
+        phrases: List[str],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """Renders every phrase that isn't in the bank yet. Returns how many were added; phrases
+        that fail to synthesize are logged and skipped."""
+        chunk_size = chunk_size or get_default_chunk_size(synthesizer.get_synthesizer_config())
+        phrase_keys = []
+        for text in set(phrases):
+            phrase_key = self.get_phrase_key(synthesizer, text, chunk_size)
+            if phrase_key is None:
+                logger.warning(f"{type(synthesizer).__name__} doesn't support the phrase bank")
+                return 0
+            if phrase_key not in self.phrases:
+                phrase_keys.append(phrase_key)
+
+        results = await asyncio.gather(
+            *(self._render(synthesizer, phrase_key) for phrase_key in phrase_keys),
+            return_exceptions=True,
+        )
+        num_added = 0
+        for phrase_key, result in zip(phrase_keys, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to pre-render {phrase_key.text!r}: {result!r}")
+                continue
+            self.set_phrase(phrase_key, result)
+            num_added += 1
+        return num_added
+
+    async def _render(self, synthesizer: "BaseSynthesizer", phrase_key: PhraseKey) -> List[bytes]:
+        synthesis_result = await synthesizer.create_speech_uncached(
+            BaseMessage(text=phrase_key.text),
+            phrase_key.chunk_size,
+            is_first_text_chunk=True,
+            is_sole_text_chunk=True,
+        )
+        chunks = [chunk_result.chunk async for chunk_result in synthesis_result.chunk_generator]
+        if synthesizer.get_synthesizer_config().should_encode_as_wav:
+            # every chunk carries its own wav header, so they can't be re-split
+            return chunks
+        audio = b"".join(chunks)
+        return [
+            audio[i : i + phrase_key.chunk_size]
+            for i in range(0, len(audio), phrase_key.chunk_size)
+        ]
+
+    def clear(self):
+        self.phrases.clear()
+        self.size_gauge.set(0)
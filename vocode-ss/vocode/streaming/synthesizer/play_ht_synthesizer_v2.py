@@ -1,5 +1,4 @@
 import asyncio
-import audioop
 import os
 from typing import AsyncGenerator, AsyncIterator, Optional
 
@@ -17,7 +16,11 @@ from vocode.streaming.synthesizer.play_ht_synthesizer import (
     PlayHtSynthesizer as VocodePlayHtSynthesizer,
 )
 from vocode.streaming.synthesizer.synthesizer_utils import split_text
-from vocode.streaming.utils import generate_from_async_iter_with_lookahead, generate_with_is_last
+from vocode.streaming.utils import (
+    dsp,
+    generate_from_async_iter_with_lookahead,
+    generate_with_is_last,
+)
 from vocode.streaming.utils.create_task import asyncio_create_task
 
 PLAY_HT_ON_PREM_ADDR = os.environ.get("VOCODE_PLAYHT_ON_PREM_ADDR", None)
@@ -110,7 +113,7 @@ class PlayHtSynthesizerV2(VocodePlayHtSynthesizer):
     def _contains_voice_experimental(self, chunk: bytes):
         pcm = np.frombuffer(
             (
-                audioop.ulaw2lin(chunk, 2)
+                dsp.ulaw2lin(chunk)
                 if self.synthesizer_config.audio_encoding == AudioEncoding.MULAW
                 else chunk
             ),
@@ -132,22 +135,12 @@ class PlayHtSynthesizerV2(VocodePlayHtSynthesizer):
             raise Exception(f"Unsupported audio format: {self.synthesizer_config.audio_encoding}")
 
     async def _downsample_pcm(self, chunk: bytes) -> bytes:
-        downsampled_chunk, _ = audioop.ratecv(
-            chunk,
-            2,
-            1,
-            24000,
-            self.synthesizer_config.sampling_rate,
-            None,
-        )
-
-        return downsampled_chunk
+        return dsp.resample(chunk, 24000, self.synthesizer_config.sampling_rate)
 
     async def _downsample_mulaw(self, chunk: bytes) -> bytes:
-        pcm_data = audioop.ulaw2lin(chunk, 2)
+        pcm_data = dsp.ulaw2lin(chunk)
         downsampled_pcm_data = await self._downsample_pcm(pcm_data)
-        downsampled_chunk = audioop.lin2ulaw(downsampled_pcm_data, 2)
-        return downsampled_chunk
+        return dsp.lin2ulaw(downsampled_pcm_data)
 
     async def downsample_async_generator(self, async_gen: AsyncGenerator[bytes, None]):
         async for play_ht_chunk in async_gen:
@@ -1,7 +1,10 @@
+import asyncio
 from typing import Optional
 
 from vocode.streaming.models.telephony import BaseCallConfig
 
+CONFIG_DELETION_POLLING_INTERVAL_SECONDS = 2
+
 
 class BaseConfigManager:
     async def save_config(self, conversation_id: str, config: BaseCallConfig):
@@ -12,3 +15,21 @@ class BaseConfigManager:
 
     async def delete_config(self, conversation_id):
         raise NotImplementedError
+
+    async def wait_for_config_deletion(
+        self, conversation_id: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Waits until the config is deleted, which happens when its call ends.
+
+        Returns False if `timeout` seconds pass first. Subclasses that can be notified of
+        deletions should override this; the default polls `get_config`.
+        """
+        try:
+            await asyncio.wait_for(self._poll_for_config_deletion(conversation_id), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _poll_for_config_deletion(self, conversation_id: str):
+        while await self.get_config(conversation_id) is not None:
+            await asyncio.sleep(CONFIG_DELETION_POLLING_INTERVAL_SECONDS)
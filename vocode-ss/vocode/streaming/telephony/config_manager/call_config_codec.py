@@ -0,0 +1,167 @@
+"""Compact, versioned encoding of call configs for the config manager.
+
+A stored config is a short header followed by the zlib-compressed, whitespace-free JSON of the
+config. Prompts make up most of a config and compress well, so this is several times smaller
+than `.json()`. The header holds the encoding version and a hash of the model schemas of the
+process that wrote it. If a reader's schemas hash the same, the JSON was produced by identical
+models and is rebuilt without re-running validation; otherwise (e.g. mid-deploy) it goes
+through `BaseCallConfig.parse_obj` as before. Values without a header are plain `.json()`
+written by older versions and are still read.
+"""
+
+import enum
+import hashlib
+import json
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic.v1 import BaseModel as Pydantic1BaseModel
+from pydantic.v1 import ValidationError
+from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SINGLETON, ModelField
+
+from vocode.streaming.models.model import TypedModel
+from vocode.streaming.models.telephony import BaseCallConfig
+from vocode.streaming.utils.metrics import counter
+
+CALL_CONFIG_MAGIC = b"VCC"
+CALL_CONFIG_ENCODING_VERSION = 1
+SCHEMA_HASH_SIZE = 8
+HEADER_SIZE = len(CALL_CONFIG_MAGIC) + 1 + SCHEMA_HASH_SIZE
+
+schema_mismatches = counter("config_manager.schema_mismatches")
+
+_MISSING = object()
+
+# the schema hash covers every registered TypedModel, so it's recomputed when more are imported
+_schema_hash: Optional[bytes] = None
+_schema_hash_num_subtypes = -1
+_construction_plans: Dict[type, List[Tuple[str, str, ModelField, int, Callable[[Any], Any]]]] = {}
+
+
+def _describe_model(model: Type[Pydantic1BaseModel], seen: Set[type], parts: list):
+    if model in seen:
+        return
+    seen.add(model)
+    parts.append(f"{model.__module__}.{model.__qualname__}")
+    for name, field in model.__fields__.items():
+        parts.append(f"{name}:{field.alias}:{field.outer_type_!r}:{field.required}")
+        for sub_field in [field] + list(field.sub_fields or []):
+            if isinstance(sub_field.type_, type) and issubclass(
+                sub_field.type_, Pydantic1BaseModel
+            ):
+                _describe_model(sub_field.type_, seen, parts)
+
+
+def get_schema_hash() -> bytes:
+    global _schema_hash, _schema_hash_num_subtypes
+    if _schema_hash is None or _schema_hash_num_subtypes != len(TypedModel._subtypes_):
+        seen: Set[type] = set()
+        parts: list = []
+        for type_, model in sorted(TypedModel._subtypes_, key=lambda subtype: str(subtype[0])):
+            parts.append(str(type_))
+            _describe_model(model, seen, parts)
+        _schema_hash = hashlib.sha256("\n".join(parts).encode()).digest()[:SCHEMA_HASH_SIZE]
+        _schema_hash_num_subtypes = len(TypedModel._subtypes_)
+    return _schema_hash
+
+
+def encode_call_config(config: BaseCallConfig) -> bytes:
+    header = CALL_CONFIG_MAGIC + bytes([CALL_CONFIG_ENCODING_VERSION]) + get_schema_hash()
+    return header + zlib.compress(config.json(separators=(",", ":")).encode())
+
+
+def decode_call_config(raw: bytes) -> BaseCallConfig:
+    if not raw.startswith(CALL_CONFIG_MAGIC):
+        return BaseCallConfig.parse_raw(raw)
+    version = raw[len(CALL_CONFIG_MAGIC)]
+    if version != CALL_CONFIG_ENCODING_VERSION:
+        raise ValueError(f"Unknown call config encoding version {version}")
+    data = json.loads(zlib.decompress(raw[HEADER_SIZE:]))
+    if raw[len(CALL_CONFIG_MAGIC) + 1 : HEADER_SIZE] == get_schema_hash():
+        return _construct(TypedModel.get_cls(data["type"]), data)
+    schema_mismatches.inc()
+    return BaseCallConfig.parse_obj(data)
+
+
+def _construct(model: Type[Pydantic1BaseModel], data: Dict[str, Any]) -> Any:
+    """Rebuilds a model from JSON it serialized itself, without validating it again."""
+    plan = _construction_plans.get(model)
+    if plan is None:
+        plan = _construction_plans[model] = [
+            (name, field.alias, field, *_plan_field(field))
+            for name, field in model.__fields__.items()
+        ]
+    values = {}
+    for name, alias, field, shape, convert in plan:
+        value = data.get(alias, _MISSING)
+        if value is _MISSING:
+            continue
+        if value is not None:
+            try:
+                if shape == SHAPE_SINGLETON:
+                    value = convert(value)
+                elif shape == SHAPE_LIST:
+                    value = [convert(item) for item in value]
+                else:
+                    value = {key: convert(item) for key, item in value.items()}
+            except _Unsupported:
+                # unions, literals, dates etc. are validated as usual
+                value, errors = field.validate(value, {}, loc=alias, cls=model)  # type: ignore
+                if errors:
+                    raise ValidationError([errors], model)  # type: ignore
+        values[name] = value
+    return model.construct(_fields_set=set(values), **values)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _unsupported(value: Any) -> Any:
+    raise _Unsupported
+
+
+def _plan_field(field: ModelField) -> Tuple[int, Callable[[Any], Any]]:
+    """Picks how to rebuild a field's values: as a single item, list or dict of items."""
+    shape = field.shape
+    if shape == SHAPE_MAPPING:
+        shape = SHAPE_DICT
+    if shape not in (SHAPE_SINGLETON, SHAPE_LIST, SHAPE_DICT) or (
+        shape == SHAPE_SINGLETON and field.sub_fields
+    ):
+        return SHAPE_SINGLETON, _unsupported
+    return shape, _plan_item(field.type_)
+
+
+def _plan_item(type_: Any) -> Callable[[Any], Any]:
+    if not isinstance(type_, type):
+        return _unsupported
+    if issubclass(type_, Pydantic1BaseModel):
+
+        def construct_model(value: Any) -> Any:
+            if not isinstance(value, dict):
+                raise _Unsupported
+            if issubclass(type_, TypedModel):
+                return _construct(TypedModel.get_cls(value["type"]), value)
+            return _construct(type_, value)
+
+        return construct_model
+    if issubclass(type_, enum.Enum):
+        return type_
+    if type_ in (str, int, bool):
+
+        def check_scalar(value: Any) -> Any:
+            if type(value) is not type_:
+                raise _Unsupported
+            return value
+
+        return check_scalar
+    if type_ is float:
+
+        def check_float(value: Any) -> Any:
+            if type(value) not in (int, float):
+                raise _Unsupported
+            return float(value)
+
+        return check_float
+    return _unsupported
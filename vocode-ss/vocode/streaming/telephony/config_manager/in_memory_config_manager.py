@@ -1,4 +1,5 @@
-from typing import Optional
+import asyncio
+from typing import Dict, Optional
 
 from vocode.streaming.models.telephony import BaseCallConfig
 from vocode.streaming.telephony.config_manager.base_config_manager import BaseConfigManager
@@ -7,6 +8,7 @@ from vocode.streaming.telephony.config_manager.base_config_manager import BaseCo
 class InMemoryConfigManager(BaseConfigManager):
     def __init__(self):
         self.configs = {}
+        self.deletion_events: Dict[str, asyncio.Event] = {}
 
     async def save_config(self, conversation_id: str, config: BaseCallConfig):
         self.configs[conversation_id] = config
@@ -17,3 +19,18 @@ class InMemoryConfigManager(BaseConfigManager):
     async def delete_config(self, conversation_id):
         if conversation_id in self.configs:
             del self.configs[conversation_id]
+        deletion_event = self.deletion_events.pop(conversation_id, None)
+        if deletion_event is not None:
+            deletion_event.set()
+
+    async def wait_for_config_deletion(
+        self, conversation_id: str, timeout: Optional[float] = None
+    ) -> bool:
+        if conversation_id not in self.configs:
+            return True
+        deletion_event = self.deletion_events.setdefault(conversation_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(deletion_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
@@ -1,32 +1,148 @@
-from typing import Optional
+import asyncio
+from typing import Dict, Optional
 
 from loguru import logger
-from redis import Redis
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 
 from vocode.streaming.models.telephony import BaseCallConfig
 from vocode.streaming.telephony.config_manager.base_config_manager import BaseConfigManager
-from vocode.streaming.utils.redis import initialize_redis
+from vocode.streaming.telephony.config_manager.call_config_codec import (
+    decode_call_config,
+    encode_call_config,
+)
+from vocode.streaming.utils.create_task import asyncio_create_task
+from vocode.streaming.utils.lru_cache import LRUCache
+from vocode.streaming.utils.redis import initialize_redis_bytes, set_with_ttl
+
+CONFIG_TTL_SECONDS = 60 * 60 * 24
+CONFIG_DELETED_CHANNEL_PREFIX = "config_deleted:"
+# waiters re-check Redis this often in case a deletion message was missed, e.g. during a
+# reconnect or because the config expired instead of being deleted
+CONFIG_DELETION_RECHECK_SECONDS = 30
+# configs read from Redis are kept in process for this long, so repeated lookups during a call
+# don't re-fetch and re-decode them; deletions, from any process, evict them right away
+CONFIG_CACHE_TTL_SECONDS = 60
+CONFIG_CACHE_SIZE = 1000
 
 
 class RedisConfigManager(BaseConfigManager):
     def __init__(self):
-        self.redis: Redis = initialize_redis()
-
-    async def _set_with_one_day_expiration(self, *args, **kwargs):
-        ONE_DAY_SECONDS = 60 * 60 * 24
-        return await self.redis.set(*args, **{**kwargs, "ex": ONE_DAY_SECONDS})
+        self.redis: Redis = initialize_redis_bytes(retries=1)
+        self.configs: LRUCache[str, BaseCallConfig] = LRUCache(
+            max_size=CONFIG_CACHE_SIZE,
+            ttl_seconds=CONFIG_CACHE_TTL_SECONDS,
+            metrics_prefix="config_manager.cache",
+        )
+        self.deletion_events: Dict[str, asyncio.Event] = {}
+        self.pubsub: Optional[PubSub] = None
+        self.deletion_listener_task: Optional[asyncio.Task] = None
+        self.deletion_listener_lock = asyncio.Lock()
+        self.num_deletions_received = 0
 
     async def save_config(self, conversation_id: str, config: BaseCallConfig):
         logger.debug(f"Saving config for {conversation_id}")
-        await self._set_with_one_day_expiration(conversation_id, config.json())
+        self.configs.pop(conversation_id)
+        await set_with_ttl(
+            self.redis, conversation_id, encode_call_config(config), CONFIG_TTL_SECONDS
+        )
 
     async def get_config(self, conversation_id) -> Optional[BaseCallConfig]:
+        """Returns the config, from the in-process cache if it was read recently. Configs are only
+        cached while the deletion listener is running, so deletions by any process evict them.
+        Callers get their own copy, which they may modify."""
+        if self._is_deletion_listener_running():
+            config = self.configs.get(conversation_id)
+            if config is not None:
+                return config.copy(deep=True)
+        else:
+            # deletions may have been missed
+            self.configs.clear()
+        try:
+            # subscribe before reading, so a deletion in between isn't missed
+            await self._ensure_deletion_listener()
+        except Exception:
+            logger.exception("Failed to start the config deletion listener, not caching configs")
         logger.debug(f"Getting config for {conversation_id}")
+        num_deletions_received = self.num_deletions_received
         raw_config = await self.redis.get(conversation_id)  # type: ignore
         if raw_config:
-            return BaseCallConfig.parse_raw(raw_config)
+            config = decode_call_config(raw_config)
+            # a deletion received during the read may be of this config
+            if (
+                self._is_deletion_listener_running()
+                and self.num_deletions_received == num_deletions_received
+            ):
+                self.configs.set(conversation_id, config)
+                return config.copy(deep=True)
+            return config
         return None
 
     async def delete_config(self, conversation_id):
         logger.debug(f"Deleting config for {conversation_id}")
-        await self.redis.delete(conversation_id)
+        self.configs.pop(conversation_id)
+        # one round trip, and waiters can't see the deletion message before the key is gone
+        async with self.redis.pipeline(transaction=True) as pipeline:
+            pipeline.delete(conversation_id)
+            pipeline.publish(f"{CONFIG_DELETED_CHANNEL_PREFIX}{conversation_id}", "")
+            await pipeline.execute()
+
+    async def wait_for_config_deletion(
+        self, conversation_id: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Waits for the deletion message published by `delete_config` (from any process) over a
+        single pub/sub connection shared by all waiters."""
+        deletion_event = self.deletion_events.setdefault(conversation_id, asyncio.Event())
+        try:
+            # subscribe before checking, so a deletion in between isn't missed
+            await self._ensure_deletion_listener()
+            await asyncio.wait_for(
+                self._wait_for_deletion_event(conversation_id, deletion_event), timeout
+            )
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if self.deletion_events.get(conversation_id) is deletion_event:
+                del self.deletion_events[conversation_id]
+        return True
+
+    async def _wait_for_deletion_event(self, conversation_id: str, deletion_event: asyncio.Event):
+        while await self.redis.exists(conversation_id):
+            try:
+                await asyncio.wait_for(deletion_event.wait(), CONFIG_DELETION_RECHECK_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+    def _is_deletion_listener_running(self) -> bool:
+        return self.deletion_listener_task is not None and not self.deletion_listener_task.done()
+
+    async def _ensure_deletion_listener(self):
+        if self._is_deletion_listener_running():
+            return
+        async with self.deletion_listener_lock:
+            if self._is_deletion_listener_running():
+                return
+            if self.pubsub is not None:
+                await self.pubsub.aclose()
+            self.pubsub = self.redis.pubsub()
+            await self.pubsub.psubscribe(f"{CONFIG_DELETED_CHANNEL_PREFIX}*")
+            self.deletion_listener_task = asyncio_create_task(
+                self._listen_for_deletions(self.pubsub)
+            )
+
+    async def _listen_for_deletions(self, pubsub: PubSub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                conversation_id = message["channel"].decode()[len(CONFIG_DELETED_CHANNEL_PREFIX) :]
+                self.num_deletions_received += 1
+                self.configs.pop(conversation_id)
+                deletion_event = self.deletion_events.get(conversation_id)
+                if deletion_event is not None:
+                    deletion_event.set()
+        except Exception:
+            # the next waiter or read resubscribes; current waiters fall back to re-checking Redis
+            logger.exception("Config deletion listener failed")
+            self.configs.clear()
@@ -131,6 +131,10 @@ class OutboundCall:
         await self.config_manager.save_config(self.conversation_id, call_config)
         return self.conversation_id
 
+    async def wait_for_end(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the call to end. Returns False if it is still going after `timeout` seconds."""
+        return await self.config_manager.wait_for_config_deletion(self.conversation_id, timeout)
+
     async def end(self):
         # Note: removed `await` on 12/28/2024
         #return await self.telephony_client.end_call(self.telephony_id)
@@ -1,4 +1,3 @@
-import base64
 import json
 import os
 from enum import Enum
@@ -23,6 +22,7 @@ from vocode.streaming.telephony.config_manager.base_config_manager import BaseCo
 from vocode.streaming.telephony.conversation.abstract_phone_conversation import (
     AbstractPhoneConversation,
 )
+from vocode.streaming.telephony.twilio_media_codec import decode_twilio_message
 from vocode.streaming.transcriber.abstract_factory import AbstractTranscriberFactory
 from vocode.streaming.utils.events_manager import EventsManager
 from vocode.streaming.utils.state_manager import TwilioPhoneConversationStateManager
@@ -123,15 +123,20 @@ class TwilioPhoneConversation(AbstractPhoneConversation[TwilioOutputDevice]):
         if message is None:
             return TwilioPhoneConversationWebsocketAction.CLOSE_WEBSOCKET
 
-        data = json.loads(message)
-        if data["event"] == "media":
-            media = data["media"]
-            chunk = base64.b64decode(media["payload"])
-            self.receive_audio(chunk)
-        if data["event"] == "mark":
-            chunk_id = data["mark"]["name"]
-            self.output_device.enqueue_mark_message(ChunkFinishedMarkMessage(chunk_id=chunk_id))
-        elif data["event"] == "stop":
+        twilio_message = decode_twilio_message(message)
+        if twilio_message.event == "media":
+            if twilio_message.payload is None:
+                logger.warning(f"Media WS: Skipping media event without a payload: {message}")
+                return None
+            self.receive_audio(twilio_message.payload)
+        elif twilio_message.event == "mark":
+            if twilio_message.mark_name is None:
+                logger.warning(f"Media WS: Skipping mark event without a name: {message}")
+                return None
+            self.output_device.enqueue_mark_message(
+                ChunkFinishedMarkMessage(chunk_id=twilio_message.mark_name)
+            )
+        elif twilio_message.event == "stop":
             logger.debug(f"Media WS: Received event 'stop': {message}")
             logger.debug("Stopping...")
             return TwilioPhoneConversationWebsocketAction.CLOSE_WEBSOCKET
@@ -20,6 +20,7 @@ from vocode.streaming.models.telephony import (
 from vocode.streaming.models.transcriber import TranscriberConfig
 from vocode.streaming.synthesizer.abstract_factory import AbstractSynthesizerFactory
 from vocode.streaming.synthesizer.default_factory import DefaultSynthesizerFactory
+from vocode.streaming.synthesizer.phrase_bank import PhraseBank, PhraseBankConfig
 from vocode.streaming.telephony.client.abstract_telephony_client import AbstractTelephonyClient
 from vocode.streaming.telephony.client.twilio_client import TwilioClient
 from vocode.streaming.telephony.client.vonage_client import VonageClient
@@ -29,7 +30,9 @@ from vocode.streaming.telephony.templater import get_connection_twiml
 from vocode.streaming.transcriber.abstract_factory import AbstractTranscriberFactory
 from vocode.streaming.transcriber.default_factory import DefaultTranscriberFactory
 from vocode.streaming.utils import create_conversation_id
+from vocode.streaming.utils.event_loop_monitor import EventLoopLagMonitor
 from vocode.streaming.utils.events_manager import EventsManager
+from vocode.streaming.utils.llm_clients import LLMClientRegistry
 
 
 class AbstractInboundCallConfig(BaseModel, abc.ABC):
@@ -63,11 +66,14 @@ class TelephonyServer:
         agent_factory: AbstractAgentFactory = DefaultAgentFactory(),
         synthesizer_factory: AbstractSynthesizerFactory = DefaultSynthesizerFactory(),
         events_manager: Optional[EventsManager] = None,
+        phrase_bank_configs: List[PhraseBankConfig] = [],
     ):
         self.base_url = base_url
         self.router = APIRouter()
         self.config_manager = config_manager
         self.events_manager = events_manager
+        self.synthesizer_factory = synthesizer_factory
+        self.phrase_bank_configs = phrase_bank_configs
         self.router.include_router(
             CallsRouter(
                 base_url=base_url,
@@ -84,6 +90,12 @@ class TelephonyServer:
                 self.create_inbound_route(inbound_call_config=config),
                 methods=["POST"],
             )
+        self.event_loop_lag_monitor = EventLoopLagMonitor()
+        self.router.add_event_handler("startup", self.event_loop_lag_monitor.start)
+        self.router.add_event_handler("shutdown", self.event_loop_lag_monitor.terminate)
+        self.router.add_event_handler("shutdown", LLMClientRegistry().close)
+        if self.phrase_bank_configs:
+            self.router.add_event_handler("startup", self.warm_phrase_bank)
         # vonage requires an events endpoint
         self.router.add_api_route("/events", self.events, methods=["GET", "POST"])
         logger.info(f"Set up events endpoint at https://{self.base_url}/events")
@@ -95,6 +107,21 @@ class TelephonyServer:
             f"Set up recordings endpoint at https://{self.base_url}/recordings/{{conversation_id}}"
         )
 
+    async def warm_phrase_bank(self):
+        phrase_bank = PhraseBank()
+        for phrase_bank_config in self.phrase_bank_configs:
+            synthesizer = self.synthesizer_factory.create_synthesizer(
+                phrase_bank_config.synthesizer_config
+            )
+            try:
+                num_added = await phrase_bank.warm(synthesizer, phrase_bank_config.phrases)
+            finally:
+                await synthesizer.tear_down()
+            logger.info(
+                f"Pre-rendered {num_added} phrases for "
+                f"{phrase_bank_config.synthesizer_config.type}"
+            )
+
     def events(self, request: Request):
         return Response()
 
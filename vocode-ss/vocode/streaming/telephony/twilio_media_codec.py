@@ -0,0 +1,80 @@
+"""Encodes and decodes Twilio media stream messages without a general JSON round trip.
+
+Media frames make up nearly all of a call's websocket traffic, so outbound messages are rendered
+from templates with the stream SID already in place, and inbound media and mark messages are
+sliced out of the raw text. Anything the fast path doesn't recognize falls back to `json.loads`.
+"""
+
+import binascii
+import json
+from typing import Any, Dict, NamedTuple, Optional
+
+MEDIA_EVENT_FIELD = '"event":"media"'
+MARK_EVENT_FIELD = '"event":"mark"'
+PAYLOAD_FIELD_PREFIX = '"payload":"'
+MARK_NAME_FIELD_PREFIX = '"name":"'
+
+
+class TwilioMessage(NamedTuple):
+    event: str
+    payload: Optional[bytes] = None  # decoded audio of media messages
+    mark_name: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None  # the parsed message, if the fast path didn't apply
+
+
+class TwilioMediaEncoder:
+    def __init__(self, stream_sid: Optional[str]):
+        self.stream_sid = stream_sid
+        stream_sid_json = json.dumps(stream_sid)
+        self._media_prefix = (
+            '{"event":"media","streamSid":%s,"media":{"payload":"' % stream_sid_json
+        )
+        self._mark_prefix = '{"event":"mark","streamSid":%s,"mark":{"name":' % stream_sid_json
+        self._clear_message = '{"event":"clear","streamSid":%s}' % stream_sid_json
+
+    def encode_media(self, chunk: bytes) -> str:
+        return (
+            self._media_prefix + binascii.b2a_base64(chunk, newline=False).decode("ascii") + '"}}'
+        )
+
+    def encode_mark(self, name: str) -> str:
+        return self._mark_prefix + json.dumps(name) + "}}"
+
+    def encode_clear(self) -> str:
+        return self._clear_message
+
+
+def _get_string_field(message: str, field_prefix: str) -> Optional[str]:
+    start = message.find(field_prefix)
+    if start == -1:
+        return None
+    start += len(field_prefix)
+    end = message.find('"', start)
+    if end == -1:
+        return None
+    value = message[start:end]
+    if "\\" in value:
+        # escaped strings need a real JSON parse
+        return None
+    return value
+
+
+def decode_twilio_message(message: str) -> TwilioMessage:
+    if MEDIA_EVENT_FIELD in message:
+        payload = _get_string_field(message, PAYLOAD_FIELD_PREFIX)
+        if payload is not None:
+            return TwilioMessage(event="media", payload=binascii.a2b_base64(payload))
+    elif MARK_EVENT_FIELD in message:
+        mark_name = _get_string_field(message, MARK_NAME_FIELD_PREFIX)
+        if mark_name is not None:
+            return TwilioMessage(event="mark", mark_name=mark_name)
+
+    data = json.loads(message)
+    event = data["event"]
+    if event == "media":
+        return TwilioMessage(
+            event=event, payload=binascii.a2b_base64(data["media"]["payload"]), data=data
+        )
+    if event == "mark":
+        return TwilioMessage(event=event, mark_name=data["mark"]["name"], data=data)
+    return TwilioMessage(event=event, data=data)
@@ -1,5 +1,4 @@
 import asyncio
-import audioop
 import json
 from typing import Optional
 from urllib.parse import urlencode
@@ -18,6 +17,7 @@ from vocode.streaming.models.transcriber import (
 )
 from vocode.streaming.models.websocket import AudioMessage
 from vocode.streaming.transcriber.base_transcriber import BaseAsyncTranscriber
+from vocode.streaming.utils import dsp
 
 ASSEMBLY_AI_URL = "wss://api.assemblyai.com/v2/realtime/ws"
 
@@ -68,7 +68,7 @@ class AssemblyAITranscriber(BaseAsyncTranscriber[AssemblyAITranscriberConfig]):
             if isinstance(chunk, np.ndarray):
                 chunk = chunk.astype(np.int16)
                 chunk = chunk.tobytes()
-            chunk = audioop.ulaw2lin(chunk, sample_width)
+            chunk = dsp.ulaw2lin(chunk, sample_width)
 
         self.buffer.extend(chunk)
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import audioop
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Generic, Optional, TypeVar, Union
 
 from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.models.transcriber import TranscriberConfig, Transcription
+from vocode.streaming.utils.silence import get_silent_chunk
 from vocode.streaming.utils.speed_manager import SpeedManager
+from vocode.streaming.utils.vad import EnergyVAD, SilenceGate
 from vocode.streaming.utils.worker import AbstractWorker, AsyncWorker, ThreadAsyncWorker
 
 if TYPE_CHECKING:
@@ -25,6 +26,16 @@ class AbstractTranscriber(Generic[TranscriberConfigType], AbstractWorker[bytes])
         self.transcriber_config = transcriber_config
         self.is_muted = False
         self.speed_manager: Optional[SpeedManager] = None
+        self.vad: Optional[EnergyVAD] = None
+        self.silence_gate: Optional[SilenceGate] = None
+        if transcriber_config.vad_config is not None:
+            self.vad = EnergyVAD(
+                transcriber_config.audio_encoding,
+                transcriber_config.sampling_rate,
+                transcriber_config.vad_config,
+            )
+            if transcriber_config.vad_config.gate_silence:
+                self.silence_gate = SilenceGate(self.vad)
 
     def attach_speed_manager(self, speed_manager: SpeedManager):
         self.speed_manager = speed_manager
@@ -42,21 +53,31 @@ class AbstractTranscriber(Generic[TranscriberConfigType], AbstractWorker[bytes])
         return True
 
     def create_silent_chunk(self, chunk_size, sample_width=2):
-        linear_audio = b"\0" * chunk_size
-        if self.get_transcriber_config().audio_encoding == AudioEncoding.LINEAR16:
-            return linear_audio
-        elif self.get_transcriber_config().audio_encoding == AudioEncoding.MULAW:
-            return audioop.lin2ulaw(linear_audio, sample_width)
+        """Silence as long as `chunk_size` bytes of linear audio with `sample_width`."""
+        audio_encoding = self.get_transcriber_config().audio_encoding
+        if audio_encoding == AudioEncoding.MULAW:
+            chunk_size //= sample_width
+        return get_silent_chunk(audio_encoding, chunk_size)
 
     @abstractmethod
     async def _run_loop(self):
         pass
 
     def send_audio(self, chunk: bytes):
-        if not self.is_muted:
-            self.consume_nonblocking(chunk)
-        else:
-            self.consume_nonblocking(self.create_silent_chunk(len(chunk)))
+        if self.is_muted:
+            # the same length as the muted chunk, in its encoding
+            chunk = get_silent_chunk(self.get_transcriber_config().audio_encoding, len(chunk))
+        if self.silence_gate is not None:
+            for forwarded_chunk in self.silence_gate.filter(chunk):
+                self.consume_nonblocking(forwarded_chunk)
+            return
+        if self.vad is not None:
+            self.vad.process(chunk)
+        self.consume_nonblocking(chunk)
+
+    def get_local_time_silent(self) -> Optional[float]:
+        """How long the local VAD has heard silence for, if it's enabled."""
+        return self.vad.silence_seconds if self.vad is not None else None
 
     def produce_nonblocking(self, item: Transcription):
         self.consumer.consume_nonblocking(item)
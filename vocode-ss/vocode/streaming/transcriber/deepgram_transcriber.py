@@ -208,6 +208,22 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
         sample_rate = self.transcriber_config.sampling_rate
         return sample_width * sample_rate * NUM_AUDIO_CHANNELS
 
+    def get_time_silent(
+        self,
+        time_silent: float,
+        deepgram_response: Union[DeepgramUtteranceEnd, DeepgramTranscriptionResult],
+    ) -> float:
+        """`time_silent` is Deepgram's view of how long the caller was silent before this response,
+        and `_satisfies_time_cutoff` adds the response's duration to it. The local VAD has already
+        heard the audio Deepgram hasn't responded to yet (and any silence that wasn't sent), so if
+        it has heard longer silence, that is used instead."""
+        local_time_silent = self.get_local_time_silent()
+        if local_time_silent is None or not isinstance(
+            deepgram_response, DeepgramTranscriptionResult
+        ):
+            return time_silent
+        return max(time_silent, local_time_silent - deepgram_response.duration)
+
     def is_endpoint(
         self,
         current_buffer: str,
@@ -481,7 +497,11 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
 
                             is_final_ts = now()
 
-                        if buffer and self.is_endpoint(buffer, deepgram_response, time_silent):
+                        if buffer and self.is_endpoint(
+                            buffer,
+                            deepgram_response,
+                            self.get_time_silent(time_silent, deepgram_response),
+                        ):
                             output_ts = now()
                             self._track_latency_of_conversation(
                                 is_final_ts=is_final_ts,
@@ -1,5 +1,4 @@
 import asyncio
-import audioop
 import json
 from typing import Optional
 
@@ -12,6 +11,7 @@ from vocode.streaming.models.audio import AudioEncoding
 from vocode.streaming.models.transcriber import GladiaTranscriberConfig, Transcription
 from vocode.streaming.models.websocket import AudioMessage
 from vocode.streaming.transcriber.base_transcriber import BaseAsyncTranscriber
+from vocode.streaming.utils import dsp
 
 GLADIA_URL = "wss://api.gladia.io/audio/text/audio-transcription"
 
@@ -46,7 +46,7 @@ class GladiaTranscriber(BaseAsyncTranscriber[GladiaTranscriberConfig]):
             if isinstance(chunk, np.ndarray):
                 chunk = chunk.astype(np.int16)
                 chunk = chunk.tobytes()
-            chunk = audioop.ulaw2lin(chunk, sample_width)
+            chunk = dsp.ulaw2lin(chunk, sample_width)
 
         self.buffer.extend(chunk)
 
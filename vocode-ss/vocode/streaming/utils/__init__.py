@@ -1,5 +1,4 @@
 import asyncio
-import audioop
 import random
 import secrets
 import wave
@@ -7,6 +6,7 @@ from string import ascii_letters, digits
 from typing import Any, AsyncGenerator, AsyncIterator, Callable, List, Tuple, TypeVar
 
 from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.utils import dsp
 
 custom_alphabet = ascii_letters + digits + ".-_"
 
@@ -30,12 +30,12 @@ def convert_linear_audio(
 ):
     # downsample
     if input_sample_rate != output_sample_rate:
-        raw_wav, _ = audioop.ratecv(raw_wav, 2, 1, input_sample_rate, output_sample_rate, None)
+        raw_wav = dsp.resample(raw_wav, input_sample_rate, output_sample_rate)
 
     if output_encoding == AudioEncoding.LINEAR16:
         return raw_wav
     elif output_encoding == AudioEncoding.MULAW:
-        return audioop.lin2ulaw(raw_wav, output_sample_width)
+        return dsp.lin2ulaw(raw_wav, output_sample_width)
 
 
 def convert_wav(
@@ -0,0 +1,222 @@
+"""Audio conversions on NumPy arrays, replacing `audioop` (removed in Python 3.13).
+
+μ-law and A-law are encoded and decoded with lookup tables built once at import, which give the
+same bytes as `audioop`. Functions that take `bytes` read them through a NumPy view rather than
+copying, and PCM is 16-bit signed little-endian mono unless a `sample_width` says otherwise.
+
+`Resampler` converts between sampling rates by linear interpolation, like `audioop.ratecv`,
+and keeps its position between chunks so a stream can be resampled chunk by chunk without
+clicks at the boundaries.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+ULAW_CLIP = 8159
+ULAW_BIAS = 0x84
+ULAW_SEGMENT_ENDS = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+ALAW_SEGMENT_ENDS = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF])
+
+MAX_RESAMPLER_PLANS = 64
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    # indexed by the 16-bit sample's bits, i.e. samples.view(np.uint16)
+    samples = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(samples), ULAW_CLIP) + (ULAW_BIAS >> 2)
+    segment = np.searchsorted(ULAW_SEGMENT_ENDS, magnitude)
+    codes = (segment << 4) | ((magnitude >> (segment + 1)) & 0xF)
+    codes = np.where(segment >= 8, 0x7F, codes)
+    return (codes ^ mask).astype(np.uint8)
+
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    magnitude = (((codes & 0x0F) << 3) + ULAW_BIAS) << ((codes & 0x70) >> 4)
+    return np.where(codes & 0x80, ULAW_BIAS - magnitude, magnitude - ULAW_BIAS).astype(np.int16)
+
+
+def _build_alaw_encode_table() -> np.ndarray:
+    samples = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 3
+    mask = np.where(samples >= 0, 0xD5, 0x55)
+    magnitude = np.where(samples >= 0, samples, -samples - 1)
+    segment = np.searchsorted(ALAW_SEGMENT_ENDS, magnitude)
+    quantized = np.where(segment < 2, magnitude >> 1, magnitude >> np.maximum(segment, 1)) & 0xF
+    codes = np.where(segment >= 8, 0x7F, (segment << 4) | quantized)
+    return (codes ^ mask).astype(np.uint8)
+
+
+def _build_alaw_decode_table() -> np.ndarray:
+    codes = np.arange(256, dtype=np.int32) ^ 0x55
+    segment = (codes & 0x70) >> 4
+    magnitude = (codes & 0x0F) << 4
+    magnitude = np.where(
+        segment == 0, magnitude + 8, (magnitude + 0x108) << np.maximum(segment - 1, 0)
+    )
+    return np.where(codes & 0x80, magnitude, -magnitude).astype(np.int16)
+
+
+ULAW_ENCODE_TABLE = _build_ulaw_encode_table()
+ULAW_DECODE_TABLE = _build_ulaw_decode_table()
+ALAW_ENCODE_TABLE = _build_alaw_encode_table()
+ALAW_DECODE_TABLE = _build_alaw_decode_table()
+
+
+def pcm16_view(data: BytesLike) -> np.ndarray:
+    """A read-only int16 view of 16-bit PCM bytes, without copying them."""
+    return np.frombuffer(data, dtype=np.int16)
+
+
+def _to_pcm16(data: BytesLike, sample_width: int) -> np.ndarray:
+    if sample_width == 2:
+        return pcm16_view(data)
+    if sample_width == 1:
+        return np.frombuffer(data, dtype=np.int8).astype(np.int16) << 8
+    raise ValueError(f"Unsupported sample width {sample_width}")
+
+
+def _from_pcm16(samples: np.ndarray, sample_width: int) -> bytes:
+    if sample_width == 2:
+        return samples.tobytes()
+    if sample_width == 1:
+        return (samples >> 8).astype(np.int8).tobytes()
+    raise ValueError(f"Unsupported sample width {sample_width}")
+
+
+def ulaw_encode(samples: np.ndarray) -> np.ndarray:
+    return ULAW_ENCODE_TABLE[samples.view(np.uint16)]
+
+
+def ulaw_decode(codes: np.ndarray) -> np.ndarray:
+    return ULAW_DECODE_TABLE[codes]
+
+
+def alaw_encode(samples: np.ndarray) -> np.ndarray:
+    return ALAW_ENCODE_TABLE[samples.view(np.uint16)]
+
+
+def alaw_decode(codes: np.ndarray) -> np.ndarray:
+    return ALAW_DECODE_TABLE[codes]
+
+
+def lin2ulaw(data: BytesLike, sample_width: int = 2) -> bytes:
+    return ulaw_encode(_to_pcm16(data, sample_width)).tobytes()
+
+
+def ulaw2lin(data: BytesLike, sample_width: int = 2) -> bytes:
+    return _from_pcm16(ulaw_decode(np.frombuffer(data, dtype=np.uint8)), sample_width)
+
+
+def lin2alaw(data: BytesLike, sample_width: int = 2) -> bytes:
+    return alaw_encode(_to_pcm16(data, sample_width)).tobytes()
+
+
+def alaw2lin(data: BytesLike, sample_width: int = 2) -> bytes:
+    return _from_pcm16(alaw_decode(np.frombuffer(data, dtype=np.uint8)), sample_width)
+
+
+def apply_gain(samples: np.ndarray, gain: float) -> np.ndarray:
+    """Scales int16 samples, clipping instead of wrapping around."""
+    return np.clip(samples.astype(np.float32) * gain, INT16_MIN, INT16_MAX).astype(np.int16)
+
+
+def mix(*tracks: np.ndarray) -> np.ndarray:
+    """Sums int16 tracks with clipping. Shorter tracks are treated as silence at the end."""
+    if not tracks:
+        return np.zeros(0, dtype=np.int16)
+    mixed = np.zeros(max(len(track) for track in tracks), dtype=np.int32)
+    for track in tracks:
+        mixed[: len(track)] += track
+    return np.clip(mixed, INT16_MIN, INT16_MAX).astype(np.int16)
+
+
+class ResamplerPlan(NamedTuple):
+    """Which samples each output interpolates between, their weights, and the position of the
+    next output sample after the chunk."""
+
+    before: np.ndarray
+    after: np.ndarray
+    before_weights: np.ndarray
+    after_weights: np.ndarray
+    next_position: int
+
+
+class Resampler:
+    """Streaming linear-interpolation resampler for 16-bit mono PCM.
+
+    Output sample `k` of the whole stream sits at input position `k * input_rate / output_rate`.
+    The position is tracked as an exact fraction, and the previous chunk's last sample is kept,
+    so resampling a stream chunk by chunk gives the same samples as resampling it in one go.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int):
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        # position of the next output sample relative to the start of the next chunk, in units
+        # of 1 / output_rate input samples; -output_rate means the previous chunk's last sample
+        self.next_position = 0
+        self.last_sample: Optional[int] = None
+        self._plans: Dict[Tuple[int, int], ResamplerPlan] = {}
+
+    def process_samples(self, samples: np.ndarray) -> np.ndarray:
+        if self.input_rate == self.output_rate:
+            return samples
+        if len(samples) == 0:
+            return np.zeros(0, dtype=np.int16)
+        # index 0 holds the previous chunk's last sample
+        padded = np.empty(len(samples) + 1, dtype=np.int64)
+        padded[0] = samples[0] if self.last_sample is None else self.last_sample
+        padded[1:] = samples
+        before, after, before_weights, after_weights, next_position = self._get_plan(len(samples))
+        output = (
+            padded[before] * before_weights + padded[after] * after_weights + self.output_rate // 2
+        ) // self.output_rate
+        self.next_position = next_position
+        self.last_sample = int(samples[-1])
+        return output.astype(np.int16)
+
+    def _get_plan(self, num_samples: int) -> ResamplerPlan:
+        """Streams are usually split into equal chunks, so the same few plans repeat and are
+        cached."""
+        key = (self.next_position, num_samples)
+        cached_plan = self._plans.get(key)
+        if cached_plan is not None:
+            return cached_plan
+        end = (num_samples - 1) * self.output_rate
+        num_outputs = max((end - self.next_position) // self.input_rate + 1, 0)
+        # interpolate in integers so the result doesn't depend on where the chunks were split
+        positions = self.next_position + np.arange(num_outputs, dtype=np.int64) * self.input_rate
+        before = positions // self.output_rate + 1
+        after = np.minimum(before + 1, num_samples)
+        after_weights = positions % self.output_rate
+        next_position = (
+            self.next_position + num_outputs * self.input_rate - num_samples * self.output_rate
+        )
+        plan = ResamplerPlan(
+            before, after, self.output_rate - after_weights, after_weights, int(next_position)
+        )
+        if len(self._plans) >= MAX_RESAMPLER_PLANS:
+            self._plans.clear()
+        self._plans[key] = plan
+        return plan
+
+    def process(self, data: BytesLike) -> bytes:
+        return self.process_samples(pcm16_view(data)).tobytes()
+
+    def reset(self):
+        self.next_position = 0
+        self.last_sample = None
+
+
+def resample(data: BytesLike, input_rate: int, output_rate: int) -> bytes:
+    """Resamples a single 16-bit PCM buffer; use a `Resampler` for chunks of a stream."""
+    if input_rate == output_rate:
+        return bytes(data)
+    return Resampler(input_rate, output_rate).process(data)
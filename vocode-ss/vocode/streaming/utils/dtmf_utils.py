@@ -1,10 +1,10 @@
-import audioop
 from enum import Enum
 from typing import Dict, Tuple
 
 import numpy as np
 
 from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.utils import dsp
 from vocode.streaming.utils.singleton import Singleton
 
 DEFAULT_DTMF_TONE_LENGTH_SECONDS = 0.3
@@ -46,7 +46,8 @@ DTMF_FREQUENCIES = {
 class DTMFToneGenerator(Singleton):
 
     def __init__(self):
-        self.tone_cache: Dict[Tuple[KeypadEntry, int, AudioEncoding], bytes] = {}
+        # shared by every call in the process
+        self.tone_cache: Dict[Tuple[KeypadEntry, int, AudioEncoding, float, float], bytes] = {}
 
     def generate(
         self,
@@ -56,8 +57,9 @@ class DTMFToneGenerator(Singleton):
         duration_seconds: float = DEFAULT_DTMF_TONE_LENGTH_SECONDS,
         silence_seconds: float = DEFAULT_DTMF_TONE_SILENCE_SECONDS,
     ) -> bytes:
-        if (keypad_entry, sampling_rate, audio_encoding) in self.tone_cache:
-            return self.tone_cache[(keypad_entry, sampling_rate, audio_encoding)]
+        cache_key = (keypad_entry, sampling_rate, audio_encoding, duration_seconds, silence_seconds)
+        if cache_key in self.tone_cache:
+            return self.tone_cache[cache_key]
         f1, f2 = DTMF_FREQUENCIES[keypad_entry]
         t = np.linspace(0, duration_seconds, int(sampling_rate * duration_seconds), endpoint=False)
         tone = np.sin(2 * np.pi * f1 * t) + np.sin(2 * np.pi * f2 * t)
@@ -65,8 +67,8 @@ class DTMFToneGenerator(Singleton):
         pcm = (tone * MAX_INT).astype(np.int16).tobytes()
         pcm += b"\0" * int(silence_seconds * sampling_rate * 2)
         if audio_encoding == AudioEncoding.MULAW:
-            output = audioop.lin2ulaw(pcm, 2)
+            output = dsp.lin2ulaw(pcm)
         else:
             output = pcm
-        self.tone_cache[(keypad_entry, sampling_rate, audio_encoding)] = output
+        self.tone_cache[cache_key] = output
         return output
@@ -0,0 +1,49 @@
+import asyncio
+import time
+from typing import Optional
+
+from loguru import logger
+
+from vocode.streaming.utils.create_task import asyncio_create_task
+from vocode.streaming.utils.metrics import counter, timing
+
+
+class EventLoopLagMonitor:
+    """Measures how long the event loop is blocked by synchronous work.
+
+    Wakes up every `interval_seconds` and records how late the wakeup was. Lateness above
+    `blocking_threshold_seconds` is accumulated in the `event_loop.blocked_seconds` counter.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        blocking_threshold_seconds: float = 0.02,
+    ):
+        self.interval_seconds = interval_seconds
+        self.blocking_threshold_seconds = blocking_threshold_seconds
+        self.lag_timing = timing("event_loop.lag")
+        self.blocked_seconds = counter("event_loop.blocked_seconds")
+        self.worker_task: Optional[asyncio.Task] = None
+
+    def start(self) -> asyncio.Task:
+        if self.worker_task is None or self.worker_task.done():
+            self.worker_task = asyncio_create_task(self._run_loop())
+        return self.worker_task
+
+    async def _run_loop(self):
+        while True:
+            scheduled_at = time.perf_counter()
+            try:
+                await asyncio.sleep(self.interval_seconds)
+            except asyncio.CancelledError:
+                return
+            lag = max(time.perf_counter() - scheduled_at - self.interval_seconds, 0.0)
+            self.lag_timing.observe(lag)
+            if lag > self.blocking_threshold_seconds:
+                self.blocked_seconds.inc(lag)
+                logger.debug(f"Event loop was blocked for {lag:.3f}s")
+
+    async def terminate(self):
+        if self.worker_task:
+            self.worker_task.cancel()
@@ -1,49 +1,127 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from enum import Enum
 from typing import List
 
 from loguru import logger
 
 from vocode.streaming.models.events import Event, EventType
+from vocode.streaming.utils.metrics import counter, gauge, timing
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+queue_depth = gauge("events.queue_depth")
+events_dropped = counter("events.dropped")
+events_handled = counter("events.handled")
+handler_latency = timing("events.handler_latency")
+
+
+class EventQueueOverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
 
 
 class EventsManager:
-    def __init__(self, subscriptions: List[EventType] = []):
-        self.queue: asyncio.Queue[Event] = asyncio.Queue()
+    """Queues the subscribed events and hands them to `handle_event` in the background.
+
+    Each manager has its own queue of at most `max_queue_size` events, so a slow manager doesn't
+    hold up the conversation or grow without limit. When it's full, `overflow_policy` decides
+    whether the oldest or the new event is dropped. Events are published synchronously (e.g. as
+    the transcript changes), so producers never wait for room.
+
+    `start` runs `num_workers` workers that each take up to `max_batch_size` queued events at a
+    time and pass them to `handle_events`, which calls `handle_event` for each one by default.
+    Sinks that can write in bulk should override `handle_events` instead. With more than one
+    worker, events may be handled out of order.
+    """
+
+    def __init__(
+        self,
+        subscriptions: List[EventType] = [],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: EventQueueOverflowPolicy = EventQueueOverflowPolicy.DROP_OLDEST,
+        num_workers: int = 1,
+        max_batch_size: int = 1,
+    ):
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_queue_size)
         self.subscriptions = set(subscriptions)
+        self.overflow_policy = overflow_policy
+        self.num_workers = num_workers
+        self.max_batch_size = max_batch_size
         self.active = False
 
     def publish_event(self, event: Event):
-        if event and event.type in self.subscriptions:
-            self.queue.put_nowait(event)
+        if not (event and event.type in self.subscriptions):
+            return
+        if self.queue.full():
+            if self.overflow_policy == EventQueueOverflowPolicy.DROP_NEWEST:
+                self._drop(event)
+                return
+            self._drop(self._get_nowait())
+        self._put_nowait(event)
 
     async def start(self):
         self.active = True
+        await asyncio.gather(*(self._work() for _ in range(self.num_workers)))
+
+    async def _work(self):
         while self.active:
             try:
                 event = await self.queue.get()
             except asyncio.QueueEmpty:
                 await asyncio.sleep(1)
+                continue
             except asyncio.CancelledError:
                 break
-            await self.handle_event(event)
+            queue_depth.dec()
+            batch = [event]
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self._get_nowait())
+            await self._handle_batch(batch)
 
     async def handle_event(self, event: Event):
         pass
 
+    async def handle_events(self, events: List[Event]):
+        for event in events:
+            await self.handle_event(event)
+
     async def flush(self):
         self.active = False
-        while True:
-            try:
-                event = self.queue.get_nowait()
-                await self.handle_event(event)
-            except asyncio.QueueEmpty:
-                break
-            except TypeError as e:
-                if "NoneType can't be used in 'await' expression" in str(e):
-                    logger.error(
-                        "Handle event was overridden with non-async function. Please override with async function."
-                    )
-                else:
-                    raise e from e
+        while not self.queue.empty():
+            batch: List[Event] = []
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self._get_nowait())
+            await self._handle_batch(batch)
+
+    async def _handle_batch(self, batch: List[Event]):
+        start = time.monotonic()
+        try:
+            await self.handle_events(batch)
+        except TypeError as e:
+            if "NoneType can't be used in 'await' expression" in str(e):
+                logger.error(
+                    "Handle event was overridden with non-async function. Please override with async function."
+                )
+            else:
+                logger.exception(f"Failed to handle {len(batch)} event(s)")
+        except Exception:
+            logger.exception(f"Failed to handle {len(batch)} event(s)")
+        finally:
+            handler_latency.observe(time.monotonic() - start)
+            events_handled.inc(len(batch))
+
+    def _put_nowait(self, event: Event):
+        self.queue.put_nowait(event)
+        queue_depth.inc()
+
+    def _get_nowait(self) -> Event:
+        event = self.queue.get_nowait()
+        queue_depth.dec()
+        return event
+
+    def _drop(self, event: Event):
+        events_dropped.inc()
+        logger.warning(f"Events queue is full, dropping {event.type} event")
@@ -0,0 +1,196 @@
+"""OpenAI clients shared by every conversation in the process.
+
+Creating an `AsyncOpenAI` client per conversation also creates a new HTTP connection pool, so the
+first request of every conversation paid for the TCP and TLS handshakes. `LLMClientRegistry`
+hands out one client per endpoint, API key, API version and retry setting. All clients for the
+same endpoint share one `httpx.AsyncClient`, which keeps connections alive between conversations
+and uses HTTP/2 (many concurrent streams over a few connections).
+
+Call `await LLMClientRegistry().close()` once at shutdown. Pool usage is reported by the
+`llm.http.requests_in_flight` and `llm.http.connections` gauges, and per endpoint by
+`LLMClientRegistry().get_pool_stats()`.
+"""
+
+import os
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple, Union
+
+import httpx
+from openai import DEFAULT_MAX_RETRIES as OPENAI_DEFAULT_MAX_RETRIES
+from openai import AsyncAzureOpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
+
+from vocode.streaming.utils.metrics import gauge
+from vocode.streaming.utils.singleton import Singleton
+
+OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+# connections per endpoint; with HTTP/2 each one carries many concurrent requests
+LLM_HTTP_MAX_CONNECTIONS = int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", 100))
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+# idle connections are kept this long, so they outlive the gaps between conversation turns
+LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", 120))
+
+requests_in_flight = gauge("llm.http.requests_in_flight")
+open_connections = gauge("llm.http.connections")
+
+OpenAIClient = Union[AsyncOpenAI, AsyncAzureOpenAI]
+
+
+class MeteredResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self.stream = stream
+        self.on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self.stream.aclose()
+        finally:
+            if self.on_close is not None:
+                self.on_close()
+                self.on_close = None
+
+
+class MeteredTransport(httpx.AsyncHTTPTransport):
+    """Counts the requests in flight, until their (streamed) response is closed, and the
+    connections open in the pool."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests_in_flight = 0
+        self.num_connections = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests_in_flight += 1
+        requests_in_flight.inc()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._end_request()
+            raise
+        response.stream = MeteredResponseStream(response.stream, self._end_request)  # type: ignore
+        self._update_connections()
+        return response
+
+    def _end_request(self):
+        self.requests_in_flight -= 1
+        requests_in_flight.dec()
+        self._update_connections()
+
+    def get_connections(self) -> Tuple[int, int]:
+        """The number of open connections and how many of them are idle."""
+        connections = self._pool.connections
+        return len(connections), sum(1 for connection in connections if connection.is_idle())
+
+    def _update_connections(self):
+        num_connections, _ = self.get_connections()
+        open_connections.inc(num_connections - self.num_connections)
+        self.num_connections = num_connections
+
+    async def aclose(self):
+        await super().aclose()
+        open_connections.dec(self.num_connections)
+        self.num_connections = 0
+
+
+class LLMClientRegistry(Singleton):
+    def __init__(self):
+        self.http_clients: Dict[str, httpx.AsyncClient] = {}
+        self.transports: Dict[str, MeteredTransport] = {}
+        self.openai_clients: Dict[Tuple[str, str, str, Optional[str], int], OpenAIClient] = {}
+
+    def get_http_client(self, base_url: str) -> httpx.AsyncClient:
+        """The pooled HTTP client for the endpoint (scheme, host and port) of `base_url`, e.g. to
+        pass as the `http_async_client` of a LangChain `ChatOpenAI`."""
+        endpoint = str(httpx.URL(base_url).copy_with(path="/", query=None, fragment=None))
+        http_client = self.http_clients.get(endpoint)
+        if http_client is None or http_client.is_closed:
+            transport = MeteredTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            http_client = DefaultAsyncHttpxClient(transport=transport)
+            self.transports[endpoint] = transport
+            self.http_clients[endpoint] = http_client
+        return http_client
+
+    def get_openai_client(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str] = None,
+        max_retries: int = OPENAI_DEFAULT_MAX_RETRIES,
+    ) -> AsyncOpenAI:
+        base_url = base_url or OPENAI_DEFAULT_BASE_URL
+        key = ("openai", base_url, api_key or "", None, max_retries)
+        client = self.openai_clients.get(key)
+        if client is None or client._client.is_closed:
+            client = self.openai_clients[key] = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=max_retries,
+                http_client=self.get_http_client(base_url),
+            )
+        return client  # type: ignore
+
+    def get_azure_openai_client(
+        self,
+        azure_endpoint: str,
+        api_key: Optional[str],
+        api_version: Optional[str],
+        max_retries: int = OPENAI_DEFAULT_MAX_RETRIES,
+    ) -> AsyncAzureOpenAI:
+        key = ("azure", azure_endpoint, api_key or "", api_version, max_retries)
+        client = self.openai_clients.get(key)
+        if client is None or client._client.is_closed:
+            client = self.openai_clients[key] = AsyncAzureOpenAI(
+                azure_endpoint=azure_endpoint,
+                api_key=api_key,
+                api_version=api_version,
+                max_retries=max_retries,
+                http_client=self.get_http_client(azure_endpoint),
+            )
+        return client  # type: ignore
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        stats = {}
+        for endpoint, transport in self.transports.items():
+            num_connections, num_idle_connections = transport.get_connections()
+            stats[endpoint] = {
+                "requests_in_flight": transport.requests_in_flight,
+                "connections": num_connections,
+                "idle_connections": num_idle_connections,
+                "max_connections": LLM_HTTP_MAX_CONNECTIONS,
+            }
+        return stats
+
+    async def close(self):
+        for http_client in self.http_clients.values():
+            await http_client.aclose()
+        self.http_clients.clear()
+        self.transports.clear()
+        self.openai_clients.clear()
+
+
+def get_openai_client(
+    api_key: Optional[str],
+    base_url: Optional[str] = None,
+    max_retries: int = OPENAI_DEFAULT_MAX_RETRIES,
+) -> AsyncOpenAI:
+    return LLMClientRegistry().get_openai_client(api_key, base_url, max_retries)
+
+
+def get_azure_openai_client(
+    azure_endpoint: str,
+    api_key: Optional[str],
+    api_version: Optional[str],
+    max_retries: int = OPENAI_DEFAULT_MAX_RETRIES,
+) -> AsyncAzureOpenAI:
+    return LLMClientRegistry().get_azure_openai_client(
+        azure_endpoint, api_key, api_version, max_retries
+    )
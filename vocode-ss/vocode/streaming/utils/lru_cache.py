@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from vocode.streaming.utils.metrics import counter, gauge
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class LRUCache(Generic[KeyType, ValueType]):
+    """In-process LRU cache bounded by total size.
+
+    Each entry's size is given by `get_size` (1 per entry by default, so `max_size` is an entry
+    count), e.g. pass `len` to bound a cache of bytes by memory. Entries can optionally expire
+    after `ttl_seconds`. If `metrics_prefix` is set, hits, misses, evictions and the current size
+    are reported under it.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        get_size: Callable[[ValueType], int] = lambda _: 1,
+        ttl_seconds: Optional[float] = None,
+        metrics_prefix: Optional[str] = None,
+    ):
+        self.max_size = max_size
+        self.get_size = get_size
+        self.ttl_seconds = ttl_seconds
+        self.size = 0
+        # key -> (value, size, expires_at)
+        self.entries: OrderedDict[KeyType, Tuple[ValueType, int, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = counter(f"{metrics_prefix}.hits") if metrics_prefix else None
+        self.misses = counter(f"{metrics_prefix}.misses") if metrics_prefix else None
+        self.evictions = counter(f"{metrics_prefix}.evictions") if metrics_prefix else None
+        self.size_gauge = gauge(f"{metrics_prefix}.size") if metrics_prefix else None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: KeyType) -> bool:
+        return self.get(key, record_metrics=False) is not None
+
+    def get(self, key: KeyType, record_metrics: bool = True) -> Optional[ValueType]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                if record_metrics and self.misses:
+                    self.misses.inc()
+                return None
+            self.entries.move_to_end(key)
+        if record_metrics and self.hits:
+            self.hits.inc()
+        return entry[0]
+
+    def set(self, key: KeyType, value: ValueType):
+        size = self.get_size(value)
+        if size > self.max_size:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, size, expires_at)
+            self.size += size
+            while self.size > self.max_size:
+                self._remove(next(iter(self.entries)))
+                if self.evictions:
+                    self.evictions.inc()
+            self._report_size()
+
+    def pop(self, key: KeyType) -> Optional[ValueType]:
+        with self._lock:
+            entry = self._remove(key)
+            self._report_size()
+        return entry[0] if entry else None
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            self._report_size()
+
+    def _remove(self, key: KeyType) -> Optional[Tuple[ValueType, int, Optional[float]]]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+        return entry
+
+    def _report_size(self):
+        if self.size_gauge:
+            self.size_gauge.set(self.size)
@@ -0,0 +1,130 @@
+"""Lightweight in-process metrics.
+
+Metrics are process-wide, keyed by name and safe to update from worker threads. Read them with
+`get_metrics_snapshot()`, e.g. from a health check endpoint or a periodic log line.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Type, TypeVar, Union
+
+from vocode.streaming.utils.singleton import Singleton
+
+Number = Union[int, float]
+
+
+class Counter:
+    def __init__(self, name: str):
+        self.name = name
+        self.value: Number = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: Number = 1):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> Number:
+        return self.value
+
+
+class Gauge:
+    def __init__(self, name: str):
+        self.name = name
+        self.value: Number = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: Number):
+        self.value = value
+
+    def inc(self, amount: Number = 1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: Number = 1):
+        self.inc(-amount)
+
+    def snapshot(self) -> Number:
+        return self.value
+
+
+class Timing:
+    """Tracks count, total and max of observed durations (in seconds)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        return {"count": self.count, "total": self.total, "mean": self.mean, "max": self.max}
+
+
+MetricType = TypeVar("MetricType", Counter, Gauge, Timing)
+
+
+class MetricsRegistry(Singleton):
+    def __init__(self):
+        self.metrics: Dict[str, Union[Counter, Gauge, Timing]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, metric_type: Type[MetricType]) -> MetricType:
+        metric = self.metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.metrics.setdefault(name, metric_type(name))
+        if not isinstance(metric, metric_type):
+            raise ValueError(f"Metric {name} is a {type(metric).__name__}, not a {metric_type}")
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get_or_create(name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get_or_create(name, Gauge)
+
+    def timing(self, name: str) -> Timing:
+        return self._get_or_create(name, Timing)
+
+    def snapshot(self, prefix: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            name: metric.snapshot()
+            for name, metric in sorted(self.metrics.items())
+            if prefix is None or name.startswith(prefix)
+        }
+
+
+def counter(name: str) -> Counter:
+    return MetricsRegistry().counter(name)
+
+
+def gauge(name: str) -> Gauge:
+    return MetricsRegistry().gauge(name)
+
+
+def timing(name: str) -> Timing:
+    return MetricsRegistry().timing(name)
+
+
+def get_metrics_snapshot(prefix: Optional[str] = None) -> Dict[str, Any]:
+    return MetricsRegistry().snapshot(prefix)
@@ -1,5 +1,6 @@
 import io
 import wave
+from typing import Callable, Iterator, Optional, Union
 
 import miniaudio
 
@@ -19,3 +20,51 @@ def decode_mp3(mp3_bytes: bytes) -> io.BytesIO:
         wave_obj.writeframes(wav_chunk.samples)
     output_bytes_io.seek(0)
     return output_bytes_io
+
+
+class StreamingMP3Source(miniaudio.StreamableSource):
+    """Feeds mp3 bytes to a miniaudio decoder as they arrive.
+
+    `fetch_chunk` is called whenever the decoder has consumed everything buffered so far; it should
+    block until more mp3 bytes are available and return None once the stream has ended.
+    """
+
+    def __init__(self, fetch_chunk: Callable[[], Optional[bytes]]):
+        self.fetch_chunk = fetch_chunk
+        self.buffer = bytearray()
+        self.ended = False
+        self.bytes_received = 0
+
+    def read(self, num_bytes: int) -> Union[bytes, memoryview]:
+        while not self.buffer and not self.ended:
+            chunk = self.fetch_chunk()
+            if chunk is None:
+                self.ended = True
+            else:
+                self.bytes_received += len(chunk)
+                self.buffer.extend(chunk)
+        data = bytes(self.buffer[:num_bytes])
+        del self.buffer[:num_bytes]
+        return data
+
+
+def stream_decode_mp3(
+    source: StreamingMP3Source,
+    output_sample_rate: int,
+    frames_per_read: int = 1024,
+) -> Iterator[bytes]:
+    """Decodes an mp3 stream into mono LINEAR16 PCM at `output_sample_rate`.
+
+    The decoder and its resampler keep their state across reads, so each yielded block only
+    contains newly decoded audio and the work per block doesn't depend on how much of the stream
+    has already been decoded.
+    """
+    for samples in miniaudio.stream_any(
+        source,
+        source_format=miniaudio.FileFormat.MP3,
+        output_format=miniaudio.SampleFormat.SIGNED16,
+        nchannels=1,
+        sample_rate=output_sample_rate,
+        frames_to_read=frames_per_read,
+    ):
+        yield samples.tobytes()
@@ -1,48 +1,128 @@
 import os
-from typing import Optional, TypeVar
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 from loguru import logger
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis, SSLConnection
 from redis.backoff import ExponentialBackoff, NoBackoff
 from redis.exceptions import ConnectionError, TimeoutError
 from redis.retry import Retry
 
+from vocode.streaming.utils.metrics import counter, timing
 from vocode.streaming.utils.singleton import Singleton
 
 WorkerInputType = TypeVar("WorkerInputType")
+
+RedisKey = Union[str, bytes]
+RedisValue = Union[str, bytes, int, float]
+
+# connections per pool; every client created with the same options shares one pool
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
+# how long to wait for a free connection before raising; whole seconds, as redis-py types it
+REDIS_POOL_TIMEOUT_SECONDS = int(os.environ.get("REDIS_POOL_TIMEOUT_SECONDS", 5))
+
+pool_wait = timing("redis.pool_wait")
+pool_timeouts = counter("redis.pool_timeouts")
+
+
+class MeteredConnectionPool(BlockingConnectionPool):
+    """A blocking pool that records how long callers wait for a connection."""
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.monotonic()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except ConnectionError:
+            if time.monotonic() - start >= self.timeout:
+                pool_timeouts.inc()
+            raise
+        finally:
+            pool_wait.observe(time.monotonic() - start)
+
+
+class RedisPoolRegistry(Singleton):
+    """Connection pools shared by all Redis clients in the process, one per set of client
+    options, so each config manager, cache and queue doesn't open its own connections."""
+
+    def __init__(self):
+        self.pools: Dict[Tuple[bool, Optional[int]], MeteredConnectionPool] = {}
+
+    def get_pool(
+        self, decode_responses: bool, retries: Optional[int] = None
+    ) -> MeteredConnectionPool:
+        key = (decode_responses, retries)
+        if key not in self.pools:
+            self.pools[key] = self._create_pool(decode_responses, retries)
+        return self.pools[key]
+
+    def _create_pool(self, decode_responses: bool, retries: Optional[int]):
+        connection_kwargs: Dict[str, Any] = dict(
+            host=os.environ.get("REDISHOST", "localhost"),
+            port=int(os.environ.get("REDISPORT", 6379)),
+            username=os.environ.get("REDISUSER", None),
+            password=os.environ.get("REDISPASSWORD", None),
+            db=0,
+            decode_responses=decode_responses,
+        )
+        if bool(os.environ.get("REDISSSL", False)):
+            connection_kwargs.update(connection_class=SSLConnection, ssl_cert_reqs="none")
+        if retries is not None:
+            backoff = ExponentialBackoff() if retries > 1 else NoBackoff()
+            connection_kwargs.update(
+                retry=Retry(backoff, retries),
+                retry_on_error=[ConnectionError, TimeoutError],
+                health_check_interval=30,
+            )
+        return MeteredConnectionPool(
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT_SECONDS,
+            **connection_kwargs,
+        )
+
+    async def close(self):
+        for pool in self.pools.values():
+            await pool.aclose()
+        self.pools.clear()
+
+
 # Two separate factories for Redis clients so that the
 # typing gets picked up properly
 
 
 def initialize_redis(retries: int = 1):
-    backoff = ExponentialBackoff() if retries > 1 else NoBackoff()
-    retry = Retry(backoff, retries)
     return Redis(  # type: ignore
-        host=os.environ.get("REDISHOST", "localhost"),
-        port=int(os.environ.get("REDISPORT", 6379)),
-        username=os.environ.get("REDISUSER", None),
-        password=os.environ.get("REDISPASSWORD", None),
-        decode_responses=True,
-        retry=retry,
-        ssl=bool(os.environ.get("REDISSSL", False)),
-        ssl_cert_reqs="none",
-        retry_on_error=[ConnectionError, TimeoutError],
-        health_check_interval=30,
+        connection_pool=RedisPoolRegistry().get_pool(decode_responses=True, retries=retries)
     )
 
 
-def initialize_redis_bytes():
+def initialize_redis_bytes(retries: Optional[int] = None):
     return Redis(
-        host=os.environ.get("REDISHOST", "localhost"),
-        port=int(os.environ.get("REDISPORT", 6379)),
-        username=os.environ.get("REDISUSER", None),
-        password=os.environ.get("REDISPASSWORD", None),
-        db=0,
-        ssl=bool(os.environ.get("REDISSSL", False)),
-        ssl_cert_reqs="none",
+        connection_pool=RedisPoolRegistry().get_pool(decode_responses=False, retries=retries)
     )
 
 
+async def set_with_ttl(redis: Redis, key: RedisKey, value: RedisValue, ttl_seconds: int):
+    """Sets a value and its expiry in a single atomic command."""
+    await redis.set(key, value, ex=ttl_seconds)
+
+
+async def set_many_with_ttl(redis: Redis, mapping: Mapping[RedisKey, RedisValue], ttl_seconds: int):
+    """Sets several values with the same expiry in one round trip, as a single transaction."""
+    if not mapping:
+        return
+    async with redis.pipeline(transaction=True) as pipeline:
+        for key, value in mapping.items():
+            pipeline.set(key, value, ex=ttl_seconds)
+        await pipeline.execute()
+
+
+async def get_many(redis: Redis, keys: Sequence[RedisKey]) -> List[Optional[RedisValue]]:
+    """Gets several values in one round trip; missing keys come back as None."""
+    if not keys:
+        return []
+    return await redis.mget(keys)
+
+
 class RedisGenericMessageQueue(Singleton):
     """Class representing a Redis Streams message queue."""
 
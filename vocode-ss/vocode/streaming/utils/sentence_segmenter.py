@@ -0,0 +1,56 @@
+import re
+from typing import List
+
+SENTENCE_BOUNDARY_CHARACTERS = re.compile(r"[.!?$]")
+LEADING_WHITESPACE = re.compile(r"\s*")
+
+
+class SentenceSegmenter:
+    """Splits streamed text into sentences as soon as each one is complete, scanning every
+    character once.
+
+    A sentence ends at ".", "!" or "?" that does not follow a digit, so "3.5" is not split, when
+    it is followed by the end of the text so far or by whitespace and an uppercase letter. Once
+    the unfinished text contains "$", nothing more is split until `flush`, so amounts are never
+    cut off.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.holds_currency = False
+
+    def feed(self, text: str) -> List[str]:
+        """Adds streamed text and returns the sentences it completed."""
+        if self.holds_currency:
+            self.buffer += text
+            return []
+
+        buffer = self.buffer + text
+        sentences = []
+        start = 0
+        # the previous text has been scanned already and left no sentence open
+        match = SENTENCE_BOUNDARY_CHARACTERS.search(buffer, len(self.buffer))
+        while match:
+            index = match.start()
+            if buffer[index] == "$":
+                self.holds_currency = True
+                break
+            if index == start or not buffer[index - 1].isdigit():
+                whitespace = LEADING_WHITESPACE.match(buffer, index + 1)
+                # `\s*` matches the empty string, so there is always a match
+                assert whitespace is not None
+                next_index = whitespace.end()
+                if next_index == len(buffer) or buffer[next_index].isupper():
+                    sentences.append(buffer[start:next_index].strip())
+                    start = next_index
+            match = SENTENCE_BOUNDARY_CHARACTERS.search(buffer, index + 1)
+
+        self.buffer = buffer[start:]
+        return [sentence for sentence in sentences if sentence]
+
+    def flush(self) -> str:
+        """Returns the unfinished text at the end of the stream and resets the segmenter."""
+        remainder = self.buffer.strip()
+        self.buffer = ""
+        self.holds_currency = False
+        return remainder
@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.telephony.constants import MULAW_SILENCE_BYTE, PCM_SILENCE_BYTE
+
+SILENCE_BYTES = {
+    AudioEncoding.LINEAR16: PCM_SILENCE_BYTE,
+    AudioEncoding.MULAW: MULAW_SILENCE_BYTE,
+}
+
+
+@lru_cache(maxsize=256)
+def get_silent_chunk(audio_encoding: AudioEncoding, num_bytes: int) -> bytes:
+    """`num_bytes` of silence in `audio_encoding`.
+
+    Chunk sizes are fixed per call, so this is built once per encoding and size and the same
+    (immutable) bytes are shared by every caller in the process.
+    """
+    if audio_encoding not in SILENCE_BYTES:
+        raise ValueError(f"Unsupported audio encoding {audio_encoding}")
+    return SILENCE_BYTES[audio_encoding] * num_bytes
@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ResultType = TypeVar("ResultType")
+
+
+class SingleFlight(Generic[KeyType, ResultType]):
+    """Collapses concurrent calls for the same key into a single call.
+
+    The first caller for a key starts `func` in a task; callers that arrive while it is still
+    running await the same task. Cancelling one caller doesn't cancel the shared call.
+    """
+
+    def __init__(self):
+        self.in_flight: Dict[KeyType, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self.in_flight)
+
+    async def do(self, key: KeyType, func: Callable[[], Awaitable[ResultType]]) -> ResultType:
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.in_flight[key] = task
+            task.add_done_callback(lambda done_task: self._on_done(key, done_task))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: KeyType, task: asyncio.Task):
+        self.in_flight.pop(key, None)
+        # mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
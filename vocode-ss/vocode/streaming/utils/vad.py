@@ -0,0 +1,137 @@
+"""Cheap local voice activity detection for the audio sent to the transcriber.
+
+`EnergyVAD` classifies each chunk as speech or silence by its level relative to an adaptive
+estimate of the background noise, and keeps track of how long the caller has been speaking or
+silent. This is known as soon as the audio arrives, before the transcriber has responded, so
+endpointing can use it to decide sooner that the caller has finished.
+
+`SilenceGate` uses it to hold back long silences, so less audio is streamed to (and billed by)
+the transcriber. It still forwards a chunk every `keepalive_interval_seconds`, which should stay
+well under the transcriber's idle timeout (5s for the Deepgram sender).
+"""
+
+import math
+from collections import deque
+from typing import Deque, List, Optional
+
+import numpy as np
+
+from vocode.streaming.models.audio import AudioEncoding
+from vocode.streaming.models.transcriber import VADConfig
+from vocode.streaming.utils.dsp import ULAW_DECODE_TABLE, BytesLike, pcm16_view
+from vocode.streaming.utils.metrics import counter
+
+# squares of the decoded μ-law samples, so a chunk's energy is one lookup and a sum
+ULAW_SQUARES = ULAW_DECODE_TABLE.astype(np.float64) ** 2
+
+# how quickly the noise level follows quieter and louder chunks, per chunk
+NOISE_FALL_RATE = 0.5
+NOISE_RISE_RATE = 0.02
+# the noise level also creeps up during speech, so a louder background isn't speech forever
+NOISE_RISE_RATE_DURING_SPEECH = 0.002
+
+chunks_gated = counter("transcriber.vad.chunks_gated")
+bytes_gated = counter("transcriber.vad.bytes_gated")
+
+
+def chunk_energy(chunk: BytesLike, audio_encoding: AudioEncoding) -> float:
+    """Mean square of the chunk's samples, on the 16-bit PCM scale."""
+    if len(chunk) == 0:
+        return 0.0
+    if audio_encoding == AudioEncoding.MULAW:
+        return float(ULAW_SQUARES[np.frombuffer(chunk, dtype=np.uint8)].mean())
+    samples = pcm16_view(chunk).astype(np.float32)
+    return float(np.dot(samples, samples)) / len(samples)
+
+
+class EnergyVAD:
+    def __init__(self, audio_encoding: AudioEncoding, sampling_rate: int, config: VADConfig):
+        self.audio_encoding = audio_encoding
+        sample_width = 1 if audio_encoding == AudioEncoding.MULAW else 2
+        self.byte_rate = sample_width * sampling_rate
+        self.config = config
+        self.noise_level_db: Optional[float] = None
+        self.is_speech = False
+        # raw speech/silence runs, i.e. without the hangover
+        self.speech_seconds = 0.0
+        self.silence_seconds = 0.0
+
+    def process(self, chunk: BytesLike) -> bool:
+        """Classifies the next chunk and returns whether the caller is speaking."""
+        duration = len(chunk) / self.byte_rate
+        level_db = 10 * math.log10(chunk_energy(chunk, self.audio_encoding) + 1.0)
+        if self.noise_level_db is None:
+            # the call may start with speech, which shouldn't be taken for background noise
+            self.noise_level_db = min(level_db, self.config.min_speech_db)
+        chunk_is_speech = (
+            level_db >= self.config.min_speech_db
+            and level_db - self.noise_level_db >= self.config.threshold_db
+        )
+        if level_db < self.noise_level_db:
+            self.noise_level_db += NOISE_FALL_RATE * (level_db - self.noise_level_db)
+        elif chunk_is_speech:
+            self.noise_level_db += NOISE_RISE_RATE_DURING_SPEECH * (level_db - self.noise_level_db)
+        else:
+            self.noise_level_db += NOISE_RISE_RATE * (level_db - self.noise_level_db)
+
+        if chunk_is_speech:
+            if self.silence_seconds:
+                self.speech_seconds = 0.0
+            self.speech_seconds += duration
+            self.silence_seconds = 0.0
+        else:
+            self.silence_seconds += duration
+        self.is_speech = chunk_is_speech or (
+            self.speech_seconds > 0 and self.silence_seconds <= self.config.hangover_seconds
+        )
+        return self.is_speech
+
+    def reset(self):
+        self.noise_level_db = None
+        self.is_speech = False
+        self.speech_seconds = 0.0
+        self.silence_seconds = 0.0
+
+
+class SilenceGate:
+    """Decides which chunks are forwarded to the transcriber, see the module docstring."""
+
+    def __init__(self, vad: EnergyVAD):
+        self.vad = vad
+        self.config = vad.config
+        self.held_back: Deque[bytes] = deque()
+        self.held_back_seconds = 0.0
+        self.seconds_since_forwarded = 0.0
+
+    def filter(self, chunk: bytes) -> List[bytes]:
+        """Runs the VAD on `chunk` and returns the chunks to forward in its place."""
+        is_speech = self.vad.process(chunk)
+        duration = len(chunk) / self.vad.byte_rate
+        if (
+            is_speech
+            or self.vad.silence_seconds <= self.config.forward_silence_seconds
+            or self.seconds_since_forwarded + duration >= self.config.keepalive_interval_seconds
+        ):
+            chunks = []
+            while self.held_back:
+                held_back_chunk = self.held_back.popleft()
+                if is_speech:
+                    chunks.append(held_back_chunk)
+                else:
+                    self._drop(held_back_chunk)
+            chunks.append(chunk)
+            self.held_back_seconds = 0.0
+            self.seconds_since_forwarded = 0.0
+            return chunks
+
+        self.seconds_since_forwarded += duration
+        self.held_back.append(chunk)
+        self.held_back_seconds += duration
+        while self.held_back and self.held_back_seconds > self.config.pre_roll_seconds:
+            self._drop(self.held_back.popleft())
+        return []
+
+    def _drop(self, chunk: bytes):
+        self.held_back_seconds -= len(chunk) / self.vad.byte_rate
+        chunks_gated.inc()
+        bytes_gated.inc(len(chunk))
@@ -1,15 +1,43 @@
+import asyncio
+import json
 import os
-from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
 import aiohttp
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
 from vocode.streaming.models.agent import AZURE_OPENAI_DEFAULT_API_VERSION
+from vocode.streaming.utils.create_task import asyncio_create_task
+from vocode.streaming.utils.llm_clients import get_azure_openai_client, get_openai_client
+from vocode.streaming.utils.lru_cache import LRUCache
 
 if TYPE_CHECKING:
     from langchain.docstore.document import Document
 
 DEFAULT_OPENAI_EMBEDDING_MODEL = "text-embedding-ada-002"
+# texts per embeddings request when adding texts
+EMBEDDING_BATCH_SIZE = 256
+# query embeddings and search results are reused for this long, e.g. for a search that was
+# started on an interim transcription, or a question that many callers ask
+VECTOR_DB_CACHE_TTL_SECONDS = 300
+VECTOR_DB_CACHE_SIZE = 256
+
+# (normalized query, filter, namespace)
+SearchKey = Tuple[str, str, str]
+
+# shared by every conversation, keyed by (model, normalized query)
+query_embeddings: LRUCache[Tuple[str, str], List[float]] = LRUCache(
+    max_size=VECTOR_DB_CACHE_SIZE,
+    ttl_seconds=VECTOR_DB_CACHE_TTL_SECONDS,
+    metrics_prefix="vector_db.query_embedding_cache",
+)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercases the query and drops punctuation and extra whitespace, so transcriptions of the
+    same words share cache entries."""
+    return " ".join(re.sub(r"[^\w\s']", " ", query.lower()).split())
 
 
 class VectorDB:
@@ -31,26 +59,40 @@ class VectorDB:
         if self.engine:
             azure_base = os.getenv("AZURE_OPENAI_API_BASE_EAST_US")
             azure_base = azure_base if azure_base is not None else ""
-            self.openai_client = AsyncAzureOpenAI(
+            self.openai_client = get_azure_openai_client(
                 azure_endpoint=azure_base,
                 api_key=os.getenv("AZURE_OPENAI_API_KEY_EAST_US"),
                 api_version=AZURE_OPENAI_DEFAULT_API_VERSION,
             )
         else:
-            self.openai_client = AsyncOpenAI(
-                api_key=os.getenv("OPENAI_API_KEY"),
-            )
+            self.openai_client = get_openai_client(api_key=os.getenv("OPENAI_API_KEY"))
+
+        self.search_results: LRUCache[SearchKey, List[Tuple["Document", float]]] = LRUCache(
+            max_size=VECTOR_DB_CACHE_SIZE,
+            ttl_seconds=VECTOR_DB_CACHE_TTL_SECONDS,
+            metrics_prefix="vector_db.search_cache",
+        )
+        self.searches: Dict[SearchKey, asyncio.Task] = {}
 
     async def create_openai_embedding(
         self, text, model=DEFAULT_OPENAI_EMBEDDING_MODEL
     ) -> List[float]:
-        params = {
-            "input": text,
-        }
-
-        params["model"] = self.engine if self.engine else model
+        """Embeds a query, reusing the embedding of a recent query with the same words."""
+        key = (self.engine or model, normalize_query(text))
+        embedding = query_embeddings.get(key)
+        if embedding is None:
+            embedding = (await self.create_openai_embeddings([text], model))[0]
+            query_embeddings.set(key, embedding)
+        return embedding
 
-        return (await self.openai_client.embeddings.create(**params)).data[0].embedding
+    async def create_openai_embeddings(
+        self, texts: List[str], model=DEFAULT_OPENAI_EMBEDDING_MODEL
+    ) -> List[List[float]]:
+        """Embeds the texts in one request."""
+        response = await self.openai_client.embeddings.create(
+            input=texts, model=self.engine if self.engine else model
+        )
+        return [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
 
     async def add_texts(
         self,
@@ -69,6 +111,40 @@ class VectorDB:
     ) -> List[Tuple["Document", float]]:
         raise NotImplementedError
 
+    def start_search(
+        self,
+        query: str,
+        filter: Optional[dict] = None,
+        namespace: Optional[str] = None,
+    ) -> "asyncio.Future[List[Tuple[Document, float]]]":
+        """Starts `similarity_search_with_score` in the background, e.g. on an interim
+        transcription, and returns a future for its results. A search for the same words that
+        finished recently or is still running is reused, so await it with `asyncio.shield`.
+        Results are shared between callers, so they shouldn't be modified."""
+        key = (normalize_query(query), json.dumps(filter, sort_keys=True), namespace or "")
+        results = self.search_results.get(key)
+        if results is not None:
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            future.set_result(results)
+            return future
+        search = self.searches.get(key)
+        if search is None:
+            search = asyncio_create_task(
+                self.similarity_search_with_score(query, filter=filter, namespace=namespace)
+            )
+            self.searches[key] = search
+            search.add_done_callback(lambda search: self._finish_search(key, search))
+        return search
+
+    def _finish_search(self, key: SearchKey, search: asyncio.Task):
+        if self.searches.get(key) is search:
+            del self.searches[key]
+        # retrieved here, so a search nobody awaited doesn't log an unretrieved exception
+        if not search.cancelled() and search.exception() is None:
+            self.search_results.set(key, search.result())
+
     async def tear_down(self):
+        for search in list(self.searches.values()):
+            search.cancel()
         if self.should_close_session_on_tear_down:
             await self.aiohttp_session.close()
@@ -6,7 +6,7 @@ from loguru import logger
 
 from vocode import getenv
 from vocode.streaming.models.vector_db import PineconeConfig
-from vocode.streaming.vector_db.base_vector_db import VectorDB
+from vocode.streaming.vector_db.base_vector_db import EMBEDDING_BATCH_SIZE, VectorDB
 
 
 def is_non_empty_string(value: Any) -> TypeGuard[str]:
@@ -50,9 +50,14 @@ class PineconeDB(VectorDB):
             namespace = ""
         # Embed and create the documents
         docs = []
+        texts = list(texts)
         ids = ids or [str(uuid.uuid4()) for _ in texts]
-        for i, text in enumerate(texts):
-            embedding = await self.create_openai_embedding(text)
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            embeddings += await self.create_openai_embeddings(
+                texts[start : start + EMBEDDING_BATCH_SIZE]
+            )
+        for i, (text, embedding) in enumerate(zip(texts, embeddings)):
             metadata = metadatas[i] if metadatas else {}
             metadata[self._text_key] = text
             docs.append({"id": ids[i], "values": embedding, "metadata": metadata})